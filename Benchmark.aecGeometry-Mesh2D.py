@@ -0,0 +1,72 @@
+"""
+aecSpaceBenchmark-aecGeometry-Mesh2D
+
+Compares aecGeometry.getMesh2D, which triangulates by ear clipping, with the
+former path: an unconstrained matplotlib Delaunay triangulation filtered by a
+shapely containment test of every triangle. The former path is reproduced
+below and runs only if matplotlib is installed.
+
+Each result also reports the triangulated area against the boundary area,
+since the Delaunay path loses or gains area when an edge crosses a concave boundary.
+
+Please leave questions and comments at the github repo where you found this.
+"""
+
+from timeit import timeit
+
+from shapely import geometry as shapely
+
+from aecSpace.aecGeometry import aecGeometry
+from aecSpace.aecPoint import aecPoint
+from aecSpace.aecPointArray import aecPointArray
+from aecSpace.aecShaper import aecShaper
+
+def delaunay(points):
+    from matplotlib.tri import Triangulation
+    points = aecPointArray(points)
+    bndPoints = points.xyz
+    boundary = shapely.polygon.orient(shapely.Polygon(bndPoints))
+    indices = []
+    for item in Triangulation(points.x, points.y).triangles:
+        triangle = shapely.Polygon([bndPoints[index] for index in item])
+        if boundary.contains(triangle.representative_point()):
+            indices.append(tuple(int(index) for index in item))
+    return indices
+
+def meshArea(points, indices):
+    coords = aecPointArray(points).xy_array
+    area = 0
+    for index in indices:
+        a, b, c = coords[list(index)]
+        area += abs(((b[0] - a[0]) * (c[1] - a[1])) - ((b[1] - a[1]) * (c[0] - a[0]))) * 0.5
+    return area
+
+geometry = aecGeometry()
+shaper = aecShaper()
+origin = aecPoint()
+shapes = \
+[
+    ('makeH', shaper.makeH(origin, 300, 200)),
+    ('makeU', shaper.makeU(origin, 300, 200)),
+    ('makeCylinder r=12', shaper.makeCylinder(origin, 12)),
+    ('makeCylinder r=100', shaper.makeCylinder(origin, 100)),
+]
+
+try:
+    import matplotlib.tri
+    compare = True
+except ImportError:
+    compare = False
+    print('matplotlib is not installed; timing the ear clipping path only.')
+
+count = 200
+for name, points in shapes:
+    area = shapely.Polygon(points.xy_array).area
+    earTime = timeit(lambda: geometry.getMesh2D(points), number = count) / count
+    earArea = meshArea(points, geometry.getMesh2D(points).indices)
+    print('{} ({} points, area {:.1f})'.format(name, len(points), area))
+    print('  ear clipping: {:9.1f} us  area {:.1f}'.format(earTime * 1e6, earArea))
+    if not compare: continue
+    oldTime = timeit(lambda: delaunay(points), number = count) / count
+    oldArea = meshArea(points, delaunay(points))
+    print('  delaunay:     {:9.1f} us  area {:.1f}  ({:.1f}x)'.format(oldTime * 1e6, oldArea, oldTime / earTime))
@@ -0,0 +1,36 @@
+"""
+aecSpaceBenchmark-aecPoint-ID
+
+Measures the per-point cost of constructing aecPoints with and without
+generating their identifiers. Reading the ID immediately after construction
+reproduces the former behavior, when every aecPoint called uuid4 in its
+constructor. The fast mode reading uses aecID's monotonic counter.
+
+Please leave questions and comments at the github repo where you found this.
+"""
+
+from timeit import timeit
+
+from aecSpace.aecID import aecID
+from aecSpace.aecPoint import aecPoint
+
+def eager():
+    return aecPoint(1, 2, 3).ID
+
+def lazy():
+    return aecPoint(1, 2, 3)
+
+count = 200000
+
+aecID.fast = False
+before = timeit(eager, number = count) / count
+after = timeit(lazy, number = count) / count
+aecID.fast = True
+fast = timeit(eager, number = count) / count
+aecID.fast = False
+
+print('aecPoint construction, {} points'.format(count))
+print('  with UUID at construction (before): {:8.3f} us per point'.format(before * 1e6))
+print('  lazy ID, never read (after):        {:8.3f} us per point'.format(after * 1e6))
+print('  fast ID mode, read immediately:     {:8.3f} us per point'.format(fast * 1e6))
+print('  speedup for transient points:       {:8.1f}x'.format(before / after))
@@ -0,0 +1,48 @@
+"""
+aecSpaceBenchmark-aecSpace-Import
+
+Measures the time to import aecSpace.aecSpace in a fresh interpreter and
+compares it with the startup budget documented in README.md. Also reports
+whether any display or plotting library was loaded by the import, since
+matplotlib, plotly, and pythonOCC are imported only by the functions that use them.
+
+Please leave questions and comments at the github repo where you found this.
+"""
+
+import subprocess
+import sys
+
+from statistics import median
+
+budget = 0.25 # seconds, see "Startup Time" in README.md
+runs = 10
+
+script = \
+"""
+import sys, time
+start = time.perf_counter()
+import aecSpace.aecSpace
+import aecSpace.aecSpaceDrawOCC
+import aecSpace.aecSpaceDrawPlotly
+elapsed = time.perf_counter() - start
+heavy = [name for name in ('matplotlib', 'plotly', 'OCC') if name in sys.modules]
+print(elapsed, ','.join(heavy))
+"""
+
+times = []
+heavy = set()
+for run in range(runs):
+    result = subprocess.run([sys.executable, '-c', script],
+                            stdout = subprocess.PIPE,
+                            universal_newlines = True,
+                            check = True)
+    elapsed, loaded = (result.stdout.split() + [''])[:2]
+    times.append(float(elapsed))
+    heavy.update(name for name in loaded.split(',') if name)
+
+print('import aecSpace.aecSpace and draw modules, {} runs'.format(runs))
+print('  fastest: {:6.1f} ms'.format(min(times) * 1000))
+print('  median:  {:6.1f} ms'.format(median(times) * 1000))
+print('  budget:  {:6.1f} ms'.format(budget * 1000))
+print('  heavy modules loaded: {}'.format(', '.join(sorted(heavy)) or 'none'))
+print('  result:  {}'.format('within budget' if median(times) <= budget and not heavy else 'OVER BUDGET'))
@@ -0,0 +1,72 @@
+"""
+aecSpaceBenchmark-aecSpaceClash
+
+Builds the scenes of Example.ModularHousing.py and Example.aecSpaceRetailDepartment.py
+without drawing them, tiles copies of each scene into a grid until the requested
+number of spaces is reached, and times aecSpaceClash.getClashes on the result.
+The smallest size is also checked against a brute force comparison of every pair
+of spaces with aecSpaceClash.getOverlap, the O(n^2) approach the clash engine replaces.
+
+Please leave questions and comments at the github repo where you found this.
+"""
+
+import random
+import runpy
+
+from time import perf_counter
+
+from aecSpace.aecSpaceClash import aecSpaceClash
+from aecSpace.aecSpacer import aecSpacer
+
+examples = \
+[
+    ('ModularHousing', 'Example.ModularHousing.py', 100000),
+    ('RetailDepartment', 'Example.aecSpaceRetailDepartment.py', 5000),
+]
+sizes = [1000, 10000, 100000]
+bruteSize = 1000
+
+clasher = aecSpaceClash()
+spacer = aecSpacer()
+
+def bruteForce(spaces):
+    clashes = []
+    for index1 in range(len(spaces)):
+        for index2 in range(index1 + 1, len(spaces)):
+            volume = clasher.getOverlap(spaces[index1], spaces[index2])
+            if volume > 0: clashes.append((index1, index2))
+    return clashes
+
+def tile(scene, count, displace):
+    spaces = list(scene)
+    column = 1
+    row = 0
+    while len(spaces) < count:
+        for space in scene:
+            spaces.append(spacer.copy(space, column * displace, row * displace))
+            if len(spaces) == count: break
+        column += 1
+        if column == 10:
+            column = 0
+            row += 1
+    return spaces
+
+for name, path, displace in examples:
+    random.seed(0)
+    scene = runpy.run_path(path, run_name = '__benchmark__')['spaces']
+    print('{}: {} spaces per scene'.format(name, len(scene)))
+    for size in sizes:
+        start = perf_counter()
+        spaces = tile(scene, size, displace)
+        built = perf_counter() - start
+        start = perf_counter()
+        clashes = clasher.getClashes(spaces)
+        elapsed = perf_counter() - start
+        print('  {:7d} spaces: {:7d} clashes in {:7.3f} s (built in {:.1f} s)'.format(size, len(clashes), elapsed, built))
+        if size != bruteSize: continue
+        start = perf_counter()
+        pairs = bruteForce(spaces)
+        brute = perf_counter() - start
+        match = pairs == [(item.index1, item.index2) for item in clashes]
+        print('  {:7d} spaces: brute force in {:7.3f} s ({:.0f}x), results {}'.format(
+              size, brute, brute / elapsed, 'match' if match else 'DIFFER'))
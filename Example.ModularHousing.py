@@ -212,7 +212,8 @@ while y < 4:
     point.y += 20000
     x = 0
     y += 1
-spaceDrawer = aecSpaceDrawOCC()
-spaceDrawer.draw3D(spaces, displaySize = (1600, 900), update = True)
+if __name__ == '__main__':
+    spaceDrawer = aecSpaceDrawOCC()
+    spaceDrawer.draw3D(spaces, displaySize = (1600, 900), update = True)
 # update = True will animate the example by updating the display after every space placement.
 # About 60x slower to completion, but more interesting to watch.
\ No newline at end of file
@@ -6,6 +6,7 @@ from aecSpace.aecPoint import aecPoint
 from aecSpace.aecShaper import aecShaper
 from aecSpace.aecSpace import aecSpace
 from aecSpace.aecSpacer import aecSpacer
+from aecSpace.aecSpaceBatch import aecSpaceBatch
 from aecSpace.aecSpaceGroup import aecSpaceGroup
 from aecSpace.aecSpaceDrawOCC import aecSpaceDrawOCC
 
@@ -166,7 +167,6 @@ def develop():
     sitWest.color = aecColor.sand
     sitEast.color = aecColor.sand
     spaces = [sitWest, sitEast]
-    spcGroup = aecSpaceGroup()
     for building in buildings:
         if randint(0, 1) == 0 : site = sitWest
         else: site = sitEast
@@ -185,50 +185,24 @@ def develop():
         space.color = building['color']
         area = randint(building['area'][0], building['area'][1])    
         if building['name'] == 'parking': build = [space] + spacer.stackToArea(space, area)
-        else: build = [space] + spacer.stackToArea(space, area)
-        spcGroup.clear()
-        spcGroup.add(build)
-        levels = spcGroup.count
-        if building['name'] != 'parking':
-            if levels >= 10:
-                index = 10
-                while index < levels:
-                    spcGroup.scale(0.8, 0.8, 1, index = index)
-                    index += 1
-            if levels >= 20:
-                index = 20
-                while index < levels:
-                    spcGroup.scale(0.8, 0.8, 1, index = index)
-                    index += 1                   
-            if levels >= 30:
-                index = 30
-                while index < levels:
-                    spcGroup.scale(0.8, 0.8, 1, index = index)
-                    index += 1           
-        build = spcGroup.spaces
+        else: build = [space] + spacer.stackToArea(space, area, taper = [(10, 0.8), (20, 0.8), (30, 0.8)])
         spaces += build
     return spaces
 
-x = 0
-y = 0
-spaces = []
-vector = (-2000, 0, 0)
-while y < 4:
-    while x < 4:
-        spcGroup = aecSpaceGroup()
-        spcGroup.add(develop())
-        vector = (vector[0] + 2000, vector[1], 0)        
-        spcGroup.moveBy(vector[0], vector[1], vector[2])
-        spaces += spcGroup.spaces               
-        x += 1
-    vector = (-2000, vector[1] + 2000, 0)    
-    x = 0
-    y += 1     
-spaceDrawer = aecSpaceDrawOCC()
-spaceDrawer.draw3D(spaces, displaySize = (1600, 900), update = True)
-# update = True animates the example by updating the display after every space placement.
-# About 60x slower to completion, but more interesting to watch.
-
-
+def developAt(x, y):
+    spcGroup = aecSpaceGroup()
+    spcGroup.add(develop())
+    spcGroup.moveBy(x, y, 0)
+    return spcGroup
 
+# Each of the 4 x 4 developments runs in its own worker process with its own seed,
+# so changing the seeds produces a different, but repeatable, set of developments.
 
+if __name__ == '__main__':
+    seeds = range(16)
+    vectors = [(x * 2000, y * 2000) for y in range(4) for x in range(4)]
+    spaces = aecSpaceBatch().run(developAt, seeds, vectors).spaces
+    spaceDrawer = aecSpaceDrawOCC()
+    spaceDrawer.draw3D(spaces, displaySize = (1600, 900), update = True)
+# update = True animates the example by updating the display after every space placement.
+# About 60x slower to completion, but more interesting to watch.
@@ -191,6 +191,7 @@ while y < 1:
     displace[0] = -2000
     y += 1
      
-spaceDrawer.draw3D(spaces, displaySize = (1600, 900), update = True)
+if __name__ == '__main__':
+    spaceDrawer.draw3D(spaces, displaySize = (1600, 900), update = True)
 # update = True will animate the example by updating the display after every space placement.
 # About 60x slower to completion, but more interesting to watch.
\ No newline at end of file
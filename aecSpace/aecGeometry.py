@@ -2,12 +2,14 @@ import math
 import numpy
 import traceback
 
-from matplotlib.tri import Triangulation
 from shapely import geometry as shapely
+from shapely import affinity as shapeAffine
 from shapely import ops as shapeOps
+from shapely import convex_hull, get_coordinates, get_parts, get_rings, multipoints, union_all
 from typing import List, NamedTuple, Tuple
 
 from .aecPoint import aecPoint
+from .aecPointArray import aecPointArray
 
 class aecGeometry:
     
@@ -15,6 +17,17 @@ class aecGeometry:
     
     N, NNE, NE, ENE, E, ESE, SE, SSE, S, SSW, SW, WSW, W, WNW, NW, NNW = range(0, 16)
        
+    # Defines a boundary data structure listing cleaned
+    # anticlockwise points and the convexity of the polygon.
+
+    boundary2D = \
+        NamedTuple(
+        'boundary2D',
+        [
+            ('points', aecPointArray),
+            ('convex', bool)
+        ])
+
     # Defines a data structure of eight points with locations indicated 
     # by compass point abbreviations in anticlockwise order for the 
     # (l)ower and (U)pper boundaries.
@@ -68,6 +81,18 @@ class aecGeometry:
             ('normals', List[float])           
         ])    
     
+    # Defines a mesh data structure listing vertices, triangle indices,
+    # and point normals as (N, 3) numpy arrays.
+
+    meshArrays = \
+        NamedTuple(
+        'meshArrays',
+        [
+            ('vertices', numpy.ndarray),
+            ('indices', numpy.ndarray),
+            ('normals', numpy.ndarray)
+        ])
+
     # Defines a redundant mesh data structure listing
     # vertices, triangle indices, and surface normals
     # for each point.
@@ -116,6 +141,132 @@ class aecGeometry:
         """
         pass 
                 
+    def __getPieces(self, polygon: shapely.Polygon) -> numpy.ndarray:
+        """
+        Returns convex pieces covering the delivered shapely polygon as an (n, k, 2)
+        coordinate array: the polygon's own exterior points if it is convex, otherwise
+        the triangles of its ear clipping triangulation merged across their shared
+        diagonals in one pass while both ends of each diagonal stay convex
+        (Hertel-Mehlhorn), leaving at most four times the fewest convex pieces.
+        A polygon with holes is delivered as its constrained Delaunay triangles.
+        Pieces with fewer than k points repeat their last point, which leaves
+        their convex hulls unchanged.
+        """
+        if polygon.geom_type == 'Polygon' and not polygon.interiors and \
+           polygon.area >= polygon.convex_hull.area * (1 - 1e-9):
+            return numpy.asarray(polygon.exterior.coords)[None, :-1, :2]
+        if polygon.geom_type != 'Polygon' or polygon.interiors:
+            pieces = [numpy.asarray(piece.exterior.coords)[:-1, :2] for piece in self.__getTriangles(polygon)]
+        else:
+            coords = numpy.asarray(polygon.exterior.coords)[:-1, :2]
+            coords = coords[(coords != numpy.roll(coords, 1, axis = 0)).any(axis = 1)]
+            pieces = [coords[cycle] for cycle in self.__getMerged(coords)]
+        count = max(len(piece) for piece in pieces)
+        return numpy.stack([numpy.concatenate((piece, numpy.repeat(piece[-1:], count - len(piece), axis = 0)))
+                            for piece in pieces])
+
+    def __getMerged(self, coords: numpy.ndarray) -> List[List[int]]:
+        """
+        Returns the convex pieces of the simple polygon of the delivered (N, 2)
+        coordinate array as anticlockwise lists of point indices, found by ear
+        clipping and then removing each diagonal whose ends remain convex 
+        in the union of the two pieces it separates.
+        """
+        xCoords = coords[:, 0].tolist()
+        yCoords = coords[:, 1].tolist()
+        tolerance = 1e-12 * max(max(xCoords) - min(xCoords), max(yCoords) - min(yCoords)) ** 2
+        pieces = [list(triangle) for triangle in self.getMesh2D([aecPoint(x, y) for x, y in coords]).indices]
+        owners = {}
+        for piece, cycle in enumerate(pieces):
+            for index in range(3): owners[(cycle[index - 1], cycle[index])] = piece
+
+        # bool convex(int, int, int)
+        # Returns True if the middle point turns anticlockwise or runs straight.
+
+        def convex(prv, vtx, nxt):
+            return ((xCoords[vtx] - xCoords[prv]) * (yCoords[nxt] - yCoords[vtx])) - \
+                   ((yCoords[vtx] - yCoords[prv]) * (xCoords[nxt] - xCoords[vtx])) >= -tolerance
+
+        for start, end in list(owners):
+            if (end, start) not in owners: continue
+            piece1 = owners[(start, end)]
+            piece2 = owners[(end, start)]
+            if piece1 == piece2: continue
+            cycle1 = pieces[piece1]
+            cycle2 = pieces[piece2]
+            index1 = cycle1.index(start)
+            index2 = cycle2.index(end)
+            size1 = len(cycle1)
+            size2 = len(cycle2)
+            if not convex(cycle1[index1 - 1], start, cycle2[(index2 + 2) % size2]) or \
+               not convex(cycle2[index2 - 1], end, cycle1[(index1 + 2) % size1]): continue
+            cycle = [cycle1[(index1 + 1 + step) % size1] for step in range(size1)] + \
+                    [cycle2[(index2 + 2 + step) % size2] for step in range(size2 - 2)]
+            del owners[(start, end)]
+            del owners[(end, start)]
+            pieces[piece1] = cycle
+            pieces[piece2] = None
+            for index in range(len(cycle)): owners[(cycle[index - 1], cycle[index])] = piece1
+        return [cycle for cycle in pieces if cycle is not None]
+
+    def __getTriangles(self, region) -> numpy.ndarray:
+        """
+        Returns an array of the triangles of the constrained Delaunay triangulation
+        of the delivered shapely Polygon or MultiPolygon. Imported here because
+        constrained_delaunay_triangles first appears in shapely 2.1, which only
+        aecSpacer.placeWithin and pack require.
+        """
+        try:
+            from shapely import constrained_delaunay_triangles
+        except ImportError:
+            raise ImportError('aecGeometry.getInnerFit, getNoFit, and getRandomPoints require shapely 2.1 or later')
+        return get_parts(constrained_delaunay_triangles(region))
+
+    def __getSwept(self, geometry, pieces: numpy.ndarray):
+        """
+        Returns the area swept by the delivered (n, k, 2) array of convex pieces along
+        every edge of the rings of the delivered shapely geometry as a shapely geometry.
+        Each sweep of a piece along an edge is the convex hull of their summed points.
+        """
+        edges = []
+        for ring in get_rings(get_parts(geometry)):
+            coords = numpy.asarray(ring.coords)[:, :2]
+            edges.append(numpy.stack((coords[:-1], coords[1:]), axis = 1))
+        if not edges: return shapely.Polygon()
+        edges = numpy.concatenate(edges)
+        sums = edges[:, None, :, None, :] + pieces[None, :, None, :, :]
+        return union_all(convex_hull(multipoints(sums.reshape(-1, 2 * pieces.shape[1], 2))))
+
+    def __getTurns(self, coords: numpy.ndarray, tolerance: float) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the cross products of the incoming and outgoing edges at every
+        vertex of a closed (N, 2) coordinate array in one pass, with the limit
+        below which each cross product counts as zero: the tolerance as the sine
+        of the turning angle, scaled by the product of the two edge lengths.
+        """
+        inEdges = coords - numpy.roll(coords, 1, axis = 0)
+        outEdges = numpy.roll(inEdges, -1, axis = 0)
+        cross = (inEdges[:, 0] * outEdges[:, 1]) - (inEdges[:, 1] * outEdges[:, 0])
+        lengths = numpy.hypot(inEdges[:, 0], inEdges[:, 1])
+        return cross, lengths * numpy.roll(lengths, -1) * tolerance
+
+    def __rmvColinear(self, coords: numpy.ndarray, tolerance: float) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Returns a closed (N, 2) coordinate array with repeated and colinear
+        points removed, and the cross products at the remaining vertices.
+        Removal repeats until no vertex is found straight, since dropping
+        the tip of a spike can leave its neighbours coincident.
+        """
+        while True:
+            repeated = numpy.all(coords == numpy.roll(coords, 1, axis = 0), axis = 1)
+            if repeated.all(): coords = coords[:1]
+            elif repeated.any(): coords = coords[~repeated]
+            if len(coords) < 3: return coords, numpy.zeros(len(coords))
+            cross, limit = self.__getTurns(coords, tolerance)
+            straight = numpy.abs(cross) <= limit
+            if not straight.any(): return coords, cross
+            coords = coords[~straight]
+
     def areColinear(self, points: List[aecPoint]) -> bool:
         """
         Returns True if all delivered points are colinear.
@@ -124,13 +275,41 @@ class aecGeometry:
         """
         try:
             if len(points) < 3: return True
-            points = [pnt.xy for pnt in points]
+            points = aecPointArray(points).xy_array
             if shapely.Polygon(points).area > 0: return False
             return True    
         except Exception:
             traceback.print_exc()
             return None
     
+    def cleanBoundary(self, points: List[aecPoint], tolerance: float = 1e-9) -> boundary2D:
+        """
+        Returns the delivered boundary points with repeated and colinear
+        points removed and ordered anticlockwise, together with the convexity
+        of the resulting polygon, computing all vertex cross products at once.
+        Points are colinear if the sine of their turning angle is within the tolerance.
+        Returns None on failure.
+        """
+        try:
+            points = aecPointArray(points)
+            level = points.z[0] if len(points) else 0
+            coords, cross = self.__rmvColinear(points.xy_array, tolerance)
+            convex = False
+            if len(coords) >= 3:
+                xCoords = coords[:, 0]
+                yCoords = coords[:, 1]
+                area = numpy.sum((xCoords * numpy.roll(yCoords, -1)) - (numpy.roll(xCoords, -1) * yCoords))
+                if area < 0: 
+                    coords = numpy.roll(coords[::-1], 1, axis = 0)
+                    cross = -cross
+                convex = bool(numpy.all(cross > 0))
+            points = aecPointArray(coords)
+            points.z = level
+            return self.boundary2D(points = points, convex = convex)
+        except Exception:
+            traceback.print_exc()
+            return None
+
     def getAngles(self, vtxPoint: aecPoint, prvPoint: aecPoint, nxtPoint: aecPoint) -> vertexAngle:
         """
         Returns whether the delivered point is at a convex or concave angle between
@@ -153,19 +332,19 @@ class aecGeometry:
             traceback.print_exc()
             return None
 
-    def getBoxPoints(self, origin: aecPoint, xDelta: float, yDelta: float) -> List[aecPoint]:
+    def getBoxPoints(self, origin: aecPoint, xDelta: float, yDelta: float) -> aecPointArray:
         """
         Returns the 2D coordinates of a rectangle derived from diagonally opposite corners.
         Returns None on failure.
         """
         try:
-            return \
+            return aecPointArray(
             [
-                aecPoint(origin.x, origin.y),
-                aecPoint(origin.x + xDelta, origin.y),
-                aecPoint(origin.x + xDelta, origin.y + yDelta),
-                aecPoint(origin.x, origin.y + yDelta)
-            ]
+                (origin.x, origin.y),
+                (origin.x + xDelta, origin.y),
+                (origin.x + xDelta, origin.y + yDelta),
+                (origin.x, origin.y + yDelta)
+            ])
         except Exception:
             traceback.print_exc() 
             return None
@@ -221,7 +400,7 @@ class aecGeometry:
             traceback.print_exc()
             return None        
 
-    def getConvexHull(self, points: List[aecPoint]) -> List[aecPoint]:
+    def getConvexHull(self, points: List[aecPoint]) -> aecPointArray:
         """
         Computes the convex hull of a set of 2D points returning the list
         of outermost points in anticlockwise order, starting from the
@@ -230,9 +409,9 @@ class aecGeometry:
         """
         try:
             if len(points) <= 3: return None
-            points = [(float("{:.8f}".format(pnt.x)),             
-                       float("{:.8f}".format(pnt.y)))
-                       for pnt in points]
+            points = [(float("{:.8f}".format(pnt[0])),
+                       float("{:.8f}".format(pnt[1])))
+                       for pnt in aecPointArray(points).xy]
             points = sorted(set(points))            
             
             # float cross(float, float, float)
@@ -261,7 +440,7 @@ class aecGeometry:
             # beginning of the other list.
 
             hull_points = lower[:-1] + upper[:-1]
-            return [aecPoint(pnt[0], pnt[1]) for pnt in hull_points]
+            return aecPointArray(hull_points)
         except Exception:
             traceback.print_exc()
             return None
@@ -287,21 +466,41 @@ class aecGeometry:
 #            traceback.print_exc() 
 #            return None        
 
-    def getIntersect(self, boundary: List[aecPoint], shape: List[aecPoint]) -> List[aecPoint]:
+    def getInnerFit(self, border: shapely.Polygon, shape: shapely.Polygon):
+        """
+        Returns the inner no-fit polygon of the delivered shapely shape within the
+        delivered shapely border: the region of translations by which the shape lies
+        within the border, as a shapely Polygon or MultiPolygon, empty if the shape
+        cannot fit. The border reduced by the shape is found as the border translated
+        by one point of the reflected shape, less the area swept by the reflected
+        shape along every edge of the border. Positions along a line or at a point,
+        as a shape matching the border's width or shape exactly leaves, have no area
+        and are omitted, so the result is empty if the shape fits only there.
+        Returns None on failure.
+        """
+        try:
+            pieces = -self.__getPieces(shape)
+            swept = self.__getSwept(border, pieces)
+            return shapeAffine.translate(border, *pieces[0, 0]).difference(swept)
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    def getIntersect(self, boundary: List[aecPoint], shape: List[aecPoint]) -> aecPointArray:
         """
         Returns the points of a perimeter representing the 
         geometric intersection of the boundary and the shape.
         Returns None if unable to determine a single intersection perimeter.
         """
         try:
-            bnd_pnts = [pnt.xy for pnt in boundary]
-            shp_pnts = [pnt.xy for pnt in shape]
+            bnd_pnts = aecPointArray(boundary).xy_array
+            shp_pnts = aecPointArray(shape).xy_array
             bnd = shapely.polygon.orient(shapely.Polygon(bnd_pnts))
             shp = shapely.polygon.orient(shapely.Polygon(shp_pnts))
             intersect = bnd.intersection(shp)
-            if intersect.type == 'MultiPolygon': intersect = shapeOps.unary_union(intersect)
+            if intersect.geom_type == 'MultiPolygon': intersect = shapeOps.unary_union(intersect)
             if type(intersect) != shapely.polygon.Polygon: return None
-            return [aecPoint(pnt[0], pnt[1]) for pnt in intersect.exterior.coords[:-1]]
+            return aecPointArray(numpy.asarray(intersect.exterior.coords)[:-1])
         except Exception:
             traceback.print_exc() 
             return None        
@@ -310,31 +509,225 @@ class aecGeometry:
         """
         Constructs a compact 2D mesh representation of a horizontal 
         surface as a list of unique points and triangle indices.
+        Triangulates the simple polygon described by the points by ear clipping,
+        so every triangle lies within the boundary and indices refer to the
+        delivered point order. Triangles are anticlockwise.
         Returns None on failure.
         """
         try:
-            bndPoints= [point.xyz for point in points]
-            boundary = shapely.polygon.orient(shapely.Polygon(bndPoints))
-            xPoints = [point.x for point in points]
-            yPoints = [point.y for point in points]
-            meshD = Triangulation(xPoints, yPoints)
-            triangles = meshD.triangles
+            points = aecPointArray(points)
+            xCoords = points.x.tolist()
+            yCoords = points.y.tolist()
+            remain = list(range(len(points)))
+            signed = sum((xCoords[idx - 1] * yCoords[idx]) - (xCoords[idx] * yCoords[idx - 1]) 
+                         for idx in remain)
+            if signed < 0: remain.reverse()
+
+            # float turn(int, int, int)
+            # Returns the 2D cross product of the edges entering and leaving
+            # the middle vertex: positive for a convex (anticlockwise) turn.
+
+            def turn(prv, vtx, nxt):
+                return ((xCoords[vtx] - xCoords[prv]) * (yCoords[nxt] - yCoords[vtx])) - \
+                       ((yCoords[vtx] - yCoords[prv]) * (xCoords[nxt] - xCoords[vtx]))
+
+            # Only reflex or straight vertices can fall within a candidate ear.
+
+            count = len(remain)
+            tolerance = 1e-12 * max(max(xCoords) - min(xCoords), max(yCoords) - min(yCoords)) ** 2
+            reflex = set(remain[idx] for idx in range(count) 
+                         if turn(remain[idx - 1], remain[idx], remain[(idx + 1) % count]) <= 0)
             indices = []
-            for item in triangles:
-                triPoints = \
-                [
-                    points[item[0]].xyz, 
-                    points[item[1]].xyz, 
-                    points[item[2]].xyz,
-                ]
-                triangle = shapely.polygon.orient(shapely.Polygon(triPoints))
-                tstPoint = triangle.representative_point()
-                if boundary.contains(tstPoint): 
-                    indices.append(tuple([int(element) for element in list(item)]))
-            mesh = self.mesh2D
-            mesh.vertices = [pnt.xyz for pnt in points]
-            mesh.indices = indices
-            return mesh
+            index = 0
+            attempts = 0
+            while len(remain) > 3:
+                count = len(remain)
+                prv = remain[index - 1]
+                vtx = remain[index]
+                nxt = remain[(index + 1) % count]
+                isEar = vtx not in reflex
+                if isEar:
+                    ax, ay = xCoords[prv], yCoords[prv]
+                    bx, by = xCoords[vtx], yCoords[vtx]
+                    cx, cy = xCoords[nxt], yCoords[nxt]
+                    for other in reflex:
+                        if other == prv or other == nxt: continue
+                        px, py = xCoords[other], yCoords[other]
+                        if (px, py) in ((ax, ay), (bx, by), (cx, cy)): continue
+                        if ((bx - ax) * (py - ay)) - ((by - ay) * (px - ax)) >= -tolerance and \
+                           ((cx - bx) * (py - by)) - ((cy - by) * (px - bx)) >= -tolerance and \
+                           ((ax - cx) * (py - cy)) - ((ay - cy) * (px - cx)) >= -tolerance:
+                            isEar = False
+                            break
+                if not isEar and attempts > count:
+                    # No ear was found in a full pass, as when straight vertices
+                    # lie on every candidate diagonal. Clips a straight vertex,
+                    # which adds no area, or else the most convex vertex.
+
+                    turns = [turn(remain[idx - 1], remain[idx], remain[(idx + 1) % count]) 
+                             for idx in range(count)]
+                    straight = [idx for idx in range(count) if abs(turns[idx]) <= tolerance]
+                    index = straight[0] if straight else max(range(count), key = lambda idx: turns[idx])
+                    prv = remain[index - 1]
+                    vtx = remain[index]
+                    nxt = remain[(index + 1) % count]
+                    isEar = True
+                if isEar:
+                    indices.append((prv, vtx, nxt))
+                    del remain[index]
+                    reflex.discard(vtx)
+                    count -= 1
+                    index = (index - 1) % count
+                    for idx in (index, (index + 1) % count):
+                        if turn(remain[idx - 1], remain[idx], remain[(idx + 1) % count]) > 0:
+                            reflex.discard(remain[idx])
+                    attempts = 0
+                    continue
+                index = (index + 1) % count
+                attempts += 1
+            if len(remain) == 3: indices.append(tuple(remain))
+            return self.mesh2D(vertices = points.xyz, indices = indices)
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    def getMatrixMirror(self, point1: aecPoint, point2: aecPoint) -> numpy.ndarray:
+        """
+        Returns a 3x3 affine matrix reflecting 2D points 
+        around the line through the delivered points.
+        Returns None on failure.
+        """
+        try:
+            xDir = point2.x - point1.x
+            yDir = point2.y - point1.y
+            length = math.hypot(xDir, yDir)
+            if length == 0: raise ValueError('Mirror axis points are coincident')
+            xDir /= length
+            yDir /= length
+            xx = (2 * xDir * xDir) - 1
+            xy = 2 * xDir * yDir
+            yy = (2 * yDir * yDir) - 1
+            return numpy.array([[xx, xy, point1.x - (xx * point1.x) - (xy * point1.y)], 
+                                [xy, yy, point1.y - (xy * point1.x) - (yy * point1.y)], 
+                                [0.0, 0.0, 1.0]])
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    def getMatrixMove(self, x: float = 0, y: float = 0) -> numpy.ndarray:
+        """
+        Returns a 3x3 affine matrix translating 2D points by the delivered displacements.
+        Returns None on failure.
+        """
+        try:
+            return numpy.array([[1.0, 0.0, float(x)], 
+                                [0.0, 1.0, float(y)], 
+                                [0.0, 0.0, 1.0]])
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    def getMatrixRotate(self, angle: float = 0, point: aecPoint = None) -> numpy.ndarray:
+        """
+        Returns a 3x3 affine matrix rotating 2D points anticlockwise 
+        by the delivered angle in degrees around the delivered point,
+        or around the origin if no point is delivered.
+        Returns None on failure.
+        """
+        try:
+            radians = math.radians(float(angle))
+            cos = math.cos(radians)
+            sin = math.sin(radians)
+            x, y = (point.x, point.y) if point else (0.0, 0.0)
+            return numpy.array([[cos, -sin, x - (cos * x) + (sin * y)], 
+                                [sin, cos, y - (sin * x) - (cos * y)], 
+                                [0.0, 0.0, 1.0]])
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    def getMatrixScale(self, x: float = 1, y: float = 1, point: aecPoint = None) -> numpy.ndarray:
+        """
+        Returns a 3x3 affine matrix scaling 2D points by the delivered
+        factors from the delivered point, or from the origin if no point is delivered.
+        Returns None on failure.
+        """
+        try:
+            x = float(x)
+            y = float(y)
+            xPnt, yPnt = (point.x, point.y) if point else (0.0, 0.0)
+            return numpy.array([[x, 0.0, xPnt - (x * xPnt)], 
+                                [0.0, y, yPnt - (y * yPnt)], 
+                                [0.0, 0.0, 1.0]])
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    def getMeshBatch(self, meshes: List[meshArrays]) -> meshArrays:
+        """
+        Combines a list of array meshes into a single mesh with
+        one vertex, index, and normal buffer, offsetting each
+        mesh's indices by the vertices preceding it.
+        Returns None on failure.
+        """
+        try:
+            if not meshes:
+                return self.meshArrays(vertices = numpy.zeros((0, 3), dtype = numpy.float32),
+                                       indices = numpy.zeros((0, 3), dtype = numpy.uint32),
+                                       normals = numpy.zeros((0, 3), dtype = numpy.float32))
+            vtxCounts = numpy.array([mesh.vertices.shape[0] for mesh in meshes])
+            idxCounts = numpy.array([mesh.indices.shape[0] for mesh in meshes])
+            offsets = numpy.concatenate(([0], numpy.cumsum(vtxCounts)[:-1]))
+            indices = numpy.concatenate([mesh.indices for mesh in meshes]).astype(numpy.uint32)
+            indices += numpy.repeat(offsets, idxCounts).astype(numpy.uint32)[:, None]
+            return self.meshArrays(vertices = numpy.concatenate([mesh.vertices for mesh in meshes]),
+                                   indices = indices,
+                                   normals = numpy.concatenate([mesh.normals for mesh in meshes]))
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    def getMeshPrism(self, points: List[aecPoint], 
+                           indices: List[Tuple[int, int, int]], 
+                           level: float = 0.0, 
+                           height: float = 1.0,
+                           dtype: type = numpy.float32) -> meshArrays:
+        """
+        Constructs a mesh of a vertical prism in one pass from the anticlockwise
+        points of its horizontal boundary and the triangle indices of that boundary.
+        Vertices are ordered as ceiling, floor, then four corners for each side.
+        Triangles wind anticlockwise seen from outside the prism, and every
+        normal points outward, matching the winding of its triangles.
+        Vertices and normals are returned as the delivered dtype, indices as uint32.
+        Returns None on failure.
+        """
+        try:
+            coords = aecPointArray(points).xy_array
+            count = coords.shape[0]
+            nxtCoords = numpy.roll(coords, -1, axis = 0)
+            lower = numpy.full((count, 1), float(level))
+            upper = numpy.full((count, 1), float(level) + float(height))
+            floor = numpy.hstack((coords, lower))
+            ceiling = numpy.hstack((coords, upper))
+            sides = numpy.stack((floor, 
+                                 numpy.hstack((nxtCoords, lower)), 
+                                 numpy.hstack((nxtCoords, upper)), 
+                                 ceiling), axis = 1).reshape(-1, 3)
+            capIndices = numpy.asarray(indices, dtype = numpy.int64).reshape(-1, 3)
+            sideBase = (count * 2) + (numpy.arange(count) * 4)
+            sideIndices = (sideBase[:, None, None] + numpy.array([[0, 1, 2], [2, 3, 0]])).reshape(-1, 3)
+            edges = nxtCoords - coords
+            lengths = numpy.hypot(edges[:, 0], edges[:, 1])[:, None]
+            sideNormals = numpy.column_stack((edges[:, 1], -edges[:, 0], numpy.zeros(count)))
+            sideNormals = numpy.divide(sideNormals, lengths, out = numpy.zeros_like(sideNormals), where = lengths > 0)
+            return self.meshArrays(
+                vertices = numpy.concatenate((ceiling, floor, sides)).astype(dtype),
+                indices = numpy.concatenate((capIndices, 
+                                             capIndices[:, ::-1] + count, 
+                                             sideIndices)).astype(numpy.uint32),
+                normals = numpy.concatenate((numpy.tile((0.0, 0.0, 1.0), (count, 1)),
+                                             numpy.tile((0.0, 0.0, -1.0), (count, 1)),
+                                             numpy.repeat(sideNormals, 4, axis = 0))).astype(dtype))
         except Exception:
             traceback.print_exc()
             return None
@@ -367,89 +760,114 @@ class aecGeometry:
             traceback.print_exc()
             return None
 
-    def isConvex(self, points: List[aecPoint]) -> bool:
+    def getNoFit(self, obstacles, shape: shapely.Polygon):
+        """
+        Returns the outer no-fit polygon of the delivered shapely shape around the
+        delivered shapely Polygon or MultiPolygon of obstacles: the region of translations
+        by which the shape overlaps an obstacle, as a shapely Polygon or MultiPolygon.
+        Translating the shape by a point on the boundary of the region leaves it touching
+        an obstacle. The region is found as the obstacles translated by one point of the
+        reflected shape, with the area swept by the reflected shape along every edge of
+        the obstacles, so its cost follows the edges of the obstacles, not their count.
+        Returns None on failure.
+        """
+        try:
+            if obstacles.is_empty: return shapely.Polygon()
+            pieces = -self.__getPieces(shape)
+            swept = self.__getSwept(obstacles, pieces)
+            return shapeAffine.translate(obstacles, *pieces[0, 0]).union(swept)
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    def getRandomPoints(self, region: shapely.Polygon, count: int = 1, 
+                              generator: numpy.random.Generator = None) -> numpy.ndarray:
+        """
+        Returns an (N, 2) array of the delivered count of points drawn uniformly
+        from the area of the delivered shapely Polygon or MultiPolygon by choosing
+        triangles of its constrained Delaunay triangulation weighted by area and
+        a uniform point within each. The generator may be a numpy random Generator,
+        an integer seed, or None for fresh entropy.
+        Returns an empty array if the region has no area.
+        Returns None on failure.
+        """
+        try:
+            generator = numpy.random.default_rng(generator)
+            triangles = self.__getTriangles(region)
+            if len(triangles) == 0: return numpy.zeros((0, 2))
+            corners = get_coordinates(triangles).reshape(len(triangles), 4, 2)[:, :3]
+            sides1 = corners[:, 1] - corners[:, 0]
+            sides2 = corners[:, 2] - corners[:, 0]
+            areas = numpy.abs((sides1[:, 0] * sides2[:, 1]) - (sides1[:, 1] * sides2[:, 0]))
+            if areas.sum() <= 0: return numpy.zeros((0, 2))
+            chosen = generator.choice(len(triangles), size = count, p = areas / areas.sum())
+            weights = generator.random((count, 2))
+            folded = weights.sum(axis = 1) > 1
+            weights[folded] = 1 - weights[folded]
+            return corners[chosen, 0] + \
+                   (weights[:, :1] * sides1[chosen]) + \
+                   (weights[:, 1:] * sides2[chosen])
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    def isConvex(self, points: List[aecPoint], tolerance: float = 1e-9) -> bool:
         """
         Determines from a set of anticlockwise points 
-        whether the implied polygon is convex.
+        whether the implied polygon is convex, computing 
+        all vertex cross products at once. Colinear points 
+        within the tolerance do not make a polygon concave.
         Returns None on failure.
         """
         try:
-            index = 0
-            length = len(points)
-            while index < length:
-                angles = self.getAngles(points[index], 
-                                        points[(index - 1) % length], 
-                                        points[(index + 1) % length])
-                if not angles.convex: return False
-                index += 1
-            return True
+            coords = aecPointArray(points).xy_array
+            cross, limit = self.__getTurns(coords, tolerance)
+            return bool(numpy.all(cross >= -limit))
         except Exception:
             traceback.print_exc()
             return None          
-        
-    
-    def mirrorPoints2D (self, points: List[aecPoint], mPoint1: aecPoint, mPoint2: aecPoint) -> List[aecPoint]:
+
+    def mirrorPoints2D (self, points: List[aecPoint], mPoint1: aecPoint, mPoint2: aecPoint) -> aecPointArray:
         """
         Accepts a set of points and a mirror axis defined by two 2D points
         and returns a set of points reflected around the mirror axis.
         Returns None on failure.
         """
         try:
-            newPoints = []
-            if mPoint1.x == mPoint2.x: # vertical mirror
-                for point in points:
-                    distance = abs(point.x - mPoint1.x) * 2
-                    if point.x < mPoint1.x: point.x += distance
-                    else: point.x -= distance
-                    newPoints.append(point)
-                return newPoints
-            if mPoint1.y == mPoint2.y: # horizontal mirror
-                for point in points:
-                    distance = abs(point.y - mPoint1.y) * 2                          
-                    if point.y < mPoint1.y: point.y += distance
-                    else: point.y -= distance
-                    newPoints.append(point)
-                return newPoints  
-            mSlope = (mPoint2.y - mPoint1.y) / (mPoint2.x - mPoint1.x)
-            rSlope = (-1 / mSlope)
-            dSlope = (mSlope - rSlope)
-            mYint = ((mSlope * mPoint1.x) - mPoint1.x) * -1
-            for point in points:                
-                rYint = ((rSlope * point.x) - point.y) * -1
-                xCoord = (rYint - mYint) / dSlope
-                yCoord = ((mSlope * rYint) - (rSlope * mYint)) / dSlope
-                xDist = abs(point.x - xCoord)
-                yDist = abs(point.y - yCoord)
-                rLength = math.sqrt(xDist + yDist) * 2
-                nPoint = point.xy_array
-                mPoint = numpy.array([xCoord, yCoord])
-                newPoint = (rLength * (mPoint - nPoint)) + nPoint
-                point.x = newPoint[0]
-                point.y = newPoint[1]
-                newPoints.append(point)
-            return newPoints
+            matrix = self.getMatrixMirror(mPoint1, mPoint2)
+            if matrix is None: return None
+            return self.transformPoints(points, matrix)
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    def rmvColinear(self, points: List[aecPoint], tolerance: float = 1e-9) -> aecPointArray:
+        """
+        Returns the delivered points with repeated and redundant colinear points removed.
+        Points are colinear if the sine of their turning angle is within the tolerance.
+        Returns None on failure.
+        """
+        try:
+            points = aecPointArray(points)
+            level = points.z[0] if len(points) else 0
+            points = aecPointArray(self.__rmvColinear(points.xy_array, tolerance)[0])
+            points.z = level
+            return points
         except Exception:
             traceback.print_exc()
             return None
 
-    def rmvColinear(self, points: List[aecPoint]) -> List[aecPoint]:
+    def transformPoints(self, points: List[aecPoint], matrix: numpy.ndarray) -> aecPointArray:
         """
-        Returns the delivered list of points with redundundant colinear points removed.
+        Returns the delivered points with x and y coordinates 
+        transformed by a 3x3 affine matrix, retaining z coordinates.
         Returns None on failure.
         """
         try:
-            level = points[0].z
-            points = [point.xy for point in points]
-            points = (sorted(set(points), key = points.index))
-            points += points
-            for x in range(0, 3):
-                coPoints = points[x:x + 3]
-                while len(coPoints) == 3:
-                    if shapely.Polygon(coPoints).area == 0: points.remove(coPoints[1])
-                    coPoints = points[x:x + 3]
-                    x += 1
-            points = (sorted(set(points), key = points.index))
-            return [aecPoint(pnt[0], pnt[1], level) for pnt in points]
+            points = aecPointArray(points)
+            coords = points.xy_array
+            coords[:] = (coords @ matrix[:2, :2].T) + matrix[:2, 2]
+            return points
         except Exception:
             traceback.print_exc()
             return None
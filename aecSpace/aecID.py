@@ -0,0 +1,37 @@
+import traceback
+
+from itertools import count
+from uuid import uuid4
+
+class aecID:
+    """
+    Generates identifiers for aecPoints, aecSpaces, and aecSpaceGroups.
+    By default each identifier is a UUID4 string.
+    Setting aecID.fast to True draws identifiers from a monotonic
+    counter instead, which avoids os.urandom and UUID formatting
+    but is unique only within the current process.
+    """
+
+    fast = False
+
+    __counter = count(1)
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        pass
+
+    def make(self) -> str:
+        """
+        Returns a new identifier string.
+        Returns None on failure.
+        """
+        try:
+            if aecID.fast: return 'aec-' + str(next(aecID.__counter))
+            return str(uuid4())
+        except Exception:
+            traceback.print_exc()
+            return None
+
+# end class
@@ -1,12 +1,15 @@
 import numpy
 import traceback
 from typing import List, Tuple
-from uuid import uuid4
+
+from .aecID import aecID
 
 class aecPoint():
     """
     Represents 2D or 3D Cartesian coordinates as three float values.
     """
+
+    __aecID = aecID()
     
     __slots__ = ['__ID', '__x', '__y', '__z']
       
@@ -14,7 +17,7 @@ class aecPoint():
         """
         Constructor defaults to origin point coordinates.
         """
-        self.__ID = str(uuid4())
+        self.__ID = None
         self.__x = float(x)
         self.__y = float(y)
         self.__z = float(z)
@@ -23,9 +26,10 @@ class aecPoint():
     def ID(self) -> str:
         """
         Property
-        Returns the UUID.
+        Returns the UUID, generating it on first access.
         """            
         try:
+            if not self.__ID: self.__ID = self.__aecID.make()
             return self.__ID
         except Exception:
             traceback.print_exc()
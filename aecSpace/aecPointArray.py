@@ -0,0 +1,191 @@
+import numpy
+import traceback
+
+from typing import List, Tuple
+
+from .aecPoint import aecPoint
+
+class aecPointArray():
+    """
+    Represents an ordered series of 3D Cartesian coordinates stored
+    in a single contiguous (N, 3) float64 numpy buffer.
+    Accepts the same indexing and iteration as a list of aecPoints,
+    but aecPoints are created only when an item is indexed.
+    """
+
+    __slots__ = ['__coords']
+
+    def __init__(self, points = None):
+        """
+        Constructor accepts an aecPointArray, a list of aecPoints,
+        a sequence of 2D or 3D coordinate tuples, or a numpy array.
+        The delivered coordinates are copied into a new buffer.
+        Defaults to an empty series.
+        """
+        self.__coords = self.__makeCoords(points)
+
+    def __makeCoords(self, points) -> numpy.ndarray:
+        """
+        Returns a new (N, 3) float64 array from the delivered points.
+        Missing z coordinates are set to zero.
+        """
+        if points is None: return numpy.zeros((0, 3))
+        if isinstance(points, aecPointArray): return points.xyz_array.copy()
+        if not isinstance(points, numpy.ndarray):
+            points = [pnt.xyz if isinstance(pnt, aecPoint) else pnt for pnt in points]
+        coords = numpy.array(points, dtype = numpy.float64, ndmin = 2)
+        if coords.size == 0: return numpy.zeros((0, 3))
+        if coords.ndim != 2 or coords.shape[1] not in (2, 3):
+            raise ValueError('Coordinates must be a sequence of 2D or 3D points')
+        if coords.shape[1] == 2:
+            coords = numpy.hstack((coords, numpy.zeros((coords.shape[0], 1))))
+        return numpy.ascontiguousarray(coords)
+
+    def __getitem__(self, index):
+        """
+        Returns a new aecPoint for an integer index,
+        or a new aecPointArray for a slice.
+        """
+        if isinstance(index, slice): return aecPointArray(self.__coords[index])
+        coord = self.__coords[index]
+        return aecPoint(coord[0], coord[1], coord[2])
+
+    def __iter__(self):
+        """
+        Yields a new aecPoint for each coordinate in sequence.
+        """
+        for coord in self.__coords.tolist(): yield aecPoint(coord[0], coord[1], coord[2])
+
+    def __len__(self) -> int:
+        """
+        Returns the number of points.
+        """
+        return self.__coords.shape[0]
+
+    def __setitem__(self, index: int, point: aecPoint):
+        """
+        Sets the coordinates at the delivered index from an aecPoint or coordinate tuple.
+        """
+        if isinstance(point, aecPoint): point = point.xyz
+        self.__coords[index, :len(point)] = point
+
+    @property
+    def x(self) -> numpy.ndarray:
+        """
+        Property
+        Returns the x coordinates as a numpy array view.
+        """
+        try:
+            return self.__coords[:, 0]
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    @property
+    def y(self) -> numpy.ndarray:
+        """
+        Property
+        Returns the y coordinates as a numpy array view.
+        """
+        try:
+            return self.__coords[:, 1]
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    @property
+    def z(self) -> numpy.ndarray:
+        """
+        Property
+        Returns the z coordinates as a numpy array view.
+        """
+        try:
+            return self.__coords[:, 2]
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    @z.setter
+    def z(self, z: float = 0):
+        """
+        Property
+        Sets every z coordinate to the delivered value.
+        """
+        try:
+            self.__coords[:, 2] = float(z)
+        except Exception:
+            traceback.print_exc()
+
+    @property
+    def xy(self) -> List[Tuple[float, float]]:
+        """
+        Property
+        Returns x and y coordinates as a list of (x, y) tuples.
+        """
+        try:
+            return [tuple(coord) for coord in self.__coords[:, :2].tolist()]
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    @property
+    def xy_array(self) -> numpy.ndarray:
+        """
+        Property
+        Returns x and y coordinates as an (N, 2) numpy array view.
+        """
+        try:
+            return self.__coords[:, :2]
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    @property
+    def xyz(self) -> List[Tuple[float, float, float]]:
+        """
+        Property
+        Returns the coordinates as a list of (x, y, z) tuples.
+        """
+        try:
+            return [tuple(coord) for coord in self.__coords.tolist()]
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    @property
+    def xyz_array(self) -> numpy.ndarray:
+        """
+        Property
+        Returns the underlying (N, 3) numpy buffer.
+        """
+        try:
+            return self.__coords
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    def copy(self) -> 'aecPointArray':
+        """
+        Returns a new aecPointArray with a copy of the coordinates.
+        Returns None on failure.
+        """
+        try:
+            return aecPointArray(self)
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    def moveBy(self, x: float = 0, y: float = 0, z: float = 0) -> bool:
+        """
+        Changes each coordinate by the corresponding delivered value.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            self.__coords += (float(x), float(y), float(z))
+            return True
+        except Exception:
+            traceback.print_exc()
+            return False
+
+# end class
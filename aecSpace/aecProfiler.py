@@ -0,0 +1,248 @@
+import functools
+import shapely
+import sys
+import time
+import traceback
+
+from collections import defaultdict
+from shapely.geometry.base import BaseGeometry
+from shapely.strtree import STRtree
+from typing import Dict, NamedTuple
+
+"""
+aecProfiler counts and times calls to the hot paths of
+the library while it is active as a context manager.
+"""
+
+class aecProfiler:
+    """
+    Instruments the library only while active:
+
+        with aecProfiler() as profiler:
+            spacer.placeWithin(shape, border)
+        print(profiler.report)
+
+    Entering the profiler replaces each profiled function with a wrapper
+    that counts its calls and accumulates its elapsed time, and replaces
+    aecPoint.__init__ with a wrapper that counts allocations. Exiting
+    restores the original functions. Code outside a with block runs the
+    unwrapped functions, so an inactive profiler costs nothing beyond the
+    count calls made once per placement by aecSpacer.
+
+    Shapely predicates are wrapped as shapely module functions, as the names
+    bound to them by library modules importing them from shapely, and as
+    geometry methods, which test scalar geometries without calling the module
+    functions in shapely 2.2 and later. A predicate called by another, as the
+    geometry methods of earlier versions call the module functions, is counted
+    only once, under the name of the outer call. STRtree.query is timed with
+    the predicates, since it tests them on the candidates of spatial queries.
+    Timings of a function include the time of the profiled functions it calls.
+    """
+
+    # Defines the count of calls to a function and the
+    # total and mean seconds spent in it while profiled.
+
+    timing = \
+        NamedTuple(
+        'timing',
+        [
+            ('calls', int),
+            ('total', float),
+            ('mean', float)
+        ])
+
+    # Lists the shapely predicates profiled as module
+    # functions and as geometry methods where they exist.
+
+    __predicates = \
+    [
+        'contains', 'contains_properly', 'contains_xy', 'covered_by', 'covers', 'crosses',
+        'disjoint', 'equals', 'intersects', 'intersects_xy', 'overlaps', 'touches', 'within'
+    ]
+
+    # Lists the active profilers receiving counts.
+
+    __active = []
+
+    __slots__ = ['__calls', '__counts', '__patches', '__totals']
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__calls = defaultdict(int)
+        self.__counts = defaultdict(int)
+        self.__patches = []
+        self.__totals = defaultdict(float)
+
+    def __enter__(self) -> 'aecProfiler':
+        """
+        Clears previous results, wraps the profiled functions,
+        and returns the profiler for use in a with statement.
+        """
+        self.__calls.clear()
+        self.__counts.clear()
+        self.__totals.clear()
+        for owner, attribute, name in self.__getTimed():
+            self.__patch(owner, attribute, self.__wrapTimed(getattr(owner, attribute), name))
+        outer = []
+        for owner, attribute, name in self.__getPredicates():
+            self.__patch(owner, attribute, self.__wrapTimed(getattr(owner, attribute), name, outer))
+        from .aecPoint import aecPoint
+        self.__patch(aecPoint, '__init__', self.__wrapCounted(aecPoint.__init__, 'aecPoint'))
+        aecProfiler.__active.append(self)
+        return self
+
+    def __exit__(self, *exception):
+        """
+        Restores the profiled functions at the end of a with statement.
+        """
+        if self in aecProfiler.__active: aecProfiler.__active.remove(self)
+        while self.__patches:
+            owner, attribute, original = self.__patches.pop()
+            setattr(owner, attribute, original)
+
+    def __getPredicates(self):
+        """
+        Returns the list of profiled shapely predicates as (owner, attribute, name) tuples,
+        including the names bound to the module functions by loaded library modules.
+        """
+        functions = {predicate: getattr(shapely, predicate)
+                     for predicate in self.__predicates if hasattr(shapely, predicate)}
+        predicates = [(shapely, predicate, 'shapely.' + predicate) for predicate in functions]
+        modules = [module for name, module in list(sys.modules.items())
+                   if name.startswith(__package__ + '.') and module is not None]
+        predicates += [(module, predicate, 'shapely.' + predicate)
+                       for module in modules for predicate, function in functions.items()
+                       if getattr(module, predicate, None) is function]
+        predicates += [(BaseGeometry, predicate, 'BaseGeometry.' + predicate)
+                       for predicate in self.__predicates if hasattr(BaseGeometry, predicate)]
+        predicates.append((STRtree, 'query', 'STRtree.query'))
+        return predicates
+
+    def __getTimed(self):
+        """
+        Returns the list of profiled library functions as (owner, attribute, name) tuples.
+        Imported here because aecSpacer reports its placement attempts to this module.
+        """
+        from .aecGeometry import aecGeometry
+        from .aecSpace import aecSpace
+        from .aecSpacer import aecSpacer
+        timed = \
+        [
+            (aecSpace, '_aecSpace__setBoundary', 'aecSpace.__setBoundary'),
+            (aecSpace, '_aecSpace__setBoundaryTrusted', 'aecSpace.__setBoundaryTrusted'),
+            (aecGeometry, 'cleanBoundary', 'aecGeometry.cleanBoundary'),
+            (aecGeometry, 'getInnerFit', 'aecGeometry.getInnerFit'),
+            (aecGeometry, 'getMesh2D', 'aecGeometry.getMesh2D'),
+            (aecGeometry, 'getMeshPrism', 'aecGeometry.getMeshPrism'),
+            (aecGeometry, 'getNoFit', 'aecGeometry.getNoFit'),
+            (aecGeometry, 'getRandomPoints', 'aecGeometry.getRandomPoints'),
+            (aecSpacer, 'pack', 'aecSpacer.pack'),
+            (aecSpacer, 'place', 'aecSpacer.place'),
+            (aecSpacer, 'placeOnLine', 'aecSpacer.placeOnLine'),
+            (aecSpacer, 'placeWithin', 'aecSpacer.placeWithin'),
+        ]
+        return timed
+
+    def __patch(self, owner, attribute: str, replacement):
+        """
+        Replaces the attribute of the owner, recording the original for __exit__.
+        """
+        self.__patches.append((owner, attribute, getattr(owner, attribute)))
+        setattr(owner, attribute, replacement)
+
+    def __wrapCounted(self, function, name: str):
+        """
+        Returns a wrapper of the function counting its calls without timing them.
+        """
+        counts = self.__counts
+        @functools.wraps(function)
+        def counted(*arguments, **keywords):
+            counts[name] += 1
+            return function(*arguments, **keywords)
+        return counted
+
+    def __wrapTimed(self, function, name: str, outer: list = None):
+        """
+        Returns a wrapper of the function counting its calls and accumulating their time.
+        Wrappers sharing an outer list do not count calls made while another is running.
+        """
+        calls = self.__calls
+        totals = self.__totals
+        clock = time.perf_counter
+        @functools.wraps(function)
+        def timed(*arguments, **keywords):
+            if outer is not None:
+                if outer: return function(*arguments, **keywords)
+                outer.append(name)
+            start = clock()
+            try:
+                return function(*arguments, **keywords)
+            finally:
+                totals[name] += clock() - start
+                calls[name] += 1
+                if outer is not None: outer.pop()
+        return timed
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """
+        Property
+        Returns a dictionary of counted events by name, including
+        aecPoint allocations and aecSpacer placement attempts.
+        Returns None on failure.
+        """
+        try:
+            return dict(self.__counts)
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    @property
+    def report(self) -> str:
+        """
+        Property
+        Returns a table of the profiled functions called, ordered by
+        total time, followed by the counted events.
+        Returns None on failure.
+        """
+        try:
+            lines = ['{:<36}{:>10}{:>12}{:>12}'.format('function', 'calls', 'total s', 'mean us')]
+            timings = sorted(self.timings.items(), key = lambda item: -item[1].total)
+            for name, entry in timings:
+                lines.append('{:<36}{:>10d}{:>12.4f}{:>12.2f}'.format(
+                             name, entry.calls, entry.total, entry.mean * 1e6))
+            for name, count in sorted(self.__counts.items()):
+                lines.append('{:<36}{:>10d}'.format(name, count))
+            return '\n'.join(lines)
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    @property
+    def timings(self) -> Dict[str, timing]:
+        """
+        Property
+        Returns a dictionary of timings by the name of each profiled function called.
+        Returns None on failure.
+        """
+        try:
+            return {name: self.timing(calls = calls,
+                                      total = self.__totals[name],
+                                      mean = self.__totals[name] / calls)
+                    for name, calls in self.__calls.items()}
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    @staticmethod
+    def count(name: str, value: int = 1):
+        """
+        Adds the value to the named count of every active profiler.
+        Does nothing if no profiler is active.
+        """
+        for profiler in aecProfiler.__active:
+            profiler.__counts[name] += value
+
+# end class
@@ -1,12 +1,14 @@
+import numpy
 import traceback
 
-from math import cos, sin, pi
+from math import pi
 from shapely import geometry as shapely
 from shapely import ops as shapelyOps
 from typing import List
 
 from aecSpace.aecGeometry import aecGeometry
 from aecSpace.aecPoint import aecPoint
+from aecSpace.aecPointArray import aecPointArray
 from aecSpace.aecValid import aecValid
 
 class aecShaper():
@@ -23,7 +25,7 @@ class aecShaper():
         """
         pass
    
-    def __add(self, pointSet: List[List[aecPoint]]) -> List[aecPoint]:
+    def __add(self, pointSet: List[List[aecPoint]]) -> aecPointArray:
         """
         Returns a series of anticlockwise points representing a single non-crossing polygon.
         Returns None on failure.
@@ -31,29 +33,29 @@ class aecShaper():
         try:
             boundaries = []
             for points in pointSet:
-                polygon = shapely.polygon.orient(shapely.Polygon([point.xy for point in points]))
+                polygon = shapely.polygon.orient(shapely.Polygon(aecPointArray(points).xy_array))
                 if type(polygon) != shapely.polygon.Polygon: raise Exception
                 boundaries.append(polygon)
             boundary = shapelyOps.unary_union(shapely.MultiPolygon(boundaries))
             if type(boundary) != shapely.polygon.Polygon: return None
-            return [aecPoint(pnt[0], pnt[1]) for pnt in list(boundary.exterior.coords)[:-1]]                
+            return aecPointArray(numpy.asarray(boundary.exterior.coords)[:-1])
         except Exception:
             traceback.print_exc()
             return None
       
     def makeBox(self, origin: aecPoint = aecPoint(), 
                       xSize: float = 1.0, 
-                      ySize: float = 1.0) -> List[aecPoint]:
+                      ySize: float = 1.0) -> aecPointArray:
         """
         Returns a series of anticlockwise points representing
         a rectangular boundary derived from two diagonal points.
         Returns None on failure.
         """
         try:
-            return [aecPoint(origin.x, origin.y),
-                    aecPoint(origin.x + xSize, origin.y),
-                    aecPoint(origin.x + xSize, origin.y + ySize),
-                    aecPoint(origin.x, origin.y + ySize)]
+            return aecPointArray([(origin.x, origin.y),
+                                  (origin.x + xSize, origin.y),
+                                  (origin.x + xSize, origin.y + ySize),
+                                  (origin.x, origin.y + ySize)])
         except Exception:
             traceback.print_exc()
             return None    
@@ -64,7 +66,7 @@ class aecShaper():
                         xWidth = None, 
                         yDepth = None,
                         xAxis: float = 0.5, 
-                        yAxis: float = 0.5) -> List[aecPoint]:
+                        yAxis: float = 0.5) -> aecPointArray:
         """
         Returns a series of anticlockwise points representing a cross-shaped boundary 
         within the box defined by the origin point and xSize and ySize.
@@ -85,7 +87,7 @@ class aecShaper():
             traceback.print_exc()
             return None
 
-    def makeCylinder(self, origin: aecPoint = aecPoint(), radius = 1) -> List[aecPoint]:
+    def makeCylinder(self, origin: aecPoint = aecPoint(), radius = 1) -> aecPointArray:
         """
         Returns a series of anticlockwise points representing an approximated circular boundary 
         setting a ratio from the delivered radius to the number of sides.
@@ -104,7 +106,7 @@ class aecShaper():
                     ySize: float = 1,
                     xWidth1 = None, 
                     xWidth2= None, 
-                    yDepth = None) -> List[aecPoint]:
+                    yDepth = None) -> aecPointArray:
         """
         Returns a series of anticlockwise points representing an H-shaped boundary
         within the box defined by the origin point and xSize and ySize.
@@ -135,7 +137,7 @@ class aecShaper():
                     xSize: float = 1, 
                     ySize: float = 1,
                     xWidth = None, 
-                    yDepth = None) -> List[aecPoint]:
+                    yDepth = None) -> aecPointArray:
         """
         Returns a series of anticlockwise points representing an L-shaped boundary
         within the box defined by the origin point and xSize and ySize.
@@ -156,7 +158,7 @@ class aecShaper():
 
     def makePolygon(self, origin: aecPoint = aecPoint(), 
                           radius = 1, 
-                          sides = 3) -> List[aecPoint]:
+                          sides = 3) -> aecPointArray:
         """
         Returns a series of anticlockwise points representing a regular polygon boundary centered
         on the delivered origin point with the first vertex at the maximum y-coordinate.
@@ -167,17 +169,10 @@ class aecShaper():
             if radius == 0: return False
             sides = int(abs(sides))
             if sides < 3: sides = 3
-            angle = pi * 0.5
-            incAngle = (pi * 2) / sides
-            points = []
-            count = 0
-            while count < sides:
-                x = origin.x + (radius * cos(angle))
-                y = origin.y + (radius * sin(angle))
-                points.append(aecPoint(x, y))
-                angle += incAngle
-                count += 1
-            return points
+            angles = (pi * 0.5) + (numpy.arange(sides) * ((pi * 2) / sides))
+            xCoords = origin.x + (radius * numpy.cos(angles))
+            yCoords = origin.y + (radius * numpy.sin(angles))
+            return aecPointArray(numpy.column_stack((xCoords, yCoords)))
         except Exception:
             traceback.print_exc()
             return None
@@ -186,7 +181,7 @@ class aecShaper():
                     xSize: float = 1, 
                     ySize: float = 1,
                     xWidth = None, 
-                    yDepth = None) -> List[aecPoint]:
+                    yDepth = None) -> aecPointArray:
         """
         Returns a series of anticlockwise points representing a T-shaped boundary
         within the box defined by the origin point and xSize and ySize.
@@ -212,7 +207,7 @@ class aecShaper():
                     ySize: float = 1,
                     xWidth1 = None, 
                     xWidth2= None, 
-                    yDepth = None) -> List[aecPoint]:
+                    yDepth = None) -> aecPointArray:
         """
         Returns a series of anticlockwise points representing a U-shaped boundary
         within the box defined by the origin point and xSize and ySize.
@@ -1,8 +1,8 @@
+import numpy
 import traceback
 
 from random import uniform
 from typing import List, Tuple
-from uuid import uuid4
 
 from shapely import geometry as shapely
 from shapely import affinity as shapelyAffine
@@ -10,7 +10,9 @@ from shapely import ops as shapelyOps
 
 from .aecColor import aecColor
 from .aecGeometry import aecGeometry
+from .aecID import aecID
 from .aecPoint import aecPoint
+from .aecPointArray import aecPointArray
 from .aecValid import aecValid
 
 class aecSpace:
@@ -27,19 +29,40 @@ class aecSpace:
       to the ground plane with only vertical boundaries.
 
     * Curved boundaries must be represented as a series of straight segments.
+
+    Derived geometry such as area, bounding box, centroid, and meshes is cached
+    on first read and discarded whenever the boundary, height, or level changes.
+    Set aecSpace.caching to False to recompute every read while debugging.
+
+    Copies made by copy share the validated boundary of the original, which is
+    never modified in place: every change to a boundary replaces it, so changing
+    a copy leaves the original and the other copies unchanged.
     """
+    caching = True
+
     __aecGeometry = aecGeometry()
+    __aecID = aecID()
     __aecValid = aecValid()
     
+    # Lists the cached values that depend only on the shape of the
+    # boundary, which copies share, and those that also depend on
+    # its position, which copies share when they are not moved
+    # horizontally. Neither depends on the level or height.
+
+    __shapeKeys = ('area', 'circumference', 'indices', 'normal_sides')
+    __planKeys = ('bounds', 'box', 'centroid')
+
     __slots__ = \
     [
          '__address',
+         '__cache',
          '__color',           
          '__convex',
          '__height',
          '__ID',
          '__level',
          '__name',
+         '__offset',
          '__points_floor',
          '__boundary',
     ]   
@@ -48,14 +71,7 @@ class aecSpace:
         """
         Constructor defaults to a 1 x 1 square with an origin at (0, 0, 0).
         """
-        self.__address = (0, 0, 0)
-        self.__color = aecColor()
-        self.__height = 1.0
-        self.__ID = str(uuid4())
-        self.__level = 0.0
-        self.__name = ''
-        self.__points_floor = None
-        self.__boundary = None
+        self.__setDefaults()
         if not points:
             points = \
             [
@@ -66,25 +82,124 @@ class aecSpace:
             ]
         self.__setBoundary(points)
 
+    def __setDefaults(self):
+        """
+        Sets the default properties of a new space without a boundary.
+        """
+        self.__address = (0, 0, 0)
+        self.__cache = {}
+        self.__color = aecColor()
+        self.__height = 1.0
+        self.__ID = None
+        self.__level = 0.0
+        self.__name = ''
+        self.__offset = None
+        self.__points_floor = None
+        self.__boundary = None
+
     def __setBoundary(self, points: List[aecPoint]) -> bool:
         """
         Creates a boundary from a set of anticlockwise points.
         """
         try:
+            self.__cache.clear()
             prePoints = self.__points_floor
-            points = self.__aecGeometry.rmvColinear(points)
-            if len(points) < 3: raise ValueError('Need at least three non-colinear points')                
-            polygon = shapely.polygon.orient(shapely.Polygon([point.xy for point in points]))
-            if type(polygon) != shapely.polygon.Polygon: raise Exception
-            self.__points_floor = [aecPoint(pnt[0], pnt[1]) for pnt in polygon.exterior.coords[:-1]] 
-            self.__boundary = polygon
-            self.__convex = self.__aecGeometry.isConvex(points)
+            boundary = self.__aecGeometry.cleanBoundary(points)
+            points = boundary.points
+            if len(points) < 3: raise ValueError('Need at least three non-colinear points')
+            points.z = 0
+            self.__points_floor = points
+            self.__boundary = shapely.Polygon(points.xy_array)
+            self.__convex = boundary.convex
+            self.__offset = None
             return True
         except Exception:
             self.__points_floor = prePoints
             traceback.print_exc() 
             return False                 
 
+    def __setBoundaryTrusted(self, points: List[aecPoint], convex: bool = None) -> bool:
+        """
+        Creates a boundary from anticlockwise points already known to be valid,
+        skipping colinear point removal, orientation, and convexity testing.
+        Keeps the current convexity unless convex is delivered.
+        """
+        try:
+            points = aecPointArray(points)
+            if len(points) < 3: raise ValueError('Need at least three non-colinear points')
+            points.z = 0
+            polygon = shapely.Polygon(points.xy_array)
+            self.__cache.clear()
+            self.__points_floor = points
+            self.__boundary = polygon
+            self.__offset = None
+            if convex is not None: self.__convex = bool(convex)
+            return True
+        except Exception:
+            traceback.print_exc() 
+            return False
+
+    def __settle(self):
+        """
+        Replaces a boundary shared with the space this space was copied
+        from by its own boundary if the copy was moved horizontally,
+        applying the pending offset before the boundary is first read.
+        """
+        if self.__offset is None: return
+        x, y = self.__offset
+        points = aecPointArray(self.__points_floor.xy_array + (x, y))
+        points.z = 0
+        self.__points_floor = points
+        self.__boundary = shapelyAffine.translate(self.__boundary, x, y)
+        self.__offset = None
+
+    def __discard(self):
+        """
+        Discards the cached values depending on the level or height.
+        """
+        keep = self.__shapeKeys + self.__planKeys
+        for key in [key for key in self.__cache if key not in keep]: del self.__cache[key]
+
+    def __transform(self, matrix: numpy.ndarray) -> bool:
+        """
+        Applies a non-degenerate 3x3 affine matrix to the boundary without
+        revalidating it, since such a transformation preserves the vertex count,
+        colinearity, and convexity. Reverses the point order if the matrix
+        mirrors the boundary to keep it anticlockwise.
+        """
+        try:
+            if matrix is None: return False
+            linear = matrix[:2, :2]
+            if numpy.linalg.det(linear) == 0: return False
+            self.__settle()
+            coords = (self.__points_floor.xy_array @ linear.T) + matrix[:2, 2]
+            if numpy.linalg.det(linear) < 0: coords = coords[::-1]
+            return self.__setBoundaryTrusted(coords)
+        except Exception:
+            traceback.print_exc() 
+            return False
+
+    def __cached(self, key: str, function):
+        """
+        Returns the cached value for the key, calling the
+        delivered function to compute it on the first read.
+        Always calls the function if caching is disabled.
+        """
+        if not aecSpace.caching: return function()
+        try:
+            return self.__cache[key]
+        except KeyError:
+            value = function()
+            self.__cache[key] = value
+            return value
+
+    def __getBounds(self) -> Tuple[float, float, float, float]:
+        """
+        Returns the cached (minX, minY, maxX, maxY) bounds of the boundary.
+        """
+        self.__settle()
+        return self.__cached('bounds', lambda: self.__boundary.bounds)
+
     @property
     def address(self) -> Tuple[int, int, int]:
         """
@@ -121,7 +236,7 @@ class aecSpace:
         Returns None on failure.
         """
         try:
-            return self.boundary.area
+            return self.__cached('area', lambda: self.__boundary.area)
         except:
             traceback.print_exc() 
             return None        
@@ -135,9 +250,9 @@ class aecSpace:
         Returns None on failure.
         """
         try:
-            box = self.points_box
-            xDelta = abs(box.SE.x - box.SW.x)
-            yDelta = abs(box.NE.y - box.SE.y)   
+            bounds = self.__getBounds()
+            xDelta = abs(bounds[2] - bounds[0])
+            yDelta = abs(bounds[3] - bounds[1])
             if xDelta >= yDelta: return self.axis_x
             else: return self.axis_y
         except:
@@ -153,9 +268,9 @@ class aecSpace:
         Returns None on failure.
         """
         try:
-            box = self.points_box
-            xDelta = abs(box.SE.x - box.SW.x)
-            yDelta = abs(box.NE.y - box.SE.y)   
+            bounds = self.__getBounds()
+            xDelta = abs(bounds[2] - bounds[0])
+            yDelta = abs(bounds[3] - bounds[1])
             if xDelta < yDelta: return self.axis_x
             else: return self.axis_y
         except:
@@ -200,13 +315,14 @@ class aecSpace:
         Returns None on failure.        
         """
         try:
+            self.__settle()
             return self.__boundary
         except:
             traceback.print_exc() 
             return None
 
     @boundary.setter
-    def boundary(self, value: List[aecPoint]):
+    def boundary(self, value: aecPointArray):
         """
         Property
         Sets the boundary from a series of anticlockwise points.
@@ -224,15 +340,16 @@ class aecSpace:
         Returns None on failure.        
         """
         try:
-            bounds = self.__boundary.bounds
-            return shapely.polygon.orient(
+            bounds = self.__getBounds()
+            return self.__cached('box', lambda: 
+                   shapely.polygon.orient(
                    shapely.Polygon(
                    [
                        (bounds[0], bounds[1]),
                        (bounds[2], bounds[1]),
                        (bounds[2], bounds[3]),
                        (bounds[0], bounds[3])
-                   ]))
+                   ])))
         except:
             traceback.print_exc() 
             return None  
@@ -305,8 +422,9 @@ class aecSpace:
         Returns None on failure.
         """
         try:
-            centroid = self.__boundary.centroid    
-            return aecPoint(centroid.x, centroid.y, self.level)
+            self.__settle()
+            centroid = self.__cached('centroid', lambda: self.__boundary.centroid.coords[0])
+            return aecPoint(centroid[0], centroid[1], self.level)
         except:
             traceback.print_exc() 
             return None 
@@ -333,7 +451,7 @@ class aecSpace:
         Returns None on failure.
         """
         try:
-            return self.__boundary.length
+            return self.__cached('circumference', lambda: self.__boundary.length)
         except:
             traceback.print_exc() 
             return None             
@@ -454,6 +572,7 @@ class aecSpace:
         try:
             preVal = self.__height
             self.__height = float(value)
+            self.__discard()
         except Exception:
             self.__height = preVal
             traceback.print_exc()   
@@ -462,9 +581,10 @@ class aecSpace:
     def ID(self) -> str:
         """
         Property
-        Returns the UUID.
+        Returns the UUID, generating it on first access.
         """            
         try:
+            if not self.__ID: self.__ID = self.__aecID.make()
             return self.__ID
         except Exception:
             traceback.print_exc()
@@ -492,6 +612,7 @@ class aecSpace:
         try:
             preVal = self.__level
             self.__level = float(value)
+            self.__discard()
         except:
             self.__level = preVal
             traceback.print_exc() 
@@ -504,28 +625,62 @@ class aecSpace:
         Returns None on failure.
         """
         try:
-            ceiling_mesh = self.mesh_ceiling
-            vertices = ceiling_mesh.vertices
-            indices = ceiling_mesh.indices     
-            normals = ceiling_mesh.normals
-            off = len(vertices)
-            floor_mesh = self.mesh_floor
-            vertices += floor_mesh.vertices
-            indices += [(idx[2] + off,idx[1] + off, idx[0] + off) for idx in floor_mesh.indices] 
-            normals += floor_mesh.normals
-            side_meshes = self.mesh_sides
-            for side in side_meshes:
-                off = len(vertices)
-                vertices += side.vertices
-                normals += side.normals
-                indices += [(idx[0] + off,idx[1] + off, idx[2] + off) for idx in side.indices] 
-            return aecGeometry.mesh3D(vertices = vertices, 
-                                      indices = indices, 
-                                      normals = normals)                      
+            mesh = self.__cached('mesh', self.__makeMesh)
+            return aecGeometry.mesh3D(vertices = list(mesh.vertices), 
+                                      indices = list(mesh.indices), 
+                                      normals = list(mesh.normals))
         except Exception:
             traceback.print_exc() 
             return None  
+
+    def __makeMesh(self) -> aecGeometry.mesh3D:
+        """
+        Returns a new mesh of the space combining the ceiling, floor, and side meshes.
+        """
+        mesh = self.__makeMeshArrays(numpy.float64)
+        return aecGeometry.mesh3D(vertices = [tuple(vtx) for vtx in mesh.vertices.tolist()], 
+                                  indices = [tuple(idx) for idx in mesh.indices.tolist()], 
+                                  normals = [tuple(nrm) for nrm in mesh.normals.tolist()])
+
+    def __makeMeshArrays(self, dtype: type = numpy.float32) -> aecGeometry.meshArrays:
+        """
+        Returns a new mesh of the space as numpy arrays of the delivered dtype.
+        """
+        self.__settle()
+        return self.__aecGeometry.getMeshPrism(self.__points_floor, 
+                                               self.__getIndices2D(),
+                                               self.level,
+                                               self.height,
+                                               dtype)
+
+    def __getIndices2D(self) -> List[Tuple[int, int, int]]:
+        """
+        Returns the cached triangle indices shared by the floor and ceiling meshes.
+        """
+        return self.__cached('indices', lambda: self.__aecGeometry.getMesh2D(self.__points_floor).indices)
         
+    @property
+    def mesh_arrays(self) -> aecGeometry.meshArrays:
+        """
+        Property
+        Returns a mesh of the space as read-only numpy arrays of float32
+        vertices, uint32 triangle indices, and float32 surface normals.
+        Returns None on failure.
+        """
+        try:
+            return self.__cached('mesh_arrays', self.__makeMeshFrozen)
+        except Exception:
+            traceback.print_exc() 
+            return None  
+
+    def __makeMeshFrozen(self) -> aecGeometry.meshArrays:
+        """
+        Returns a new float32 mesh with arrays protected from modification.
+        """
+        mesh = self.__makeMeshArrays()
+        for array in mesh: array.flags.writeable = False
+        return mesh
+
     @property
     def mesh_ceiling(self) -> aecGeometry.mesh3D:
         """
@@ -534,12 +689,10 @@ class aecSpace:
         Returns None on failure.
         """
         try:
-            mesh2D = self.__aecGeometry.getMesh2D(self.points_ceiling)
-            normal = self.normal_ceiling
-            normals = []
-            for vertex in mesh2D.vertices: normals.append(normal)
-            return self.__aecGeometry.mesh3D(vertices = mesh2D.vertices,
-                                             indices = mesh2D.indices,
+            vertices = self.points_ceiling.xyz
+            normals = [self.normal_ceiling] * len(vertices)
+            return self.__aecGeometry.mesh3D(vertices = vertices,
+                                             indices = list(self.__getIndices2D()),
                                              normals = normals)            
         except:
             traceback.print_exc() 
@@ -553,12 +706,10 @@ class aecSpace:
         Returns None on failure.
         """
         try:
-            mesh2D = self.__aecGeometry.getMesh2D(self.points_floor)
-            normal = self.normal_floor
-            normals = []
-            for vertex in mesh2D.vertices: normals.append(normal)
-            return self.__aecGeometry.mesh3D(vertices = mesh2D.vertices,
-                                             indices = mesh2D.indices,
+            vertices = self.points_floor.xyz
+            normals = [self.normal_floor] * len(vertices)
+            return self.__aecGeometry.mesh3D(vertices = vertices,
+                                             indices = list(self.__getIndices2D()),
                                              normals = normals)            
         except:
             traceback.print_exc() 
@@ -573,20 +724,23 @@ class aecSpace:
         Returns None on failure.
         """
         try:
-            space_mesh = self.mesh
-            vertices = []
-            indices = []
-            normals = []
-            for item in space_mesh.vertices: vertices += [item[0], item[1], item[2]]
-            for item in space_mesh.indices: indices += [item[0], item[1], item[2]]
-            for item in space_mesh.normals: normals += [item[0], item[1], item[2]]
-            return aecGeometry.mesh3Dgraphic(vertices = vertices, 
-                                             indices = indices, 
-                                             normals = normals)
+            mesh = self.__cached('mesh_graphic', self.__makeMeshGraphic)
+            return aecGeometry.mesh3Dgraphic(vertices = list(mesh.vertices), 
+                                             indices = list(mesh.indices), 
+                                             normals = list(mesh.normals))
         except Exception:
             traceback.print_exc() 
             return None   
 
+    def __makeMeshGraphic(self) -> aecGeometry.mesh3Dgraphic:
+        """
+        Returns a new mesh of the space flattened to sequences of floats.
+        """
+        mesh = self.__makeMeshArrays(numpy.float64)
+        return aecGeometry.mesh3Dgraphic(vertices = mesh.vertices.ravel().tolist(), 
+                                         indices = mesh.indices.ravel().tolist(), 
+                                         normals = mesh.normals.ravel().tolist())
+
     @property
     def mesh_sides(self) -> List[aecGeometry.mesh2D]:
         """
@@ -669,14 +823,13 @@ class aecSpace:
     def normal_sides(self) -> List[Tuple[float, float, float]]:
         """
         Property
-        Returns the list of surface normals from each side.
+        Returns the list of outward surface normals from each side.
         Returns None on failure.
         """
         try:
-            normals = []
-            for side in self.points_sides:
-                normals.append(self.__aecGeometry.getNormal(side[0], side[3], side[1]))
-            return normals
+            return list(self.__cached('normal_sides', lambda: 
+                        [self.__aecGeometry.getNormal(side[0], side[1], side[3]) 
+                         for side in self.points_sides]))
         except Exception:
             traceback.print_exc() 
             return None                  
@@ -754,7 +907,7 @@ class aecSpace:
         Returns None on failure.        
         """
         try:
-            bounds = self.__boundary.bounds
+            bounds = self.__getBounds()
             level = self.level
             return aecGeometry.quad_points(ID = 0,
                                            SW = aecPoint(bounds[0], bounds[1], level),
@@ -767,27 +920,33 @@ class aecSpace:
             return None
     
     @property
-    def points_ceiling(self) -> List[aecPoint]:
+    def points_ceiling(self) -> aecPointArray:
         """
         Property
         Returns the anticlockwise points defining the ceiling boundary.
         Returns None on failure
         """
         try:
-            return [aecPoint(pnt.x, pnt.y, self.elevation) for pnt in self.points_floor]
+            self.__settle()
+            points = aecPointArray(self.__points_floor)
+            points.z = self.elevation
+            return points
         except Exception:
             traceback.print_exc()
             return None
 
     @property
-    def points_floor(self) -> List[aecPoint]:
+    def points_floor(self) -> aecPointArray:
         """
         Property
         Returns the anticlockwise points defining the floor boundary.
         Returns None on failure.
         """
         try:
-            return [aecPoint(pnt.x, pnt.y, self.level) for pnt in self.__points_floor]
+            self.__settle()
+            points = aecPointArray(self.__points_floor)
+            points.z = self.level
+            return points
         except:
             traceback.print_exc() 
             return None
@@ -800,20 +959,27 @@ class aecSpace:
         Returns None on failure.
         """
         try:
-            flrPnts = self.points_floor
-            clgPnts = self.points_ceiling            
-            sides = []
-            index = 0
-            length = len(flrPnts)
-            while index < length:
-                indexNxt = (index + 1) % length
-                sides.append([flrPnts[index], flrPnts[indexNxt], clgPnts[indexNxt], clgPnts[index]])
-                index += 1
-            return sides
+            sides = self.__cached('points_sides', self.__makeSides)
+            return [[aecPoint(pnt[0], pnt[1], pnt[2]) for pnt in side] for side in sides]
         except Exception:
             traceback.print_exc() 
             return None
 
+    def __makeSides(self) -> List[List[Tuple[float, float, float]]]:
+        """
+        Returns the coordinates of the four corners of each side.
+        """
+        flrPnts = self.points_floor.xyz
+        clgPnts = self.points_ceiling.xyz
+        sides = []
+        index = 0
+        length = len(flrPnts)
+        while index < length:
+            indexNxt = (index + 1) % length
+            sides.append([flrPnts[index], flrPnts[indexNxt], clgPnts[indexNxt], clgPnts[index]])
+            index += 1
+        return sides
+
     @property
     def size_x(self) -> float:
         """
@@ -822,8 +988,8 @@ class aecSpace:
         Returns None on failure.
         """
         try:
-            points = self.points_box
-            return abs(points.SE.x - points.SW.x)
+            bounds = self.__getBounds()
+            return abs(bounds[2] - bounds[0])
         except:
             traceback.print_exc() 
             return None  
@@ -836,8 +1002,8 @@ class aecSpace:
         Returns None on failure.
         """
         try:
-            points = self.points_box
-            return abs(points.NW.y - points.SW.y)
+            bounds = self.__getBounds()
+            return abs(bounds[3] - bounds[1])
         except:
             traceback.print_exc() 
             return None               
@@ -865,6 +1031,7 @@ class aecSpace:
         polygon and leaves the current boundary unchanged.
         """
         try:
+            self.__settle()
             if restart: boundaries = []
             else: boundaries = [self.__boundary]
             if self.__setBoundary(points):
@@ -872,7 +1039,7 @@ class aecSpace:
                 boundaries = shapely.MultiPolygon(boundaries)
                 boundary = shapelyOps.unary_union(boundaries)
                 if type(boundary) != shapely.polygon.Polygon: return False
-                points = [aecPoint(pnt[0], pnt[1]) for pnt in list(boundary.exterior.coords)[:-1]]
+                points = aecPointArray(numpy.asarray(boundary.exterior.coords)[:-1])
                 return self.__setBoundary(points)
             return False
         except Exception:
@@ -920,13 +1087,59 @@ class aecSpace:
         Returns None on failure.
         """
         try:
-            shape_points = [pnt.xy for pnt in points]
+            shape_points = aecPointArray(points).xy_array
             shape = shapely.polygon.orient(shapely.Polygon(shape_points))
             return self.boundary.contains(shape)
         except Exception:
             traceback.print_exc()
             return None
         
+    def copy(self, x: float = 0, y: float = 0, z: float = 0) -> 'aecSpace':
+        """
+        Returns a new aecSpace with the boundary, color, height, level, and name of
+        this space, moved by the delivered x, y, and z displacements. The copy shares
+        the validated boundary of this space and its cached area, triangulation, and
+        other values that do not depend on position, rather than rebuilding them.
+        A vertical move only changes the level of the copy. A horizontal move is
+        kept as an offset and applied the first time the copy's boundary is read.
+        Returns None on failure.
+        """
+        try:
+            space = aecSpace.__new__(aecSpace)
+            space.__address = (0, 0, 0)
+            space.__color = aecColor()
+            space.__color.color = self.__color.color
+            space.__height = self.__height
+            space.__ID = None
+            space.__level = self.__level + float(z)
+            space.__name = self.__name
+            space.__points_floor = self.__points_floor
+            space.__boundary = self.__boundary
+            space.__convex = self.__convex
+            space.__offset = self.__offset
+            keys = self.__shapeKeys
+            if x or y:
+                xOffset, yOffset = self.__offset or (0, 0)
+                space.__offset = (xOffset + float(x), yOffset + float(y))
+            else: keys += self.__planKeys
+            space.__cache = {key: self.__cache[key] for key in keys if key in self.__cache}
+            return space
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    def dumps(self) -> bytes:
+        """
+        Returns the space in the binary format of aecSpaceStore.
+        Returns None on failure.
+        """
+        try:
+            from .aecSpaceStore import aecSpaceStore
+            return aecSpaceStore([self]).dumps()
+        except Exception:
+            traceback.print_exc()
+            return None
+
     def enclosesPoint(self, point: aecPoint) -> bool:
         """
         Returns True if the delivered point falls within the space,
@@ -936,7 +1149,7 @@ class aecSpace:
         Returns None on failure.
         """
         try:
-            return self.boundary.containsPoint(point) and \
+            return self.containsPoint(point) and \
                    point.z >= self.level and point.z <= self.elevation
         except Exception:
             traceback.print_exc()
@@ -951,8 +1164,7 @@ class aecSpace:
         Returns None on failure.
         """
         try:
-            points = [pnt.xy for pnt in points]
-            return self.boundary.containsShape(points) and \
+            return self.containsShape(points) and \
                    level >= self.level and self.elevation >= elevation
         except Exception:
             traceback.print_exc()
@@ -974,6 +1186,40 @@ class aecSpace:
             traceback.print_exc()
             return None
     
+    @staticmethod
+    def fromTrusted(points: List[aecPoint], convex: bool) -> 'aecSpace':
+        """
+        Returns a new aecSpace with default properties and a boundary from anticlockwise
+        points already known to be valid, such as points read back from an aecSpaceStore,
+        with the delivered convexity. Neither builds the default boundary of the
+        constructor nor revalidates the points. See setBoundary.
+        Returns None on failure.
+        """
+        try:
+            space = aecSpace.__new__(aecSpace)
+            space.__setDefaults()
+            if not space.__setBoundaryTrusted(points, convex): return None
+            return space
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    @staticmethod
+    def loads(data: bytes) -> 'aecSpace':
+        """
+        Returns a new space read from a bytes-like object in the binary
+        format of aecSpaceStore, taking the first space if there are several.
+        Returns None on failure.
+        """
+        try:
+            from .aecSpaceStore import aecSpaceStore
+            store = aecSpaceStore.loads(data)
+            if not store: return None
+            return store.getSpace(0)
+        except Exception:
+            traceback.print_exc()
+            return None
+
     def mirror(self, points: List[aecPoint] = None) -> bool:
         """
         Mirrors the space orthogonally around the specified line as defined
@@ -983,9 +1229,7 @@ class aecSpace:
         """
         try:
             if not points: points = self.axis_major
-            newPoints = self.__aecGeometry.mirrorPoints2D(self.points_floor, points[0], points[1])
-            if not newPoints: return False
-            return self.__setBoundary(newPoints)
+            return self.__transform(self.__aecGeometry.getMatrixMirror(points[0], points[1]))
         except Exception:
             traceback.print_exc()
             return False
@@ -997,9 +1241,9 @@ class aecSpace:
         Returns False on failure.
         """
         try:
-            points = [aecPoint(pnt.x + x, pnt.y + y) for pnt in self.points_floor]
-            self.level += z
-            return self.__setBoundary(points)
+            if z: self.level += z
+            if not (x or y): return True
+            return self.__transform(self.__aecGeometry.getMatrixMove(x, y))
         except Exception:
             traceback.print_exc()
             return False
@@ -1028,13 +1272,8 @@ class aecSpace:
         Returns False on failure.
         """
         try:
-            angle = float(angle)
             if not point: point = self.centroid_floor
-            polygon = shapelyAffine.rotate(self.__boundary, angle, point.xy)
-            if type(polygon) != shapely.polygon.Polygon: return False
-            self.__boundary = polygon
-            points = [aecPoint(pnt[0], pnt[1]) for pnt in polygon.exterior.coords[:-1]]
-            return self.__setBoundary(points)
+            return self.__transform(self.__aecGeometry.getMatrixRotate(angle, point))
         except Exception:
             traceback.print_exc()
             return False    
@@ -1049,9 +1288,9 @@ class aecSpace:
         try:
             prePoints = self.points_floor
             if not point: point = self.centroid_floor
-            polygon = shapelyAffine.scale(self.__boundary, x, y, 1, point.xy)
+            polygon = shapelyAffine.scale(self.boundary, x, y, 1, point.xy)
             if type(polygon) != shapely.polygon.Polygon: return False
-            points = [aecPoint(pnt[0], pnt[1]) for pnt in polygon.exterior.coords[:-1]] 
+            points = aecPointArray(numpy.asarray(polygon.exterior.coords)[:-1])
             self.height *= float(z)
             return self.__setBoundary(points)
         except Exception:
@@ -1059,6 +1298,24 @@ class aecSpace:
             traceback.print_exc()
             return False        
         
+    def setBoundary(self, points: List[aecPoint], validate: bool = True, convex: bool = None) -> bool:
+        """
+        Sets the boundary from a series of anticlockwise points.
+        If validate is False, the points are trusted to form a valid anticlockwise
+        boundary without colinear points, such as a non-degenerate affine transformation
+        of an existing boundary, and colinear point removal, orientation, and convexity
+        testing are skipped. An unvalidated boundary keeps the current convexity
+        unless convex is delivered.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            if validate: return self.__setBoundary(points)
+            return self.__setBoundaryTrusted(points, convex)
+        except Exception:
+            traceback.print_exc()
+            return False
+
     def wrap(self, points: List[aecPoint]) -> bool:
         """
         Sets the boundary to a convex hull
@@ -0,0 +1,179 @@
+import mmap
+import numpy
+import traceback
+
+from typing import List, Tuple
+
+from .aecSpace import aecSpace
+from .aecSpaceStore import aecSpaceStore
+
+"""
+aecSpaceArchive opens a file written by aecSpaceStore.save
+or aecSpaceGroup.save as a read-only memory map and queries it.
+"""
+
+class aecSpaceArchive:
+    """
+    Opens an archive in the binary format of aecSpaceStore through mmap
+    without reading it. Queries filter the metadata table of the archive,
+    which lists the level, height, name, and bounds of every space, and
+    return the indices of the matching spaces. getStore, getSpaces, and
+    getSpace then copy out the records and boundary coordinates of only
+    the delivered indices, so the operating system pages in only those
+    coordinates and memory use follows the size of the result rather
+    than the size of the archive.
+
+    Use an archive in a with statement, or call close, to release the file.
+    """
+
+    __slots__ = ['__coords', '__file', '__map', '__names', '__table']
+
+    def __init__(self, path: str):
+        """
+        Constructor opens the archive at the delivered path.
+        Raises an exception if the file is not an aecSpaceStore archive.
+        """
+        self.__file = open(path, 'rb')
+        try: self.__map = mmap.mmap(self.__file.fileno(), 0, access = mmap.ACCESS_READ)
+        except Exception:
+            self.__file.close()
+            raise
+        unpacked = aecSpaceStore.unpack(self.__map)
+        if unpacked is None:
+            self.__map.close()
+            self.__file.close()
+            raise ValueError('Not an aecSpaceStore archive: ' + str(path))
+        self.__table, self.__coords, self.__names = unpacked
+
+    def __enter__(self) -> 'aecSpaceArchive':
+        """
+        Returns the archive for use in a with statement.
+        """
+        return self
+
+    def __exit__(self, *exception):
+        """
+        Closes the archive at the end of a with statement.
+        """
+        self.close()
+
+    def __len__(self) -> int:
+        """
+        Returns the count of archived spaces.
+        """
+        return len(self.__table)
+
+    @property
+    def count(self) -> int:
+        """
+        Property
+        Returns the count of archived spaces.
+        Returns None on failure.
+        """
+        try:
+            return len(self.__table)
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    @property
+    def names(self) -> List[str]:
+        """
+        Property
+        Returns the list of distinct names of the archived spaces.
+        Returns None on failure.
+        """
+        try:
+            return list(self.__names)
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    def close(self) -> bool:
+        """
+        Releases the memory map and closes the file. Stores and
+        spaces already returned by the archive remain valid.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            self.__table = None
+            self.__coords = None
+            self.__map.close()
+            self.__file.close()
+            return True
+        except Exception:
+            traceback.print_exc()
+            return False
+
+    def getSpace(self, index: int) -> aecSpace:
+        """
+        Returns a new aecSpace from the archived space at the delivered index.
+        Returns None on failure.
+        """
+        try:
+            return self.getStore([index]).getSpace(0)
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    def getSpaces(self, indices: List[int]) -> List[aecSpace]:
+        """
+        Returns a list of new aecSpaces from the archived spaces at the delivered indices.
+        Returns None on failure.
+        """
+        try:
+            return self.getStore(indices).getSpaces()
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    def getStore(self, indices: List[int]) -> aecSpaceStore:
+        """
+        Returns a new aecSpaceStore of the archived spaces at the delivered
+        indices, copying only their records and boundary coordinates.
+        Returns None on failure.
+        """
+        try:
+            indices = numpy.asarray(indices, dtype = numpy.int64)
+            table = self.__table[indices]
+            counts = table['count'].astype(numpy.int64)
+            ends = numpy.cumsum(counts)
+            starts = ends - counts
+            rows = numpy.arange(ends[-1] if len(ends) else 0) + \
+                   numpy.repeat(table['offset'].astype(numpy.int64) - starts, counts)
+            table['offset'] = starts
+            return aecSpaceStore.fromTable(table, self.__coords[rows], self.__names)
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    def query(self, level: float = None, elevation: float = None, name: str = None,
+                    bounds: Tuple[float, float, float, float] = None) -> numpy.ndarray:
+        """
+        Returns an array of the indices of the archived spaces matching every delivered filter:
+        a vertical extent overlapping the level and elevation, where either may be omitted;
+        the name; and a bounding box overlapping the delivered minimum x, minimum y,
+        maximum x, and maximum y. Spaces that only touch a limit match.
+        Only the metadata table is read.
+        Returns None on failure.
+        """
+        try:
+            table = self.__table
+            found = numpy.ones(len(table), dtype = bool)
+            if level is not None: found &= (table['level'] + table['height']) >= level
+            if elevation is not None: found &= table['level'] <= elevation
+            if name is not None:
+                if name not in self.__names: return numpy.zeros(0, dtype = numpy.int64)
+                found &= table['name'] == self.__names.index(name)
+            if bounds is not None:
+                xMin, yMin, xMax, yMax = bounds
+                boxes = table['bounds']
+                found &= (boxes[:, 0] <= xMax) & (boxes[:, 2] >= xMin) & \
+                         (boxes[:, 1] <= yMax) & (boxes[:, 3] >= yMin)
+            return numpy.flatnonzero(found)
+        except Exception:
+            traceback.print_exc()
+            return None
+
+# end class
@@ -0,0 +1,101 @@
+import numpy
+import random
+import traceback
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Tuple
+
+from .aecSpaceGroup import aecSpaceGroup
+from .aecSpaceStore import aecSpaceStore
+
+"""
+aecSpaceBatch runs a generative function once per seed
+across a pool of processes and merges the results.
+"""
+
+class aecSpaceBatch:
+    """
+    Runs a function returning a list of aecSpaces or an aecSpaceGroup once
+    for each delivered seed, seeding the random and numpy.random generators
+    with that seed first so each run is reproducible in any worker process.
+    Each worker returns its spaces as an aecSpaceStore, whose numpy arrays
+    pickle compactly, rather than as a graph of aecSpace, aecPoint, and
+    shapely objects. Results are merged in seed order.
+
+    The function and its arguments must be picklable, so the function must
+    be defined at the top level of a module. Scripts calling run must do so
+    under an if __name__ == '__main__': guard on platforms that start
+    worker processes by importing the calling script.
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        pass
+
+    @staticmethod
+    def runSeed(function: Callable, seed: int, arguments: Tuple = ()) -> aecSpaceStore:
+        """
+        Seeds the random and numpy.random generators with the delivered seed,
+        calls the function with the delivered arguments, and returns the
+        resulting spaces as an aecSpaceStore. Runs in the current process.
+        Returns None on failure.
+        """
+        try:
+            random.seed(seed)
+            numpy.random.seed(seed)
+            return aecSpaceStore(function(*arguments))
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    def run(self, function: Callable, seeds: List[int],
+                  arguments: List[Tuple] = None, workers: int = None) -> aecSpaceGroup:
+        """
+        Runs the function once for each seed and returns
+        the spaces of all runs merged into one aecSpaceGroup.
+        See runStore for the arguments.
+        Returns None on failure.
+        """
+        try:
+            store = self.runStore(function, seeds, arguments, workers)
+            if store is None: return None
+            group = aecSpaceGroup()
+            group.add(store.getSpaces())
+            return group
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    def runStore(self, function: Callable, seeds: List[int],
+                       arguments: List[Tuple] = None, workers: int = None) -> aecSpaceStore:
+        """
+        Runs the function once for each seed and returns the spaces of
+        all runs merged into one aecSpaceStore without creating aecSpaces.
+        If a list of argument tuples is delivered, the function is called
+        with the tuple at the same position as each seed.
+        Runs in a pool of the delivered number of worker processes, defaulting
+        to the number of processors, or in the current process if workers is 1.
+        Returns None on failure, including the failure of any run.
+        """
+        try:
+            seeds = list(seeds)
+            if arguments is None: arguments = [()] * len(seeds)
+            arguments = [tuple(argument) for argument in arguments]
+            if len(arguments) != len(seeds): raise ValueError('Need one argument tuple per seed')
+            functions = [function] * len(seeds)
+            if workers == 1: results = list(map(self.runSeed, functions, seeds, arguments))
+            else:
+                with ProcessPoolExecutor(max_workers = workers) as executor:
+                    results = list(executor.map(self.runSeed, functions, seeds, arguments))
+            store = aecSpaceStore()
+            for result in results:
+                if result is None: return None
+                store.add(result)
+            return store
+        except Exception:
+            traceback.print_exc()
+            return None
+
+# end class
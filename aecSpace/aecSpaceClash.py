@@ -0,0 +1,100 @@
+import numpy
+import shapely
+import traceback
+
+from shapely.strtree import STRtree
+from typing import Iterable, List, NamedTuple
+
+from .aecSpace import aecSpace
+from .aecSpaceGroup import aecSpaceGroup
+
+"""
+aecSpaceClash accepts iterables of aecSpaces or an aecSpaceGroup
+instance and reports the pairs of spaces whose volumes overlap.
+"""
+
+class aecSpaceClash:
+    """
+    Finds overlapping aecSpace prisms in two phases. The broad phase queries
+    an STRtree of all boundaries with every boundary at once for pairs with
+    intersecting bounding boxes, then discards pairs without overlapping levels
+    and elevations. The narrow phase intersects the boundaries of the remaining
+    pairs as arrays, since the overlap of two vertical prisms is exactly the
+    area of their boundary intersection times the overlap of their heights.
+    """
+
+    # Defines a clash data structure listing the indices of two
+    # spaces in the delivered list, the spaces, and their overlap volume.
+
+    clash = \
+        NamedTuple(
+        'clash',
+        [
+            ('index1', int),
+            ('index2', int),
+            ('space1', aecSpace),
+            ('space2', aecSpace),
+            ('volume', float)
+        ])
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        pass
+
+    def getClashes(self, spaces: Iterable[aecSpace], tolerance: float = 0) -> List[clash]:
+        """
+        Accepts any iterable of aecSpaces or an aecSpaceGroup and returns every pair of spaces
+        whose overlap volume exceeds the tolerance, ordered by the indices of the pair.
+        Spaces that only touch do not clash.
+        Returns None on failure.
+        """
+        try:
+            if isinstance(spaces, aecSpaceGroup): spaces = spaces.spaces
+            spaces = list(spaces)
+            if len(spaces) < 2: return []
+            boundaries = numpy.array([space.boundary for space in spaces], dtype = object)
+            levels = numpy.array([space.level for space in spaces], dtype = float)
+            elevations = levels + numpy.array([space.height for space in spaces], dtype = float)
+            index1, index2 = STRtree(boundaries).query(boundaries)
+            pairs = index1 < index2
+            index1 = index1[pairs]
+            index2 = index2[pairs]
+            heights = numpy.minimum(elevations[index1], elevations[index2]) - \
+                      numpy.maximum(levels[index1], levels[index2])
+            pairs = heights > 0
+            index1 = index1[pairs]
+            index2 = index2[pairs]
+            heights = heights[pairs]
+            areas = shapely.area(shapely.intersection(boundaries[index1], boundaries[index2]))
+            volumes = areas * heights
+            pairs = volumes > tolerance
+            index1 = index1[pairs]
+            index2 = index2[pairs]
+            volumes = volumes[pairs]
+            order = numpy.lexsort((index2, index1))
+            return [self.clash(index1 = int(index1[item]),
+                               index2 = int(index2[item]),
+                               space1 = spaces[index1[item]],
+                               space2 = spaces[index2[item]],
+                               volume = float(volumes[item])) for item in order]
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    def getOverlap(self, space1: aecSpace, space2: aecSpace) -> float:
+        """
+        Returns the volume shared by the delivered spaces,
+        or zero if they do not overlap.
+        Returns None on failure.
+        """
+        try:
+            height = min(space1.elevation, space2.elevation) - max(space1.level, space2.level)
+            if height <= 0: return 0.0
+            return space1.boundary.intersection(space2.boundary).area * height
+        except Exception:
+            traceback.print_exc()
+            return None
+
+# end class
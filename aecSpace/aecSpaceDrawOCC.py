@@ -1,19 +1,12 @@
 import traceback
 
-from OCC.Display.SimpleGui import init_display
-import OCC.AIS
-import OCC.Quantity
-from OCC.gp import gp_Pnt
-from OCC.gp import gp_Vec
-
-from OCC.BRepBuilderAPI import BRepBuilderAPI_MakeEdge
-from OCC.BRepBuilderAPI import BRepBuilderAPI_MakeWire
-from OCC.BRepBuilderAPI import BRepBuilderAPI_MakeFace
-from OCC.BRepPrimAPI import BRepPrimAPI_MakePrism
+from .aecSpaceGroup import aecSpaceGroup
 
 """
 aecSpaceDraw accepts lists of aecSpaces or an
 aecSpaceGroup instance to render in pythonOCC.
+pythonOCC is imported by the functions that use it,
+not when this module is imported.
 """
 
 class aecSpaceDrawOCC:
@@ -39,6 +32,48 @@ class aecSpaceDrawOCC:
             traceback.print_exc()
             return None
 
+    def makeCompound(self, spaces):
+        """
+        TopoDS_Compound makeCompound(aecSpaceGroup)
+        Returns a single pythonOCC compound of the prisms of the delivered
+        list of aecSpaces or aecSpaceGroup without opening a display.
+        Returns None on failure.
+        """
+        try:
+            from OCC.BRep import BRep_Builder
+            from OCC.TopoDS import TopoDS_Compound
+            if isinstance(spaces, aecSpaceGroup): spaces = spaces.spaces
+            spaces = list(spaces)
+            builder = BRep_Builder()
+            compound = TopoDS_Compound()
+            builder.MakeCompound(compound)
+            for space in spaces:
+                prism = self.makePrism(space)
+                if prism: builder.Add(compound, prism)
+            return compound
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    def makeCompounds(self, spaces):
+        """
+        {((r, g, b), alpha): TopoDS_Compound} makeCompounds(aecSpaceGroup)
+        Returns a dictionary of pythonOCC compounds of the prisms of the delivered
+        list of aecSpaces or aecSpaceGroup, one for each distinct color and alpha,
+        keyed by the RGB tuple and alpha of the spaces it contains.
+        Returns None on failure.
+        """
+        try:
+            if isinstance(spaces, aecSpaceGroup): spaces = spaces.spaces
+            spaces = list(spaces)
+            groups = {}
+            for space in spaces:
+                groups.setdefault((space.color.color, space.color.alpha), []).append(space)
+            return {key: self.makeCompound(group) for key, group in groups.items()}
+        except Exception:
+            traceback.print_exc()
+            return None
+
     def makeEdges(self, pointPairs):
         """
         [Topo_DS_Edge,] makeEdges([[gp_Pnt, gp_Pnt],])
@@ -46,6 +81,7 @@ class aecSpaceDrawOCC:
         Returns None on failure.
         """
         try:
+            from OCC.BRepBuilderAPI import BRepBuilderAPI_MakeEdge
             edges = []
             for pair in pointPairs:
                 newEdge = BRepBuilderAPI_MakeEdge(pair[0], pair[1])
@@ -84,6 +120,7 @@ class aecSpaceDrawOCC:
         Returns None on failure.
         """
         try:
+            from OCC.gp import gp_Pnt
             points = space.points_floor
             if not points: return None
             return [gp_Pnt(pnt.x, pnt.y, pnt.z) for pnt in points]
@@ -91,6 +128,33 @@ class aecSpaceDrawOCC:
             traceback.print_exc()
             return None
     
+    def makePrism(self, space):
+        """
+        TopoDS_Shape makePrism(aecSpace)
+        Returns a pythonOCC prism extruded by the height of
+        the delivered aecSpace from its floor boundary.
+        Returns None on failure.
+        """
+        try:
+            from OCC.gp import gp_Vec
+            from OCC.BRepBuilderAPI import BRepBuilderAPI_MakeFace
+            from OCC.BRepPrimAPI import BRepPrimAPI_MakePrism
+            points = self.makePoints(space)
+            if not points: return None
+            pointPairs = self.makePointPairs(points)
+            if not pointPairs: return None
+            edges = self.makeEdges(pointPairs)
+            if not edges: return None
+            wire = self.makeWire(edges)
+            if not wire: return None
+            face = BRepBuilderAPI_MakeFace(wire.Wire())
+            if not face: return None
+            vector = gp_Vec(0, 0, space.height)
+            return BRepPrimAPI_MakePrism(face.Face(), vector).Shape()
+        except Exception:
+            traceback.print_exc()
+            return None
+    
     def makeWire(self, edges):
         """
         Topo_DS_Wire makeWire([Topo_DS_Edge, Topo_DS_Edge,...])
@@ -99,6 +163,7 @@ class aecSpaceDrawOCC:
         Returns None on failure.
         """
         try:
+            from OCC.BRepBuilderAPI import BRepBuilderAPI_MakeWire
             wire = BRepBuilderAPI_MakeWire(edges[0])
             del edges[0] 
             for edge in edges:
@@ -108,41 +173,39 @@ class aecSpaceDrawOCC:
             traceback.print_exc()
             return None
     
-    def draw3D(self, spaces, displaySize = (1024, 768), update = False):
+    def draw3D(self, spaces, displaySize = (1024, 768), update = False, batch = True):
         """
         draw3D(aecSpaceGroup)
         Accepts an aecSpaceGroup object and renders its list of aecSpaces to the pythonOCC display.
+        By default the spaces are displayed as one compound per distinct color and alpha,
+        which is far faster than displaying each space. If batch is False, or update is True
+        to animate the display after every space, each space is displayed on its own.
         Returns True on success failure.
         Returns False on failure.
         """
         try:
+            from OCC.Display.SimpleGui import init_display
+            import OCC.Quantity
             if not spaces: return False
-            if type(spaces) != list: spaces = spaces.spaces
+            if isinstance(spaces, aecSpaceGroup): spaces = spaces.spaces
+            spaces = list(spaces)
             if not spaces: return False
             __display, __start_display, __add_menu, __add_function_to_menu = init_display(size = displaySize)            
-            for space in spaces:
-                points = self.makePoints(space)
-                if not points: continue
-                pointPairs = self.makePointPairs(points)
-                if not pointPairs: continue
-                edges = self.makeEdges(pointPairs)
-                if not edges: continue
-                wire = self.makeWire(edges)
-                if not wire: continue
-                face = BRepBuilderAPI_MakeFace(wire.Wire())
-                if not face: continue
-                vector = gp_Vec(0, 0, space.height)
-                spaceVolume = BRepPrimAPI_MakePrism(face.Face(), vector).Shape()
-                if not spaceVolume: continue
-                displayColor = space.color.color_01
+            if batch and not update:
+                shapes = [(compound, color, alpha / 255) 
+                          for (color, alpha), compound in self.makeCompounds(spaces).items()]
+            else:
+                shapes = ((self.makePrism(space), space.color.color, space.color.alpha_01) for space in spaces)
+            for shape, color, transparency in shapes:
+                if not shape: continue
                 spaceColor = OCC.Quantity.Quantity_Color_Name(
-                    displayColor[0],
-                    displayColor[1],
-                    displayColor[2])
+                    color[0] / 255,
+                    color[1] / 255,
+                    color[2] / 255)
                 __display.DisplayShape(
-                        spaceVolume, 
+                        shape, 
                         color = spaceColor,
-                        transparency = space.color.alpha_01,
+                        transparency = transparency,
                         update = update)
             __display.FitAll()
             __start_display()
@@ -152,3 +215,42 @@ class aecSpaceDrawOCC:
             traceback.print_exc()
             return False
 
+    def writeBREP(self, spaces, path):
+        """
+        bool writeBREP(aecSpaceGroup, str)
+        Writes the delivered list of aecSpaces or aecSpaceGroup as a single
+        compound to an OpenCASCADE BREP file at the delivered path.
+        Does not open a display.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            from OCC.BRepTools import breptools_Write
+            compound = self.makeCompound(spaces)
+            if compound is None: return False
+            return bool(breptools_Write(compound, path))
+        except Exception:
+            traceback.print_exc()
+            return False
+
+    def writeSTEP(self, spaces, path):
+        """
+        bool writeSTEP(aecSpaceGroup, str)
+        Writes the delivered list of aecSpaces or aecSpaceGroup as a single
+        compound to a STEP file at the delivered path.
+        Does not open a display.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            from OCC.IFSelect import IFSelect_RetDone
+            from OCC.STEPControl import STEPControl_AsIs, STEPControl_Writer
+            compound = self.makeCompound(spaces)
+            if compound is None: return False
+            writer = STEPControl_Writer()
+            writer.Transfer(compound, STEPControl_AsIs)
+            return writer.Write(path) == IFSelect_RetDone
+        except Exception:
+            traceback.print_exc()
+            return False
+
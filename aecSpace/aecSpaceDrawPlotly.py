@@ -1,49 +1,69 @@
-import plotly.graph_objs as graph
-import plotly
+import numpy
 import traceback
 
 from typing import List
 
+from .aecGeometry import aecGeometry
 from .aecSpace import aecSpace
+from .aecSpaceGroup import aecSpaceGroup
 
 """
 aecSpaceDrawPlotly accepts lists of aecSpaces or an
 aecSpaceGroup instance to render in plotly.
+plotly is imported when drawing, not when this module is imported.
 """
 
 class aecSpaceDrawPlotly:
-   
+    """
+    Renders spaces as one plotly Mesh3d trace per distinct transparency.
+    The meshes of all spaces sharing a transparency are merged into
+    a single vertex and index buffer, and each triangle is colored
+    by the aecColor of its space, so large models are delivered to
+    the browser as a handful of traces rather than one per space.
+    """
+
+    __aecGeometry = aecGeometry()
+
     def __init__(self):
         """
-        aecSpaceDrawOCC Constructor
-        Creates a new aecErrorCheck object.
+        aecSpaceDrawPlotly Constructor
         """
         pass
-   
-    def draw3D(self, spaces: List[aecSpace]) -> bool:
+
+    def draw3D(self, spaces: List[aecSpace], path: str = None) -> bool:
         """
-        Accepts an aecSpaceGroup object and renders its list of aecSpaces to the plotly display.
-        Returns True on success failure.
+        Accepts a list of aecSpaces or an aecSpaceGroup and renders the spaces to the plotly display.
+        If a path is delivered, writes the plot as an HTML file to the path without opening a browser.
+        Returns True on success.
         Returns False on failure.
         """
         try:
+            import plotly.graph_objs as graph
+            import plotly
+            if isinstance(spaces, aecSpaceGroup): spaces = spaces.spaces
+            layers = {}
             for space in spaces:
-                mesh = space.mesh
+                mesh = space.mesh_arrays
+                color = 'rgb({},{},{})'.format(*space.color.color)
+                meshes, colors = layers.setdefault(space.color.alpha, ([], []))
+                meshes.append(mesh)
+                colors.extend([color] * len(mesh.indices))
+            traces = []
+            for alpha, (meshes, colors) in sorted(layers.items()):
+                mesh = self.__aecGeometry.getMeshBatch(meshes)
                 vertices = mesh.vertices
                 indices = mesh.indices
-                xGroup =  [vtx[0] for vtx in vertices]
-                yGroup =  [vtx[1] for vtx in vertices]
-                zGroup =  [vtx[2] for vtx in vertices]
-                iGroup =  [idx[0] for idx in indices]
-                jGroup =  [idx[1] for idx in indices]
-                kGroup =  [idx[2] for idx in indices]            
-                trace = graph.Mesh3d(x = xGroup, y = yGroup, z = zGroup, 
-                                     i = iGroup, j = jGroup, k = kGroup)
-            plotly.offline.plot([trace])           
+                traces.append(graph.Mesh3d(x = vertices[:, 0], y = vertices[:, 1], z = vertices[:, 2],
+                                           i = indices[:, 0], j = indices[:, 1], k = indices[:, 2],
+                                           facecolor = numpy.array(colors),
+                                           opacity = 1.0 - (alpha / 255),
+                                           flatshading = True))
+            figure = graph.Figure(data = traces, layout = graph.Layout(scene = {'aspectmode': 'data'}))
+            if path: plotly.offline.plot(figure, filename = path, auto_open = False)
+            else: plotly.offline.plot(figure)
             return True
         except Exception:
             traceback.print_exc()
             return False
 
 # end class
-
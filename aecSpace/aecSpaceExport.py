@@ -0,0 +1,220 @@
+import json
+import numpy
+import shutil
+import struct
+import tempfile
+import traceback
+
+from typing import Iterable
+
+from .aecGeometry import aecGeometry
+from .aecSpace import aecSpace
+from .aecSpaceGroup import aecSpaceGroup
+
+"""
+aecSpaceExport writes aecSpaces to OBJ, binary STL, and binary
+glTF 2.0 files, consuming any iterable of aecSpaces or an
+aecSpaceGroup one space or one chunk of spaces at a time.
+"""
+
+class aecSpaceExport:
+    """
+    Streams spaces to mesh files without holding the whole model in memory.
+    Each space is meshed through aecSpace.mesh_arrays and written before the
+    next space is read, so memory stays flat for any number of spaces when
+    they are delivered by a generator. Coordinates are written as float32.
+
+    Normals are the outward normals of aecSpace.mesh_arrays,
+    which are flat across each face.
+    """
+
+    __aecGeometry = aecGeometry()
+
+    # Defines a binary STL triangle record.
+
+    __facet = numpy.dtype(
+        [
+            ('normal', '<f4', (3,)),
+            ('vertices', '<f4', (3, 3)),
+            ('attribute', '<u2')
+        ])
+
+    # Defines a rotation from the z-up coordinates of aecSpace
+    # to the y-up coordinates of glTF as an xyzw quaternion.
+
+    __zUp = [-0.7071068, 0.0, 0.0, 0.7071068]
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        pass
+
+    def __getMesh(self, space: aecSpace):
+        """
+        Returns the float32 vertices, uint32 triangle indices, and outward
+        float32 vertex normals of the space, and the unit normal of each triangle.
+        """
+        mesh = space.mesh_arrays
+        return mesh.vertices, mesh.indices, mesh.normals, mesh.normals[mesh.indices[:, 0]]
+
+    def writeGLB(self, spaces: Iterable[aecSpace], path: str, chunk: int = 1024) -> bool:
+        """
+        Writes the spaces to a binary glTF 2.0 file at the delivered path with one
+        packed buffer. Each chunk of spaces becomes one mesh with positions, normals,
+        vertex colors, and indices. Binary data is streamed to a temporary file and
+        copied after the JSON chunk once the whole buffer is known. Transparency
+        is written as vertex color alpha.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            if isinstance(spaces, aecSpaceGroup): spaces = spaces.spaces
+            accessors = []
+            bufferViews = []
+            meshes = []
+            transparent = False
+            with tempfile.TemporaryFile() as binary:
+
+                def addView(data: numpy.ndarray, target: int) -> int:
+                    bufferViews.append({'buffer': 0,
+                                        'byteOffset': binary.tell(),
+                                        'byteLength': data.nbytes,
+                                        'target': target})
+                    binary.write(data.tobytes())
+                    return len(bufferViews) - 1
+
+                def addAccessor(data: numpy.ndarray, target: int, component: int,
+                                kind: str, normalized: bool = False, bounds: bool = False) -> int:
+                    accessor = {'bufferView': addView(data, target),
+                                'componentType': component,
+                                'count': len(data),
+                                'type': kind}
+                    if normalized: accessor['normalized'] = True
+                    if bounds:
+                        accessor['min'] = data.min(axis = 0).tolist()
+                        accessor['max'] = data.max(axis = 0).tolist()
+                    accessors.append(accessor)
+                    return len(accessors) - 1
+
+                def flush(batch: list):
+                    if not batch: return
+                    merged = self.__aecGeometry.getMeshBatch([mesh for mesh, colors in batch])
+                    colors = numpy.concatenate([colors for mesh, colors in batch])
+                    meshes.append(
+                        {'primitives':
+                        [{
+                            'attributes':
+                            {
+                                'POSITION': addAccessor(merged.vertices, 34962, 5126, 'VEC3', bounds = True),
+                                'NORMAL': addAccessor(merged.normals, 34962, 5126, 'VEC3'),
+                                'COLOR_0': addAccessor(colors, 34962, 5121, 'VEC4', normalized = True),
+                            },
+                            'indices': addAccessor(merged.indices.reshape(-1), 34963, 5125, 'SCALAR'),
+                            'material': 0
+                        }]})
+                    batch.clear()
+
+                batch = []
+                for space in spaces:
+                    vertices, indices, normals = self.__getMesh(space)[:3]
+                    color = space.color
+                    transparent = transparent or color.alpha > 0
+                    rgba = tuple(color.color) + (255 - color.alpha,)
+                    colors = numpy.tile(numpy.array(rgba, dtype = numpy.uint8), (len(vertices), 1))
+                    batch.append((self.__aecGeometry.meshArrays(vertices, indices, normals), colors))
+                    if len(batch) >= chunk: flush(batch)
+                flush(batch)
+                length = binary.tell()
+                root = {'rotation': self.__zUp}
+                if meshes: root['children'] = list(range(1, len(meshes) + 1))
+                gltf = \
+                {
+                    'asset': {'version': '2.0', 'generator': 'aecSpace'},
+                    'scene': 0,
+                    'scenes': [{'nodes': [0]}],
+                    'nodes': [root] + [{'mesh': index} for index in range(len(meshes))],
+                    'meshes': meshes,
+                    'materials':
+                    [{
+                        'pbrMetallicRoughness': {'metallicFactor': 0.0, 'roughnessFactor': 1.0},
+                        'alphaMode': 'BLEND' if transparent else 'OPAQUE'
+                    }],
+                    'accessors': accessors,
+                    'bufferViews': bufferViews,
+                    'buffers': [{'byteLength': length}] if length else [],
+                }
+                gltf = {key: value for key, value in gltf.items() if value != []}
+                header = json.dumps(gltf, separators = (',', ':')).encode('utf-8')
+                header += b' ' * (-len(header) % 4)
+                padding = -length % 4
+                total = 12 + 8 + len(header) + (8 + length + padding if length else 0)
+                binary.seek(0)
+                with open(path, 'wb') as file:
+                    file.write(struct.pack('<4sII', b'glTF', 2, total))
+                    file.write(struct.pack('<I4s', len(header), b'JSON'))
+                    file.write(header)
+                    if length:
+                        file.write(struct.pack('<I4s', length + padding, b'BIN\x00'))
+                        shutil.copyfileobj(binary, file)
+                        file.write(bytes(padding))
+            return True
+        except Exception:
+            traceback.print_exc()
+            return False
+
+    def writeOBJ(self, spaces: Iterable[aecSpace], path: str) -> bool:
+        """
+        Writes the spaces to a Wavefront OBJ file at the delivered path
+        as one object per space with vertex normals, named by the space
+        name, or by the position of the space if it has no name.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            if isinstance(spaces, aecSpaceGroup): spaces = spaces.spaces
+            offset = 1
+            with open(path, 'w') as file:
+                file.write('# aecSpace\n')
+                for position, space in enumerate(spaces):
+                    vertices, indices, normals = self.__getMesh(space)[:3]
+                    name = '_'.join(space.name.split()) or 'space{}'.format(position)
+                    file.write('o {}\n'.format(name))
+                    numpy.savetxt(file, vertices, fmt = 'v %.7g %.7g %.7g')
+                    numpy.savetxt(file, normals, fmt = 'vn %.7g %.7g %.7g')
+                    faces = numpy.repeat(indices.astype(numpy.int64) + offset, 2, axis = 1)
+                    numpy.savetxt(file, faces, fmt = 'f %d//%d %d//%d %d//%d')
+                    offset += len(vertices)
+            return True
+        except Exception:
+            traceback.print_exc()
+            return False
+
+    def writeSTL(self, spaces: Iterable[aecSpace], path: str) -> bool:
+        """
+        Writes the spaces to a binary STL file at the delivered path,
+        writing the triangle count into the header once all spaces are written.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            if isinstance(spaces, aecSpaceGroup): spaces = spaces.spaces
+            count = 0
+            with open(path, 'wb') as file:
+                file.write(b'aecSpace binary STL'.ljust(80, b' '))
+                file.write(struct.pack('<I', 0))
+                for space in spaces:
+                    vertices, indices, normals, faceNormals = self.__getMesh(space)
+                    facets = numpy.zeros(len(indices), dtype = self.__facet)
+                    facets['normal'] = faceNormals
+                    facets['vertices'] = vertices[indices]
+                    file.write(facets.tobytes())
+                    count += len(facets)
+                file.seek(80)
+                file.write(struct.pack('<I', count))
+            return True
+        except Exception:
+            traceback.print_exc()
+            return False
+
+# end class
@@ -1,29 +1,207 @@
+import numpy
 import traceback
 
-from typing import List, Tuple
-from uuid import uuid4
+from typing import Dict, List, NamedTuple, Tuple
+
+from shapely import geometry as shapely
+from shapely.strtree import STRtree
 
 from .aecGeometry import aecGeometry
+from .aecID import aecID
 from .aecPoint import aecPoint
+from .aecPointArray import aecPointArray
 from .aecSpace import aecSpace
+from .aecSpaceStore import aecSpaceStore
 
 class aecSpaceGroup:
     """
     Manages multiple aecSpace instances as a single object, 
     enabling collective editing and reporting.
+
+    Spatial queries use a shapely STRtree over the space boundaries with
+    arrays of space levels and elevations, built on the first query after
+    the group changes. Call reindex after editing member spaces directly.
+    Set aecSpaceGroup.indexing to False to scan all spaces on every query.
+
+    Total area and volume, and their breakdowns by level and by name, are kept
+    as running sums updated by each group method that adds, deletes, or changes
+    spaces, so reading them costs the same for any number of spaces.
+    reindex also recomputes the sums after member spaces are edited directly.
     """
+    indexing = True
+
+    __aecID = aecID()
+
+    # Defines an aggregate data structure listing the
+    # count, total area, and total volume of a set of spaces.
 
-    __slots__ = ['__aecGeometry', '__ID', '__name', '__spaces']
+    aggregate = \
+        NamedTuple(
+        'aggregate',
+        [
+            ('count', int),
+            ('area', float),
+            ('volume', float)
+        ])
+
+    __slots__ = ['__aecGeometry', '__ID', '__index', '__name', '__records', '__spaces', '__sums']
       
     def __init__(self, x:float = 0, y:float = 0, z:float = 0):
         """
         Constructor defaults to origin point coordinates.
         """
         self.__aecGeometry = aecGeometry()
-        self.__ID = str(uuid4())
+        self.__ID = None
+        self.__index = None
         self.__name = ''
+        self.__records = []
         self.__spaces = []
+        self.__sums = {None: [0, 0.0, 0.0]}
+
+    def __addRecord(self, space: aecSpace) -> Tuple[float, float, float, str]:
+        """
+        Adds the area and volume of the space to the group sums and
+        returns the record of what was added, for removing it later.
+        """
+        record = (space.area, space.volume, space.level, space.name)
+        self.__addSums(record, 1)
+        return record
+
+    def __addSums(self, record: Tuple[float, float, float, str], sign: int):
+        """
+        Adds a space record to the group sums and to the sums of its level
+        and name, or subtracts it if the sign is negative, discarding sums
+        that no longer count any space.
+        """
+        area, volume, level, name = record
+        sums = self.__sums
+        for key in (None, ('level', level), ('name', name)):
+            entry = sums.get(key)
+            if entry is None: entry = sums[key] = [0, 0.0, 0.0]
+            entry[0] += sign
+            entry[1] += sign * area
+            entry[2] += sign * volume
+            if entry[0] == 0 and key is not None: del sums[key]
+        if sums[None][0] == 0: sums[None] = [0, 0.0, 0.0]
+
+    def __getIndex(self) -> Tuple[List[aecSpace], STRtree, numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the spatial index of the spaces as a tuple of the indexed spaces,
+        an STRtree over their boundaries, and arrays of their levels and elevations,
+        rebuilding it if the group has changed since it was built.
+        Returns None if indexing is disabled.
+        """
+        if not self.indexing: return None
+        index = self.__index
+        if index is None or len(index[0]) != len(self.__spaces):
+            spaces = list(self.__spaces)
+            levels = numpy.array([space.level for space in spaces], dtype = float)
+            heights = numpy.array([space.height for space in spaces], dtype = float)
+            tree = STRtree([space.boundary for space in spaces])
+            index = (spaces, tree, levels, levels + heights)
+            self.__index = index
+        return index
+
+    def __getSums(self) -> dict:
+        """
+        Returns the group sums, rebuilding them from every space if the
+        group has changed in a way the sums could not follow.
+        """
+        if self.__records is None or len(self.__records) != len(self.__spaces):
+            self.__sums = {None: [0, 0.0, 0.0]}
+            self.__records = [self.__addRecord(space) for space in self.__spaces]
+        return self.__sums
+
+    def __query(self, shape, level: float = None, elevation: float = None) -> List[aecSpace]:
+        """
+        Returns the spaces with boundaries intersecting the delivered shapely
+        geometry, in group order, and with a vertical extent overlapping the 
+        delivered level and elevation, where either limit may be omitted. 
+        """
+        index = self.__getIndex()
+        if index is None:
+            found = []
+            for space in self.__spaces:
+                if level is not None and space.elevation < level: continue
+                if elevation is not None and space.level > elevation: continue
+                if space.boundary.intersects(shape): found.append(space)
+            return found
+        spaces, tree, levels, elevations = index
+        found = numpy.sort(tree.query(shape, predicate = 'intersects'))
+        if level is not None: found = found[elevations[found] >= level]
+        if elevation is not None: found = found[levels[found] <= elevation]
+        return [spaces[item] for item in found]
+
+    def __recount(self, indices: List[int] = None):
+        """
+        Replaces the records of the spaces at the delivered indices, or of
+        all spaces if no indices are delivered, after the spaces have changed.
+        """
+        records = self.__records
+        if records is None or len(records) != len(self.__spaces): return
+        if indices is None: indices = range(len(records))
+        for index in indices:
+            self.__addSums(records[index], -1)
+            records[index] = self.__addRecord(self.__spaces[index])
+
+    def __transform(self, matrix: numpy.ndarray, pivots: numpy.ndarray = None) -> bool:
+        """
+        Applies a 3x3 affine matrix to the boundaries of all spaces at once
+        by transforming a single stacked array of their coordinates.
+        If pivots are delivered as one 2D point per space, the matrix is
+        applied relative to each space's pivot.
+        Boundaries are not revalidated, since a non-degenerate affine
+        transformation preserves colinearity and convexity.
+        """
+        spaces = self.__spaces
+        if not spaces: return True
+        boundaries = [space.points_floor.xy_array for space in spaces]
+        counts = [len(boundary) for boundary in boundaries]
+        coords = numpy.concatenate(boundaries)
+        linear = matrix[:2, :2]
+        if pivots is None: coords = (coords @ linear.T) + matrix[:2, 2]
+        else:
+            pivots = numpy.repeat(numpy.asarray(pivots, dtype = float), counts, axis = 0)
+            coords = ((coords - pivots) @ linear.T) + pivots + matrix[:2, 2]
+        mirrored = numpy.linalg.det(linear) < 0
+        start = 0
+        for space, count in zip(spaces, counts):
+            points = coords[start:start + count]
+            if mirrored: points = points[::-1]
+            if not space.setBoundary(points, validate = False): return False
+            start += count
+        return True
         
+    @property
+    def aggregate_level(self) -> Dict[float, aggregate]:
+        """
+        Property
+        Returns a dictionary of the count, area, and volume of spaces by level.
+        Returns None on failure.
+        """
+        try:
+            sums = self.__getSums()
+            return {key[1]: self.aggregate(*entry) for key, entry in sums.items() 
+                    if key is not None and key[0] == 'level'}
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    @property
+    def aggregate_name(self) -> Dict[str, aggregate]:
+        """
+        Property
+        Returns a dictionary of the count, area, and volume of spaces by name.
+        Returns None on failure.
+        """
+        try:
+            sums = self.__getSums()
+            return {key[1]: self.aggregate(*entry) for key, entry in sums.items() 
+                    if key is not None and key[0] == 'name'}
+        except Exception:
+            traceback.print_exc()
+            return None
+
     @property
     def area(self) -> float:
         """
@@ -32,9 +210,7 @@ class aecSpaceGroup:
         Return None on failure.
         """
         try:
-            space_area = 0
-            for space in self.__spaces: space_area += space.area
-            return space_area
+            return self.__getSums()[None][1]
         except Exception:
             traceback.print_exc()
             return None   
@@ -63,8 +239,21 @@ class aecSpaceGroup:
             return len(self.__spaces)
         except Exception:
             traceback.print_exc()
-            return None   
-        
+            return None
+
+    @property
+    def ID(self) -> str:
+        """
+        Property
+        Returns the UUID, generating it on first access.
+        """
+        try:
+            if not self.__ID: self.__ID = self.__aecID.make()
+            return self.__ID
+        except Exception:
+            traceback.print_exc()
+            return None
+
     @property
     def indices(self) -> List[int]:
         """
@@ -76,7 +265,21 @@ class aecSpaceGroup:
             return list(range(0, len(self.__spaces)))
         except Exception:
             traceback.print_exc()
-            return None    
+            return None
+
+    @property
+    def mesh_arrays(self) -> aecGeometry.meshArrays:
+        """
+        Property
+        Returns a single mesh of all spaces as combined numpy arrays of
+        float32 vertices, uint32 triangle indices, and float32 normals.
+        Returns None on failure.
+        """
+        try:
+            return self.__aecGeometry.getMeshBatch([space.mesh_arrays for space in self.__spaces])
+        except Exception:
+            traceback.print_exc()
+            return None
 
     @property
     def name(self) -> str:
@@ -125,6 +328,8 @@ class aecSpaceGroup:
         Returns None on failure.
         """
         try:
+            self.__index = None
+            self.__records = None
             preSpaces = self.__spaces
             self.__spaces = value
         except Exception:
@@ -140,9 +345,7 @@ class aecSpaceGroup:
         Returns None on failure.
         """
         try:
-            space_volume = 0
-            for space in self.__spaces: space_volume += space.volume
-            return space_volume
+            return self.__getSums()[None][2]
         except Exception:
             traceback.print_exc()
             return None    
@@ -154,7 +357,12 @@ class aecSpaceGroup:
         Returns False on failure.
         """
         try:
-            for space in spaces: self.__spaces.append(space)
+            self.__index = None
+            records = self.__records
+            if records is not None and len(records) != len(self.__spaces): records = None
+            for space in spaces: 
+                self.__spaces.append(space)
+                if records is not None: records.append(self.__addRecord(space))
             return True
         except Exception:
             traceback.print_exc()
@@ -167,7 +375,10 @@ class aecSpaceGroup:
         Returns False on failure.
         """
         try:
+            self.__index = None
+            self.__records = []
             self.__spaces = []
+            self.__sums = {None: [0, 0.0, 0.0]}
             return True
         except Exception:
             traceback.print_exc()
@@ -180,16 +391,66 @@ class aecSpaceGroup:
         Returns False if the spaces list is empty or on other failure.
         """
         try:
+            self.__index = None
             index = int(index)
-            spaces = self.spaces()
-            if index > len(spaces) or index < 0 - 1: return False
+            spaces = self.__spaces
+            if index >= len(spaces) or index < 0 - len(spaces): return False
+            records = self.__records
+            if records is not None and len(records) == len(spaces): 
+                self.__addSums(records[index], -1)
+                del records[index]
+            else: self.__records = None
             del spaces[index]
-            self.__spaces = spaces
             return True
         except Exception:
             traceback.print_exc()
             return False
         
+    def dumps(self) -> bytes:
+        """
+        Returns the spaces in the binary format of aecSpaceStore.
+        Returns None on failure.
+        """
+        try:
+            return aecSpaceStore(self.__spaces).dumps()
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    @staticmethod
+    def load(path: str) -> 'aecSpaceGroup':
+        """
+        Returns a new group of the spaces read from
+        a file in the binary format of aecSpaceStore.
+        Returns None on failure.
+        """
+        try:
+            store = aecSpaceStore.load(path)
+            if store is None: return None
+            group = aecSpaceGroup()
+            group.add(store.getSpaces())
+            return group
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    @staticmethod
+    def loads(data: bytes) -> 'aecSpaceGroup':
+        """
+        Returns a new group of the spaces read from a
+        bytes-like object in the binary format of aecSpaceStore.
+        Returns None on failure.
+        """
+        try:
+            store = aecSpaceStore.loads(data)
+            if store is None: return None
+            group = aecSpaceGroup()
+            group.add(store.getSpaces())
+            return group
+        except Exception:
+            traceback.print_exc()
+            return None
+
     def moveBy(self, x: float = 0, y: float = 0, z: float = 0, index: int = None) -> bool:
         """
         Moves the indicated space by the delivered x, y, and z displacements.
@@ -198,13 +459,18 @@ class aecSpaceGroup:
         Returns False on failure.
         """
         try:
+            self.__index = None
             if index:
                 index = int(index)
-                spaces = self.spaces()
+                spaces = self.__spaces
                 if index > len(spaces) or index < 0 - 1: return False
                 self.__spaces[index].moveBy(x, y, z)
+                if z: self.__recount([index])
             else:
-                for space in self.__spaces: space.moveBy(x, y, z)
+                if (x or y) and not self.__transform(self.__aecGeometry.getMatrixMove(x, y)): return False
+                if z:
+                    for space in self.__spaces: space.level += z
+                    self.__recount()
             return True
         except Exception:
             traceback.print_exc()
@@ -218,18 +484,55 @@ class aecSpaceGroup:
         Returns False on failure.
         """        
         try:
+            self.__index = None
             if index:
                 index = int(index)
-                spaces = self.spaces()
+                spaces = self.__spaces
                 if index > len(spaces) or index < 0 - 1: return False
                 self.__spaces[index].moveTo(fromPnt, toPnt)
+                if fromPnt.z != toPnt.z: self.__recount([index])
             else:
                 for space in self.__spaces: space.moveTo(fromPnt, toPnt)
+                if fromPnt.z != toPnt.z: self.__recount()
             return True
         except Exception:
             traceback.print_exc()
             return False          
 
+    def nearest(self, point: aecPoint) -> aecSpace:
+        """
+        Returns the space with the boundary nearest to the delivered point on the
+        shared zero plane, or a space containing the point if any does.
+        Ties between equally near spaces are broken arbitrarily.
+        Returns None if the group is empty or on other failure.
+        """
+        try:
+            if not self.__spaces: return None
+            shape = shapely.Point(point.x, point.y)
+            index = self.__getIndex()
+            if index is None: 
+                return min(self.__spaces, key = lambda space: space.boundary.distance(shape))
+            return index[0][int(index[1].nearest(shape))]
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    def reindex(self) -> bool:
+        """
+        Discards the spatial index and the area and volume sums
+        so the next query or report rebuilds them. Call after editing
+        member spaces directly rather than through the group.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            self.__index = None
+            self.__records = None
+            return True
+        except Exception:
+            traceback.print_exc()
+            return False
+
     def rotate(self, angle: float, point: aecPoint = None, index: int = None) -> bool:
         """
         Rotates the indicated space by the delivered angle in degrees.
@@ -239,18 +542,33 @@ class aecSpaceGroup:
         Returns False on failure.
         """     
         try:
+            self.__index = None
             if index:
                 index = int(index)
-                spaces = self.spaces()
+                spaces = self.__spaces
                 if index > len(spaces) or index < 0 - 1: return False
                 self.__spaces[index].rotate(angle, point)
             else:
-                for space in self.__spaces: space.rotate(angle, point)
+                if point: return self.__transform(self.__aecGeometry.getMatrixRotate(angle, point))
+                pivots = [space.centroid_floor.xy for space in self.__spaces]
+                return self.__transform(self.__aecGeometry.getMatrixRotate(angle), pivots)
             return True
         except Exception:
             traceback.print_exc()
             return False                 
 
+    def save(self, path: str) -> bool:
+        """
+        Writes the spaces to a file in the binary format of aecSpaceStore.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            return aecSpaceStore(self.__spaces).save(path)
+        except Exception:
+            traceback.print_exc()
+            return False
+
     def scale(self, x: float = 1, y: float = 1, z: float = 1, 
                     point: aecPoint = None, index: int = None) -> bool:
         """
@@ -261,13 +579,23 @@ class aecSpaceGroup:
         Returns False on failure.
         """
         try:
+            self.__index = None
             if index:
                 index = int(index)
                 spaces = self.spaces
                 if index > len(spaces) - 1 or index < 0: return False
                 self.__spaces[index].scale(x, y, z, point)
-            else:            
+                self.__recount([index])
+            elif x == 0 or y == 0:
                 for space in self.__spaces: space.scale(x, y, z, point)
+                self.__recount()
+            else:
+                if point: matrix = self.__aecGeometry.getMatrixScale(x, y, point)
+                else: matrix = self.__aecGeometry.getMatrixScale(x, y)
+                pivots = None if point else [space.centroid_floor.xy for space in self.__spaces]
+                if not self.__transform(matrix, pivots): return False
+                for space in self.__spaces: space.height *= float(z)
+                self.__recount()
             return True
         except Exception:
             traceback.print_exc()
@@ -283,7 +611,7 @@ class aecSpaceGroup:
         try:
             if index:
                 index = int(index)
-                spaces = self.spaces()
+                spaces = self.__spaces
                 if index > len(spaces) or index < 0 - 1: return False
                 self.__spaces[index].alpha = alpha
             else:            
@@ -303,7 +631,7 @@ class aecSpaceGroup:
         try:
             if index:
                 index = int(index)
-                spaces = self.spaces()
+                spaces = self.__spaces
                 if index > len(spaces) or index < 0 - 1: return False
                 self.__spaces[index].color = color
             else:            
@@ -321,13 +649,16 @@ class aecSpaceGroup:
         Returns False on failure.
         """
         try:
+            self.__index = None
             if index:
                 index = int(index)
-                spaces = self.spaces()
+                spaces = self.__spaces
                 if index > len(spaces) or index < 0 - 1: return False
                 self.__spaces[index].height = value
+                self.__recount([index])
             else:            
                 for space in self.__spaces: space.height = value
+                self.__recount()
             return True
         except Exception:
             traceback.print_exc()
@@ -341,13 +672,16 @@ class aecSpaceGroup:
         Returns False on failure.
         """
         try:
+            self.__index = None
             if index:
                 index = int(index)
-                spaces = self.spaces()
+                spaces = self.__spaces
                 if index > len(spaces) or index < 0 - 1: return False
                 self.__spaces[index].level = value
+                self.__recount([index])
             else:            
                 for space in self.__spaces: space.level = value
+                self.__recount()
             return True
         except Exception:
             traceback.print_exc()
@@ -363,16 +697,46 @@ class aecSpaceGroup:
         try:
             if index:
                 index = int(index)
-                spaces = self.spaces()
+                spaces = self.__spaces
                 if index > len(spaces) or index < 0 - 1: return False
                 self.__spaces[index].name = value
+                self.__recount([index])
             else:            
                 for space in self.__spaces: space.name = value
+                self.__recount()
             return True
         except Exception:
             traceback.print_exc()
             return False  
         
+    def spacesAt(self, point: aecPoint) -> List[aecSpace]:
+        """
+        Returns the spaces enclosing the delivered point, including spaces
+        with the point on their boundary, floor, or ceiling.
+        Returns None on failure.
+        """
+        try:
+            return self.__query(shapely.Point(point.x, point.y), point.z, point.z)
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    def spacesIntersecting(self, points: List[aecPoint], 
+                                 level: float = None, elevation: float = None) -> List[aecSpace]:
+        """
+        Returns the spaces with boundaries intersecting the delivered boundary
+        and a vertical extent overlapping the delivered level and elevation,
+        including spaces that only touch. If no level or elevation is delivered,
+        the corresponding vertical limit is ignored.
+        Returns None on failure.
+        """
+        try:
+            shape = shapely.Polygon(aecPointArray(points).xy_array)
+            return self.__query(shape, level, elevation)
+        except Exception:
+            traceback.print_exc()
+            return None
+        
     def wrap(self, points: List[aecPoint], index: int = None) -> bool:
         """
         Wraps the indicated space around the delivered points as a convex hull.
@@ -381,13 +745,16 @@ class aecSpaceGroup:
         Returns False on failure.
         """     
         try:
+            self.__index = None
             if index:
                 index = int(index)
-                spaces = self.spaces()
+                spaces = self.__spaces
                 if index > len(spaces) or index < 0 - 1: return False
                 self.__spaces[index].wrap(points)
+                self.__recount([index])
             else:
                 for space in self.__spaces: space.wrap(points)
+                self.__recount()
             return True
         except Exception:
             traceback.print_exc()
@@ -0,0 +1,506 @@
+import numpy
+import struct
+import traceback
+
+from typing import Iterable, List, Tuple
+
+from .aecPointArray import aecPointArray
+from .aecSpace import aecSpace
+
+"""
+aecSpaceStore holds the data of many aecSpaces as columns of
+numpy arrays and reports on all of them at once.
+"""
+
+class aecSpaceStore:
+    """
+    Stores spaces as a structure of arrays: one array each for levels, heights,
+    convexity, colors, alphas, and addresses, with names stored once and referenced
+    by integer codes. Boundaries share a single ragged (M, 2) coordinate buffer,
+    with the boundary of space i at coords[offsets[i]:offsets[i + 1]].
+    aecSpace objects are created only when requested, and area, volume, bounds,
+    and centroid reports are computed for all spaces at once from the buffer.
+
+    dumps and save write the store in a little-endian binary format:
+    a 64 byte header, a metadata table with one record per space, the
+    boundary coordinates as packed (M, 2) float64 values, and a string table
+    of the unique names as UTF-8 bytes preceded by their uint64 end offsets.
+    Each section starts on an 8 byte boundary. loads and load read the
+    coordinates with numpy.frombuffer, so they share the delivered buffer.
+    """
+
+    # Defines the binary header: format tag, version, reserved, the counts of
+    # spaces, coordinates, and names, the byte offsets of the metadata table,
+    # coordinates, and string table, and the byte length of the name strings.
+
+    __header = struct.Struct('<4sHHQQQQQQQ')
+    __tag = b'AECS'
+    __version = 1
+
+    # Defines a metadata record listing the first coordinate and coordinate count
+    # of the boundary, the name code, level, height, bounds, color, alpha,
+    # convexity, and address of a space.
+
+    __record = numpy.dtype(
+        [
+            ('offset', '<u8'),
+            ('count', '<u4'),
+            ('name', '<u4'),
+            ('level', '<f8'),
+            ('height', '<f8'),
+            ('bounds', '<f8', (4,)),
+            ('color', 'u1', (3,)),
+            ('alpha', 'u1'),
+            ('convex', 'u1'),
+            ('address', '<i4', (3,))
+        ], align = True)
+
+    __slots__ = \
+    [
+        '__addresses',
+        '__alphas',
+        '__colors',
+        '__convex',
+        '__coords',
+        '__heights',
+        '__levels',
+        '__nameCodes',
+        '__names',
+        '__offsets',
+    ]
+
+    def __init__(self, spaces: List[aecSpace] = None):
+        """
+        Constructor creates an empty store,
+        or a store of the delivered spaces.
+        """
+        self.__addresses = numpy.zeros((0, 3), dtype = numpy.int32)
+        self.__alphas = numpy.zeros(0, dtype = numpy.uint8)
+        self.__colors = numpy.zeros((0, 3), dtype = numpy.uint8)
+        self.__convex = numpy.zeros(0, dtype = bool)
+        self.__coords = numpy.zeros((0, 2), dtype = float)
+        self.__heights = numpy.zeros(0, dtype = float)
+        self.__levels = numpy.zeros(0, dtype = float)
+        self.__nameCodes = numpy.zeros(0, dtype = numpy.int32)
+        self.__names = []
+        self.__offsets = numpy.zeros(1, dtype = numpy.int64)
+        if spaces: self.add(spaces)
+
+    def __len__(self) -> int:
+        """
+        Returns the count of stored spaces.
+        """
+        return len(self.__levels)
+
+    def __getShoelace(self) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the coordinates of every boundary relative to its first point,
+        with the cross product of each point and the next point around its boundary,
+        in which the relative coordinates keep precision far from the origin.
+        """
+        starts = self.__offsets[:-1]
+        counts = numpy.diff(self.__offsets)
+        following = numpy.arange(1, len(self.__coords) + 1)
+        following[self.__offsets[1:] - 1] = starts
+        coords = self.__coords - numpy.repeat(self.__coords[starts], counts, axis = 0)
+        xCoords = coords[:, 0]
+        yCoords = coords[:, 1]
+        cross = (xCoords * yCoords[following]) - (xCoords[following] * yCoords)
+        return coords, following, cross
+
+    @property
+    def area(self) -> float:
+        """
+        Property
+        Returns the total area of all stored spaces.
+        Returns None on failure.
+        """
+        try:
+            return float(numpy.sum(self.areas))
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    @property
+    def areas(self) -> numpy.ndarray:
+        """
+        Property
+        Returns an array of the area of each stored space.
+        Returns None on failure.
+        """
+        try:
+            if not len(self): return numpy.zeros(0)
+            cross = self.__getShoelace()[2]
+            return numpy.add.reduceat(cross, self.__offsets[:-1]) * 0.5
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    @property
+    def bounds(self) -> numpy.ndarray:
+        """
+        Property
+        Returns an (N, 4) array of the minimum x, minimum y,
+        maximum x, and maximum y of each stored boundary.
+        Returns None on failure.
+        """
+        try:
+            if not len(self): return numpy.zeros((0, 4))
+            starts = self.__offsets[:-1]
+            return numpy.column_stack(
+                (numpy.minimum.reduceat(self.__coords, starts),
+                 numpy.maximum.reduceat(self.__coords, starts)))
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    @property
+    def centroids(self) -> numpy.ndarray:
+        """
+        Property
+        Returns an (N, 2) array of the centroid of each stored boundary.
+        Returns None on failure.
+        """
+        try:
+            if not len(self): return numpy.zeros((0, 2))
+            starts = self.__offsets[:-1]
+            coords, following, cross = self.__getShoelace()
+            moments = (coords + coords[following]) * cross[:, None]
+            sums = numpy.add.reduceat(moments, starts)
+            areas = numpy.add.reduceat(cross, starts) * 3
+            return (sums / areas[:, None]) + self.__coords[starts]
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    @property
+    def count(self) -> int:
+        """
+        Property
+        Returns the count of stored spaces.
+        Returns None on failure.
+        """
+        try:
+            return len(self)
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    @property
+    def elevations(self) -> numpy.ndarray:
+        """
+        Property
+        Returns an array of the ceiling elevation of each stored space.
+        Returns None on failure.
+        """
+        try:
+            return self.__levels + self.__heights
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    @property
+    def heights(self) -> numpy.ndarray:
+        """
+        Property
+        Returns a read-only array of the height of each stored space.
+        Returns None on failure.
+        """
+        try:
+            heights = self.__heights.view()
+            heights.flags.writeable = False
+            return heights
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    @property
+    def levels(self) -> numpy.ndarray:
+        """
+        Property
+        Returns a read-only array of the level of each stored space.
+        Returns None on failure.
+        """
+        try:
+            levels = self.__levels.view()
+            levels.flags.writeable = False
+            return levels
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    @property
+    def names(self) -> List[str]:
+        """
+        Property
+        Returns a list of the name of each stored space.
+        Returns None on failure.
+        """
+        try:
+            return [self.__names[code] for code in self.__nameCodes]
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    @property
+    def volume(self) -> float:
+        """
+        Property
+        Returns the total volume of all stored spaces.
+        Returns None on failure.
+        """
+        try:
+            return float(numpy.sum(self.volumes))
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    @property
+    def volumes(self) -> numpy.ndarray:
+        """
+        Property
+        Returns an array of the volume of each stored space.
+        Returns None on failure.
+        """
+        try:
+            return self.areas * self.__heights
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    def add(self, spaces: Iterable[aecSpace]) -> bool:
+        """
+        Appends the data of any iterable of aecSpaces, an aecSpaceGroup,
+        or another aecSpaceStore to the store.
+        aecSpaceGroup is imported here because it imports this module.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            from .aecSpaceGroup import aecSpaceGroup
+            if isinstance(spaces, aecSpaceStore):
+                return self.__addStore(spaces)
+            if isinstance(spaces, aecSpaceGroup): spaces = spaces.spaces
+            spaces = list(spaces)
+            if not spaces: return True
+            names = {name: code for code, name in enumerate(self.__names)}
+            codes = []
+            for space in spaces:
+                code = names.get(space.name)
+                if code is None:
+                    code = len(self.__names)
+                    names[space.name] = code
+                    self.__names.append(space.name)
+                codes.append(code)
+            boundaries = [space.points_floor.xy_array for space in spaces]
+            counts = [len(boundary) for boundary in boundaries]
+            addresses = [(list(space.address) + [0, 0, 0])[:3] for space in spaces]
+            self.__addresses = numpy.concatenate((self.__addresses, numpy.array(addresses, dtype = numpy.int32)))
+            self.__alphas = numpy.concatenate((self.__alphas, [space.color.alpha for space in spaces])).astype(numpy.uint8)
+            self.__colors = numpy.concatenate((self.__colors, [space.color.color for space in spaces])).astype(numpy.uint8)
+            self.__convex = numpy.concatenate((self.__convex, [space.convex for space in spaces])).astype(bool)
+            self.__coords = numpy.concatenate([self.__coords] + boundaries)
+            self.__heights = numpy.concatenate((self.__heights, [space.height for space in spaces]))
+            self.__levels = numpy.concatenate((self.__levels, [space.level for space in spaces]))
+            self.__nameCodes = numpy.concatenate((self.__nameCodes, codes)).astype(numpy.int32)
+            self.__offsets = numpy.concatenate((self.__offsets, self.__offsets[-1] + numpy.cumsum(counts)))
+            return True
+        except Exception:
+            traceback.print_exc()
+            return False
+
+    def __addStore(self, store: 'aecSpaceStore') -> bool:
+        """
+        Appends the arrays of another store, remapping its name codes.
+        """
+        names = {name: code for code, name in enumerate(self.__names)}
+        remap = []
+        for name in store.__names:
+            code = names.get(name)
+            if code is None:
+                code = len(self.__names)
+                names[name] = code
+                self.__names.append(name)
+            remap.append(code)
+        remap = numpy.array(remap, dtype = numpy.int32)
+        self.__addresses = numpy.concatenate((self.__addresses, store.__addresses))
+        self.__alphas = numpy.concatenate((self.__alphas, store.__alphas))
+        self.__colors = numpy.concatenate((self.__colors, store.__colors))
+        self.__convex = numpy.concatenate((self.__convex, store.__convex))
+        self.__coords = numpy.concatenate((self.__coords, store.__coords))
+        self.__heights = numpy.concatenate((self.__heights, store.__heights))
+        self.__levels = numpy.concatenate((self.__levels, store.__levels))
+        self.__nameCodes = numpy.concatenate((self.__nameCodes, remap[store.__nameCodes]))
+        self.__offsets = numpy.concatenate((self.__offsets, self.__offsets[-1] + store.__offsets[1:]))
+        return True
+
+    def dumps(self) -> bytes:
+        """
+        Returns the store in the binary format.
+        Returns None on failure.
+        """
+        try:
+            count = len(self)
+            names = [name.encode('utf-8') for name in self.__names]
+            nameEnds = numpy.cumsum([len(name) for name in names], dtype = '<u8')
+            table = numpy.zeros(count, dtype = self.__record)
+            table['offset'] = self.__offsets[:-1]
+            table['count'] = numpy.diff(self.__offsets)
+            table['name'] = self.__nameCodes
+            table['level'] = self.__levels
+            table['height'] = self.__heights
+            table['bounds'] = self.bounds
+            table['color'] = self.__colors
+            table['alpha'] = self.__alphas
+            table['convex'] = self.__convex
+            table['address'] = self.__addresses
+            tableOffset = self.__header.size
+            coordOffset = tableOffset + (-(-table.nbytes // 8) * 8)
+            stringOffset = coordOffset + (len(self.__coords) * 16)
+            header = self.__header.pack(self.__tag, self.__version, 0, count, len(self.__coords), len(names),
+                                        tableOffset, coordOffset, stringOffset, int(sum(len(name) for name in names)))
+            return b''.join(
+                [
+                    header,
+                    table.tobytes(),
+                    bytes(coordOffset - tableOffset - table.nbytes),
+                    numpy.ascontiguousarray(self.__coords, dtype = '<f8').tobytes(),
+                    nameEnds.tobytes(),
+                    b''.join(names)
+                ])
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    @staticmethod
+    def fromTable(table: numpy.ndarray, coords: numpy.ndarray, names: List[str]) -> 'aecSpaceStore':
+        """
+        Returns a new store of the spaces in a metadata table as returned by unpack,
+        whose records list their boundaries in order in the delivered coordinates.
+        The store uses the delivered coordinates without copying them.
+        Returns None on failure.
+        """
+        try:
+            store = aecSpaceStore()
+            if not len(table): return store
+            last = table[-1]
+            store.__addresses = table['address']
+            store.__alphas = table['alpha']
+            store.__colors = table['color']
+            store.__convex = table['convex'].astype(bool)
+            store.__coords = coords
+            store.__heights = table['height']
+            store.__levels = table['level']
+            store.__nameCodes = table['name'].astype(numpy.int32)
+            store.__names = list(names)
+            store.__offsets = numpy.append(table['offset'], last['offset'] + last['count']).astype(numpy.int64)
+            return store
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    def getSpace(self, index: int) -> aecSpace:
+        """
+        Returns a new aecSpace from the data stored at the delivered index.
+        The stored boundary is trusted and is not revalidated.
+        Returns None on failure.
+        """
+        try:
+            index = int(index)
+            if index < 0: index += len(self)
+            if index < 0 or index >= len(self): return None
+            points = aecPointArray(self.__coords[self.__offsets[index]:self.__offsets[index + 1]])
+            space = aecSpace.fromTrusted(points, self.__convex[index])
+            if space is None: return None
+            space.address = tuple(int(value) for value in self.__addresses[index])
+            space.color = tuple(int(value) for value in self.__colors[index])
+            space.color.alpha = int(self.__alphas[index])
+            space.height = float(self.__heights[index])
+            space.level = float(self.__levels[index])
+            space.name = self.__names[self.__nameCodes[index]]
+            return space
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    def getSpaces(self, indices: List[int] = None) -> List[aecSpace]:
+        """
+        Returns a list of new aecSpaces from the data stored at the
+        delivered indices, or for all stored spaces if no indices are delivered.
+        Returns None on failure.
+        """
+        try:
+            if indices is None: indices = range(len(self))
+            return [self.getSpace(index) for index in indices]
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    @staticmethod
+    def load(path: str) -> 'aecSpaceStore':
+        """
+        Returns a new store read from a file in the binary format.
+        Returns None on failure.
+        """
+        try:
+            with open(path, 'rb') as file: return aecSpaceStore.loads(file.read())
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    @staticmethod
+    def loads(data: bytes) -> 'aecSpaceStore':
+        """
+        Returns a new store read from a bytes-like object in the binary format.
+        The coordinates are a read-only view of the delivered buffer rather than a copy.
+        Returns None on failure.
+        """
+        try:
+            table, coords, names = aecSpaceStore.unpack(data)
+            return aecSpaceStore.fromTable(table, coords, names)
+        except Exception:
+            traceback.print_exc()
+            return None
+
+    def save(self, path: str) -> bool:
+        """
+        Writes the store to a file in the binary format.
+        Returns True on success.
+        Returns False on failure.
+        """
+        try:
+            data = self.dumps()
+            if data is None: return False
+            with open(path, 'wb') as file: file.write(data)
+            return True
+        except Exception:
+            traceback.print_exc()
+            return False
+
+    @staticmethod
+    def unpack(data: bytes) -> Tuple[numpy.ndarray, numpy.ndarray, List[str]]:
+        """
+        Returns the metadata table, the (M, 2) coordinates, and the list of names
+        of a bytes-like object in the binary format. The table and coordinates
+        are read-only views of the delivered buffer, so unpacking a memory-mapped
+        file reads only the pages of the records and coordinates used later.
+        Returns None on failure.
+        """
+        try:
+            buffer = memoryview(data)
+            tag, version, _, count, points, names, tableOffset, coordOffset, stringOffset, stringBytes = \
+                aecSpaceStore.__header.unpack_from(buffer, 0)
+            if tag != aecSpaceStore.__tag: raise ValueError('Not an aecSpaceStore buffer')
+            if version > aecSpaceStore.__version: raise ValueError('Unsupported aecSpaceStore version')
+            table = numpy.frombuffer(buffer, dtype = aecSpaceStore.__record, count = count, offset = tableOffset)
+            coords = numpy.frombuffer(buffer, dtype = '<f8', count = points * 2, offset = coordOffset)
+            nameEnds = numpy.frombuffer(buffer, dtype = '<u8', count = names, offset = stringOffset)
+            strings = bytes(buffer[stringOffset + (names * 8):stringOffset + (names * 8) + stringBytes])
+            nameStarts = [0] + [int(end) for end in nameEnds[:-1]]
+            names = [strings[start:int(end)].decode('utf-8') for start, end in zip(nameStarts, nameEnds)]
+            return table, coords.reshape(points, 2), names
+        except Exception:
+            traceback.print_exc()
+            return None
+
+# end class
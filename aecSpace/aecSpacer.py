@@ -1,11 +1,17 @@
+import math
+import numpy
 import traceback
 
-from random import uniform
+from random import getrandbits
+from shapely import affinity as shapelyAffine
 from shapely import geometry as shapely
-from typing import List
+from shapely import contains, get_coordinates, get_parts, polygons, prepare
+from shapely.strtree import STRtree
+from typing import List, NamedTuple, Tuple
 
 from .aecGeometry import aecGeometry
 from .aecPoint import aecPoint
+from .aecProfiler import aecProfiler
 from .aecSpace import aecSpace
 
 """
@@ -17,6 +23,30 @@ class aecSpacer:
 
     __aecGeometry = aecGeometry()
 
+    # Defines the result of packing shapes into a border, listing
+    # whether each shape was placed in the order delivered, and the
+    # fraction of the border area covered by the placed shapes.
+
+    packing = \
+        NamedTuple(
+        'packing',
+        [
+            ('placed', List[bool]),
+            ('fill', float)
+        ])
+
+    # Defines the number of positions drawn by placeWithin from
+    # the region where a shape fits before it falls back to a
+    # point guaranteed to lie inside the region.
+
+    __samples = 8
+
+    # Defines the number of positions tested at once by placeOnLine
+    # along each compass line, and by pack for each shape placed
+    # at random.
+
+    __candidates = 100
+
     def __init__(self):
         """
         aecSpacer Constructor
@@ -27,22 +57,116 @@ class aecSpacer:
         """
         Returns a new aecSpace that is a copy of the delivered aecSpace.
         The copy will be moved by the delivered x, y, and z displacements.
+        The copy shares the validated boundary of the delivered aecSpace
+        until either is changed. See aecSpace.copy.
         Returns None on failure.
         """
         try:
-            spcProps = space.copy_properties
-            newSpace = aecSpace()
-            newSpace.boundary = spcProps['boundary']            
-            newSpace.color = spcProps['color']
-            newSpace.height = spcProps['height']
-            newSpace.level = spcProps['level']
-            newSpace.name = spcProps['name']
-            newSpace.moveBy(x, y, z)
-            return newSpace
+            return space.copy(x, y, z)
         except Exception:
             traceback.print_exc() 
             return None
 
+    def __getFit(self, border, footprint):
+        """
+        Returns the region of positions at which the footprint lies within the border,
+        and the border against which positions in the region are tested. A shape that
+        fits only along a line or at a single point, as one matching the border's width
+        or shape exactly, leaves a region with no area. The border is then grown by a
+        tolerance of 1e-9 of its size and the region found again, so such shapes are
+        placed, overlapping the border by no more than the tolerance.
+        """
+        region = self.__aecGeometry.getInnerFit(border, footprint)
+        if region is None or not region.is_empty: return region, border
+        xMin, yMin, xMax, yMax = border.bounds
+        border = border.buffer(1e-9 * max(xMax - xMin, yMax - yMin), join_style = 'mitre')
+        return self.__aecGeometry.getInnerFit(border, footprint), border
+
+    def __getFree(self, region, footprint, occupied):
+        """
+        Returns the part of the delivered region of positions at which the footprint
+        overlaps none of the occupied area within its reach. Holes in the occupied
+        area too small to hold the footprint are filled first, which cannot change
+        the result, since the footprint could only enter them through the occupied area.
+        """
+        if occupied.is_empty or region.is_empty: return region
+        xMin, yMin, xMax, yMax = region.bounds
+        xLow, yLow, xTop, yTop = footprint.bounds
+        reach = occupied.intersection(shapely.box(xMin + xLow, yMin + yLow, xMax + xTop, yMax + yTop))
+        filled = [shapely.Polygon(part.exterior, [hole for hole in part.interiors
+                                                  if shapely.Polygon(hole).area >= footprint.area])
+                  for part in get_parts(reach) if part.geom_type == 'Polygon']
+        if not filled: return region
+        return region.difference(self.__aecGeometry.getNoFit(shapely.MultiPolygon(filled), footprint))
+
+    def pack(self, border: aecSpace, shapes: List[aecSpace], priorities: List[float] = None, 
+                   compact: bool = True, generator: numpy.random.Generator = None) -> packing:
+        """
+        Places each delivered aecSpace (shape) within the boundary of another (border)
+        without overlapping the shapes already placed, moving the shapes that fit and
+        leaving the rest where they are. Shapes are placed in order of descending
+        priority, then descending area. Each shape is placed within the region where
+        it fits: its inner no-fit polygon within the border, less its no-fit polygon
+        around the area occupied by the shapes already placed.
+
+        If compact is True each shape is placed at the lowest, then leftmost, point
+        of that region, packing the shapes towards the bottom left of the border.
+        Otherwise each shape is placed at the first of a batch of random points of
+        its inner no-fit polygon at which it overlaps no placed shape, checked at once
+        against a spatial index of the placed footprints, or at a random point of the
+        whole region if none is found. Points are drawn from the generator, which may
+        be a numpy random Generator or an integer seed, and is seeded from the random
+        module by default.
+        Returns a packing listing the success of each shape and the fill ratio.
+        Returns None on failure.
+        """
+        try:
+            if priorities is None: priorities = [0] * len(shapes)
+            if len(priorities) != len(shapes): raise ValueError('Need one priority per shape')
+            if not compact: 
+                generator = numpy.random.default_rng(getrandbits(64) if generator is None else generator)
+            order = sorted(range(len(shapes)), key = lambda index: (-priorities[index], -shapes[index].area))
+            placed = [False] * len(shapes)
+            footprints = []
+            occupied = shapely.Polygon()
+            tree = None
+            area = 0.0
+            for index in order:
+                shape = shapes[index]
+                centroid = shape.centroid_floor
+                footprint = shapelyAffine.translate(shape.boundary, -centroid.x, -centroid.y)
+                region = self.__getFit(border.boundary, footprint)[0]
+                if region is None or region.is_empty: continue
+                position = None
+                if not compact:
+                    positions = self.__aecGeometry.getRandomPoints(region, self.__candidates, generator)
+                    clear = numpy.ones(len(positions), dtype = bool)
+                    if footprints and len(positions):
+                        if tree is None: tree = STRtree(footprints)
+                        coords = numpy.asarray(footprint.exterior.coords)[:, :2]
+                        tests = polygons(coords[None, :, :] + positions[:, None, :])
+                        clear[tree.query(tests, predicate = 'intersects')[0]] = False
+                    if clear.any(): position = positions[numpy.flatnonzero(clear)[0]]
+                if position is None:
+                    free = self.__getFree(region, footprint, occupied)
+                    if free.is_empty: continue
+                    positions = None
+                    if not compact: positions = self.__aecGeometry.getRandomPoints(free, 1, generator)
+                    if positions is None or not len(positions):
+                        positions = get_coordinates(free)
+                        positions = positions[numpy.lexsort((positions[:, 0], positions[:, 1]))]
+                    position = positions[0]
+                shape.moveTo(centroid, aecPoint(position[0], position[1], border.level))
+                footprints.append(shape.boundary)
+                occupied = occupied.union(shape.boundary)
+                tree = None
+                area += shape.area
+                placed[index] = True
+            return self.packing(placed = placed, fill = area / border.area)
+        except Exception:
+            traceback.print_exc()
+            return None
+
     def place(self, space: aecSpace, copies: int = 1, 
                     x: float = 0, y: float = 0, z: float = 0) -> bool:
         """
@@ -63,68 +187,79 @@ class aecSpacer:
             traceback.print_exc()
             return None
 
-    def placeOnLine(self, shape: aecSpace, border: aecSpace, orient: List[int]):
+    def placeOnLine(self, shape: aecSpace, border: aecSpace, orient: List[int], 
+                          generator: numpy.random.Generator = None) -> bool:
         """
         Attempts to place one aecSpace (shape) withn the boundary of
         another (border) at a random interior point along a specified line
         from the center of the boundary to the specified compass point on
-        the boundary.
+        the boundary, trying each delivered compass point in turn.
+        All candidate points along a line are tested in one vectorized
+        containment test of the translated shape against the prepared
+        border, and the shape is moved to the first candidate that fits.
+        The generator may be a numpy random Generator or an integer seed.
+        By default it is seeded from the random module.
         Returns True on success.
         Returns False on failure.        
         """
         try:
             if shape.area > border.area: return False
-            tstShape = self.copy(shape)
+            if generator is None: generator = getrandbits(64)
+            generator = numpy.random.default_rng(generator)
+            centroid = shape.centroid_floor
+            footprint = numpy.asarray(shape.boundary.exterior.coords)[:, :2] - centroid.xy_array[:2]
+            boundary = border.boundary
+            prepare(boundary)
             for direction in orient:
                 comLine = border.compassLine(direction)
-                level = border.level
-                within = False
-                x = 0
-                while not within and x < 100:
-                    vector = shapely.LineString([comLine[0].xy, comLine[1].xy])
-                    posit = uniform(0, 100)
-                    point = vector.interpolate(posit, normalized = True)
-                    point = aecPoint(point.x, point.y, level)
-                    tstShape.moveTo(tstShape.centroid_floor, point)
-                    within = border.containsShape(tstShape.points_floor)
-                    x += 1
-                if within: 
-                    shape.moveTo(shape.centroid_floor, point)
-                    return True
+                start = comLine[0].xy_array[:2]
+                vector = comLine[1].xy_array[:2] - start
+                points = start + generator.random((self.__candidates, 1)) * vector
+                fits = contains(boundary, polygons(footprint[None, :, :] + points[:, None, :]))
+                found = numpy.flatnonzero(fits)
+                aecProfiler.count('aecSpacer.placeOnLine attempts', found[0] + 1 if len(found) else len(fits))
+                if not len(found): continue
+                xCoord, yCoord = points[found[0]]
+                shape.moveTo(centroid, aecPoint(xCoord, yCoord, border.level))
+                return True
             return False
         except Exception:
             traceback.print_exc()
             return False        
 
-    def placeWithin(self, shape: aecSpace, border: aecSpace) -> bool:
+    def placeWithin(self, shape: aecSpace, border: aecSpace, 
+                          generator: numpy.random.Generator = None) -> bool:
         """
-        Attempts to place one aecSpace (shape) within the boundary 
-        of another (border) at a random interior point.
+        Places one aecSpace (shape) within the boundary of another (border)
+        at a random position drawn uniformly from all positions where it fits.
+        These are found at once as the inner no-fit polygon of the shape within
+        the border, so a shape that fits is always placed, however thin or
+        concave the border, and a shape that cannot fit is reported without
+        searching. A shape that fits only along a line or at a point is placed
+        within a tolerance of 1e-9 of the border's size. The generator may be a numpy random Generator or an integer
+        seed. By default it is seeded from the random module, so random.seed
+        reproduces placements.
         Returns True on success.
-        Returns False on failure.
+        Returns False if the shape cannot fit within the border.
         """
         try:
             if shape.area > border.area: return False
-            level = border.level
-            xAxis = border.axis_x
-            yAxis = border.axis_y        
-            lowX = xAxis[0].x
-            topX = xAxis[1].x
-            lowY = yAxis[0].y
-            topY = yAxis[1].y
-            within = False
-            x = 0
-            tstShape = self.copy(shape)
-            while not within and x < 100:
-                xCoord = uniform(lowX, topX)
-                yCoord = uniform(lowY, topY)
-                bndPnt = aecPoint(xCoord, yCoord, level)
-                tstShape.moveTo(tstShape.centroid_floor, bndPnt)
-                within = border.boundary.contains(tstShape.boundary)
-                x += 1
-            if not within: return False
-            shape.moveTo(shape.centroid_floor, bndPnt)
-            return True
+            centroid = shape.centroid_floor
+            footprint = shapelyAffine.translate(shape.boundary, -centroid.x, -centroid.y)
+            region, bounds = self.__getFit(border.boundary, footprint)
+            if region is None or region.is_empty: return False
+            if generator is None: generator = getrandbits(64)
+            positions = self.__aecGeometry.getRandomPoints(region, self.__samples, generator)
+            if positions is None: return False
+            positions = list(positions) + [region.representative_point().coords[0]]
+            for attempt, (xCoord, yCoord) in enumerate(positions, 1):
+                tstShape = shapelyAffine.translate(footprint, xCoord, yCoord)
+                if not bounds.contains(tstShape): continue
+                aecProfiler.count('aecSpacer.placeWithin attempts', attempt)
+                shape.moveTo(centroid, aecPoint(xCoord, yCoord, border.level))
+                return True
+            aecProfiler.count('aecSpacer.placeWithin attempts', len(positions))
+            return False
         except Exception:
             traceback.print_exc()
             return False
@@ -160,19 +295,54 @@ class aecSpacer:
             traceback.print_exc()
             return None
 
-    def stackToArea(self, space, area, plenum = 0):
+    def stackToArea(self, space: aecSpace, area: float, plenum: float = 0,
+                          taper: List[Tuple[float, float]] = None, elevations: bool = False) -> List[aecSpace]:
         """
-        Compares the area of the delivered aecSpace to the target area and stacks
-        identical spaces from the original space until the target area is met or
-        exceeded, returning a list of resulting aecSpaces.
-        Returned list does not include the delivered aecSpace.
+        Stacks copies of the delivered aecSpace upward by its height plus the plenum
+        until the combined floor area of the delivered aecSpace and its copies first
+        meets or exceeds the target area, returning a list of resulting aecSpaces.
+        A taper schedule may be delivered as a list of (start, factor) pairs: every
+        floor from the start floor upward is scaled by the factor about the floor
+        centroid of the delivered aecSpace, in addition to the factors of lower starts.
+        Starts are floor indices, counting the delivered aecSpace as floor 0, or the
+        levels floors must reach if elevations is True. Each floor's area follows in
+        closed form as the area of the delivered aecSpace times the square of its
+        combined factor, so the floor count is found before any floor is built, and
+        the floors sharing a factor share one boundary.
+        Returned list does not include the delivered aecSpace, which is not tapered.
         Returns None on failure.
         """
         try:
             spcArea = space.area
             if spcArea >= area: return []
-            copies = int(area / spcArea)
-            return self.stack(space, copies, plenum)
+            step = space.height + plenum
+            segments = [(1, 1.0)]
+            for start, factor in sorted(taper or []):
+                if factor <= 0: raise ValueError('Taper factors must be positive')
+                if elevations: start = math.ceil(((start - space.level) / step) - 1e-9)
+                start = max(1, int(start))
+                if start == segments[-1][0]: segments[-1] = (start, segments[-1][1] * factor)
+                else: segments.append((start, segments[-1][1] * factor))
+            remaining = area - spcArea
+            counts = []
+            for index, (start, factor) in enumerate(segments):
+                flrArea = spcArea * factor * factor
+                if index + 1 < len(segments): count = segments[index + 1][0] - start
+                else: count = math.inf
+                if remaining <= count * flrArea:
+                    counts.append(math.ceil((remaining / flrArea) - 1e-9))
+                    break
+                counts.append(count)
+                remaining -= count * flrArea
+            centroid = numpy.array(space.centroid_floor.xy)
+            coords = space.points_floor.xy_array
+            spaces = []
+            for (start, factor), count in zip(segments, counts):
+                if count < 1: continue
+                floor = space.copy(0, 0, step * start)
+                if factor != 1: floor.setBoundary(((coords - centroid) * factor) + centroid, validate = False)
+                spaces += [floor] + [floor.copy(0, 0, step * index) for index in range(1, count)]
+            return spaces
         except Exception:
             traceback.print_exc()
             return None
@@ -0,0 +1,99 @@
+import numpy
+import pytest
+
+from shapely import affinity
+from shapely import geometry as shapely
+
+from aecSpace.aecGeometry import aecGeometry
+from aecSpace.aecPoint import aecPoint
+from aecSpace.aecShaper import aecShaper
+from aecSpace.aecSpace import aecSpace
+
+geometry = aecGeometry()
+
+concave = \
+[
+    [[0.4, 0.6], [0, 0.2], [-0.2, 0.2], [-0.2, 0], [-1, -0.2], [-0.6, -0.4],
+     [-0.2, -0.2], [-0.2, -0.4], [-0.2, -0.6], [0, -0.2], [0.2, -0.4], [0.2, -0.2]],
+    [[0, 0], [4, 0], [4, 4], [3, 4], [3, 1], [2, 1], [2, 4], [1, 4], [1, 1], [0, 1]],
+    [[0, 0], [1, 0], [2, 0], [2, 1], [1, 1], [1, 2], [0, 2], [0, 1]],
+    [[0, 0], [6, 0], [6, 1], [2, 1], [2, 2], [5, 2], [5, 3], [2, 3], [2, 4], [6, 4], [6, 5], [0, 5]],
+]
+
+def getTriangleArea(coords: list) -> float:
+    """
+    Returns the summed area of the getMesh2D triangles of the coordinates.
+    """
+    mesh = geometry.getMesh2D([aecPoint(x, y) for x, y in coords])
+    vertices = numpy.array(mesh.vertices)[:, :2]
+    corners = vertices[numpy.array(mesh.indices)]
+    edges1 = corners[:, 1] - corners[:, 0]
+    edges2 = corners[:, 2] - corners[:, 0]
+    return 0.5 * numpy.abs((edges1[:, 0] * edges2[:, 1]) - (edges1[:, 1] * edges2[:, 0])).sum()
+
+@pytest.mark.parametrize('coords', concave + [coords[::-1] for coords in concave])
+def test_getMesh2D_concave_area(coords):
+    assert getTriangleArea(coords) == pytest.approx(shapely.Polygon(coords).area)
+
+def test_getMesh2D_cleaned_area():
+    points = geometry.cleanBoundary([aecPoint(x, y) for x, y in concave[0]]).points
+    coords = [(point.x, point.y) for point in points]
+    assert getTriangleArea(coords) == pytest.approx(shapely.Polygon(concave[0]).area)
+
+def test_getMesh2D_random_area():
+    generator = numpy.random.default_rng(0)
+    for attempt in range(500):
+        coords = generator.integers(-5, 5, (generator.integers(4, 16), 2)) / 5
+        polygon = shapely.Polygon(coords)
+        if not polygon.is_valid or polygon.area == 0: continue
+        assert getTriangleArea(coords.tolist()) == pytest.approx(polygon.area)
+
+def test_getMesh2D_shaper_area():
+    shaper = aecShaper()
+    for points in (shaper.makeCross(), shaper.makeH(), shaper.makeU(), shaper.makeCylinder(radius = 10)):
+        coords = [(point.x, point.y) for point in points]
+        assert getTriangleArea(coords) == pytest.approx(shapely.Polygon(coords).area)
+
+@pytest.mark.parametrize('coords', concave)
+def test_getMeshPrism_side_normals_outward(coords):
+    polygon = shapely.polygon.orient(shapely.Polygon(coords))
+    points = [aecPoint(x, y) for x, y in polygon.exterior.coords[:-1]]
+    mesh = geometry.getMeshPrism(points, geometry.getMesh2D(points).indices, 0, 1, numpy.float64)
+    sides = mesh.vertices[len(points) * 2:].reshape(-1, 4, 3)
+    normals = mesh.normals[len(points) * 2:].reshape(-1, 4, 3)[:, 0]
+    for side, normal in zip(sides, normals):
+        center = side.mean(axis = 0)
+        assert not polygon.contains(shapely.Point(center[:2] + (normal[:2] * 1e-3)))
+        assert polygon.contains(shapely.Point(center[:2] - (normal[:2] * 1e-3)))
+    corners = mesh.vertices[mesh.indices]
+    windings = numpy.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    windings /= numpy.linalg.norm(windings, axis = 1)[:, None]
+    assert numpy.allclose(windings, mesh.normals[mesh.indices[:, 0]])
+    space = aecSpace()
+    space.boundary = points
+    prism = space.mesh_arrays
+    sideNormals = prism.normals[len(space.points_floor) * 2:].reshape(-1, 4, 3)[:, 0]
+    assert numpy.allclose(space.normal_sides, sideNormals)
+    assert numpy.allclose([side.normals[0] for side in space.mesh_sides], sideNormals)
+    assert numpy.allclose(numpy.array(space.mesh.normals)[len(space.points_floor) * 2::4], sideNormals)
+
+def makeComb(teeth: int) -> shapely.Polygon:
+    """
+    Returns a concave comb polygon with the delivered number of teeth.
+    """
+    coords = [(0, 0), ((teeth * 2) + 1, 0)]
+    for tooth in range(teeth, -1, -1):
+        coords += [((tooth * 2) + 1, 4), (tooth * 2, 4)]
+        if tooth: coords += [(tooth * 2, 1), ((tooth * 2) - 1, 1)]
+    return shapely.Polygon(coords)
+
+@pytest.mark.parametrize('shape', [makeComb(5), shapely.Polygon(concave[0]), shapely.Polygon(concave[3])])
+def test_getNoFit_matches_overlap(shape):
+    obstacle = shapely.Polygon([(0, 0), (3, 0), (3, 1), (1, 1), (1, 3), (0, 3)])
+    noFit = geometry.getNoFit(obstacle, shape)
+    generator = numpy.random.default_rng(0)
+    xMin, yMin, xMax, yMax = noFit.buffer(1).bounds
+    for x, y in generator.uniform((xMin, yMin), (xMax, yMax), (300, 2)):
+        if noFit.boundary.distance(shapely.Point(x, y)) < 1e-6: continue
+        overlap = affinity.translate(shape, x, y).intersection(obstacle).area > 1e-9
+        assert noFit.contains(shapely.Point(x, y)) == overlap
@@ -0,0 +1,55 @@
+import numpy
+import pytest
+
+from aecSpace.aecPoint import aecPoint
+from aecSpace.aecPointArray import aecPointArray
+
+@pytest.mark.parametrize('points',
+[
+    [aecPoint(0, 1), aecPoint(2, 3, 4)],
+    [(0, 1, 0), (2, 3, 4)],
+    numpy.array([[0, 1, 0], [2, 3, 4]]),
+])
+def test_construction(points):
+    array = aecPointArray(points)
+    assert len(array) == 2
+    assert array.xyz == [(0, 1, 0), (2, 3, 4)]
+    assert array.xy == [(0, 1), (2, 3)]
+    assert array.x.tolist() == [0, 2]
+    assert array.y.tolist() == [1, 3]
+    assert array.z.tolist() == [0, 4]
+
+def test_construction_2D():
+    array = aecPointArray([(0, 1), (2, 3)])
+    assert array.xyz_array.tolist() == [[0, 1, 0], [2, 3, 0]]
+    assert len(aecPointArray()) == 0
+    with pytest.raises(ValueError): aecPointArray([(0, 1, 2, 3)])
+
+def test_construction_copies():
+    coords = numpy.array([[0.0, 1.0, 0.0], [2.0, 3.0, 4.0]])
+    array = aecPointArray(coords)
+    coords[0, 0] = 9
+    assert array[0].x == 0
+    copy = array.copy()
+    copy.moveBy(x = 1)
+    assert array[0].x == 0 and copy[0].x == 1
+
+def test_indexing():
+    array = aecPointArray([(0, 1), (2, 3), (4, 5)])
+    point = array[1]
+    assert isinstance(point, aecPoint)
+    assert point.xyz == (2, 3, 0)
+    assert array[-1].xy == (4, 5)
+    assert isinstance(array[1:], aecPointArray)
+    assert array[1:].xy == [(2, 3), (4, 5)]
+    assert [point.xy for point in array] == array.xy
+
+def test_setting():
+    array = aecPointArray([(0, 1), (2, 3)])
+    array[0] = aecPoint(5, 6, 7)
+    array[1] = (8, 9)
+    assert array.xyz == [(5, 6, 7), (8, 9, 0)]
+    array.z = 2
+    assert array.z.tolist() == [2, 2]
+    assert array.moveBy(1, 2, 3)
+    assert array.xyz == [(6, 8, 5), (9, 11, 5)]
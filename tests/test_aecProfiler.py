@@ -0,0 +1,43 @@
+import shapely
+
+from shapely.geometry.base import BaseGeometry
+
+from aecSpace.aecProfiler import aecProfiler
+from aecSpace.aecShaper import aecShaper
+from aecSpace.aecSpace import aecSpace
+from aecSpace.aecSpacer import aecSpacer
+
+def makeSpace(xSize: float, ySize: float) -> aecSpace:
+    """
+    Returns a space with a box boundary of the delivered size.
+    """
+    space = aecSpace()
+    space.boundary = aecShaper().makeBox(xSize = xSize, ySize = ySize)
+    return space
+
+def test_placeOnLine_predicates():
+    with aecProfiler() as profiler:
+        assert aecSpacer().placeOnLine(makeSpace(5, 5), makeSpace(100, 100), [0, 2], generator = 1)
+    assert profiler.timings['shapely.contains'].calls > 0
+
+def test_pack_predicates():
+    shapes = [makeSpace(5, 5) for index in range(20)]
+    with aecProfiler() as profiler:
+        packing = aecSpacer().pack(makeSpace(100, 100), shapes, compact = False, generator = 2)
+    assert all(packing.placed)
+    assert profiler.timings['STRtree.query'].calls > 0
+
+def test_predicates_counted_once(monkeypatch):
+    monkeypatch.setattr(BaseGeometry, 'contains', lambda self, other: bool(shapely.contains(self, other)))
+    with aecProfiler() as profiler:
+        shapely.Point(0, 0).buffer(1).contains(shapely.Point(0, 0))
+    timings = profiler.timings
+    assert timings['BaseGeometry.contains'].calls == 1
+    assert 'shapely.contains' not in timings
+
+def test_restores_functions():
+    import aecSpace.aecSpacer as module
+    functions = (shapely.contains, module.contains, BaseGeometry.intersects, aecSpacer.pack)
+    with aecProfiler():
+        assert module.contains is not functions[1]
+    assert (shapely.contains, module.contains, BaseGeometry.intersects, aecSpacer.pack) == functions
@@ -0,0 +1,28 @@
+import pytest
+
+from aecSpace.aecSpace import aecSpace
+from aecSpace.aecSpaceClash import aecSpaceClash
+from aecSpace.aecSpaceGroup import aecSpaceGroup
+
+def makeSpaces() -> list:
+    """
+    Returns three unit spaces, the first two overlapping by half their volume.
+    """
+    spaces = [aecSpace(), aecSpace(), aecSpace()]
+    spaces[1].moveBy(x = 0.5)
+    spaces[2].moveBy(x = 5)
+    return spaces
+
+@pytest.mark.parametrize('convert', [list, tuple, iter, lambda spaces: (space for space in spaces)])
+def test_getClashes_iterables(convert):
+    spaces = makeSpaces()
+    clashes = aecSpaceClash().getClashes(convert(spaces))
+    assert [(clash.index1, clash.index2) for clash in clashes] == [(0, 1)]
+    assert clashes[0].space1 is spaces[0]
+    assert clashes[0].volume == pytest.approx(0.5)
+
+def test_getClashes_group():
+    group = aecSpaceGroup()
+    group.add(makeSpaces())
+    clashes = aecSpaceClash().getClashes(group)
+    assert [(clash.index1, clash.index2) for clash in clashes] == [(0, 1)]
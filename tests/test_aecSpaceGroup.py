@@ -0,0 +1,98 @@
+import numpy
+import pytest
+
+from shapely import geometry as shapely
+
+from aecSpace.aecPoint import aecPoint
+from aecSpace.aecShaper import aecShaper
+from aecSpace.aecSpace import aecSpace
+from aecSpace.aecSpaceGroup import aecSpaceGroup
+from aecSpace.aecSpacer import aecSpacer
+
+shaper = aecShaper()
+
+def test_moveBy_vertical_keeps_boundaries():
+    space = aecSpace()
+    space.boundary = shaper.makeCross()
+    group = aecSpaceGroup()
+    group.add([space] + aecSpacer().stack(space, 9))
+    boundaries = [space.boundary for space in group.spaces]
+    levels = [space.level for space in group.spaces]
+    assert group.moveBy(z = 3)
+    assert all(space.boundary is boundary for space, boundary in zip(group.spaces, boundaries))
+    assert [space.level for space in group.spaces] == pytest.approx([level + 3 for level in levels])
+    assert sorted(group.aggregate_level) == pytest.approx(sorted(level + 3 for level in levels))
+
+def makeGroup(count: int = 40) -> aecSpaceGroup:
+    """
+    Returns a group of overlapping spaces with varied boundaries, levels, heights, and names.
+    """
+    generator = numpy.random.default_rng(1)
+    makers = [shaper.makeBox, shaper.makeCross, shaper.makeL]
+    spaces = []
+    for index in range(count):
+        space = aecSpace()
+        space.boundary = makers[index % len(makers)](aecPoint(*generator.uniform(0, 60, 2)), 
+                                                     *generator.uniform(5, 20, 2))
+        space.level = float(generator.integers(0, 4) * 3)
+        space.height = float(generator.uniform(2, 4))
+        space.name = 'space {}'.format(index % 3)
+        spaces.append(space)
+    group = aecSpaceGroup()
+    group.add(spaces)
+    return group
+
+def assertAggregates(group: aecSpaceGroup):
+    """
+    Asserts that the group totals and breakdowns match sums over its spaces.
+    """
+    spaces = group.spaces
+    assert group.area == pytest.approx(sum(space.area for space in spaces))
+    assert group.volume == pytest.approx(sum(space.volume for space in spaces))
+    for key, aggregates in (('level', group.aggregate_level), ('name', group.aggregate_name)):
+        members = {}
+        for space in spaces: members.setdefault(getattr(space, key), []).append(space)
+        assert {value: (len(matched), pytest.approx(sum(space.area for space in matched)),
+                        pytest.approx(sum(space.volume for space in matched)))
+                for value, matched in members.items()} == \
+               {value: tuple(aggregate) for value, aggregate in aggregates.items()}
+
+def test_aggregates():
+    group = makeGroup()
+    assertAggregates(group)
+    extra = aecSpace()
+    extra.level = 30
+    group.add([extra])
+    assertAggregates(group)
+    assert group.delete(3)
+    assert group.delete(-1)
+    assertAggregates(group)
+    assert group.moveBy(x = 2, y = -1, z = 3)
+    assertAggregates(group)
+    assert group.moveBy(z = -3)
+    assertAggregates(group)
+    assert group.setLevel(6, index = 2)
+    assert group.setHeight(5)
+    assert group.setName('renamed', index = 4)
+    assertAggregates(group)
+    assert group.scale(2, 0.5)
+    assertAggregates(group)
+
+@pytest.mark.parametrize('indexing', [True, False])
+def test_queries(indexing, monkeypatch):
+    monkeypatch.setattr(aecSpaceGroup, 'indexing', indexing)
+    group = makeGroup()
+    spaces = group.spaces
+    generator = numpy.random.default_rng(2)
+    for x, y, z in generator.uniform((-10, -10, 0), (90, 90, 12), (200, 3)):
+        point = shapely.Point(x, y)
+        found = group.spacesAt(aecPoint(x, y, z))
+        expected = [space for space in spaces 
+                    if space.boundary.covers(point) and space.level <= z <= space.level + space.height]
+        assert sorted(map(id, found)) == sorted(map(id, expected))
+        nearest = group.nearest(aecPoint(x, y, z))
+        assert nearest.boundary.distance(point) == \
+               pytest.approx(min(space.boundary.distance(point) for space in spaces))
+    assert group.moveBy(x = 100)
+    found = group.spacesAt(aecPoint(spaces[0].centroid_floor.x, spaces[0].centroid_floor.y, spaces[0].level))
+    assert any(space is spaces[0] for space in found)
@@ -0,0 +1,103 @@
+import numpy
+import pytest
+
+from shapely import geometry as shapely
+
+from aecSpace.aecPoint import aecPoint
+from aecSpace.aecShaper import aecShaper
+from aecSpace.aecSpace import aecSpace
+from aecSpace.aecSpaceArchive import aecSpaceArchive
+from aecSpace.aecSpaceGroup import aecSpaceGroup
+from aecSpace.aecSpaceStore import aecSpaceStore
+
+@pytest.mark.parametrize('convert', [list, tuple, iter, lambda spaces: (space for space in spaces)])
+def test_add_iterables(convert):
+    spaces = [aecSpace(), aecSpace()]
+    spaces[1].level = 3
+    store = aecSpaceStore()
+    assert store.add(convert(spaces))
+    assert [space.level for space in store.getSpaces()] == [0, 3]
+
+def test_add_group():
+    group = aecSpaceGroup()
+    group.add([aecSpace(), aecSpace()])
+    assert len(aecSpaceStore(group)) == 2
+
+def makeSpaces(count: int = 30) -> list:
+    """
+    Returns spaces with varied boundaries, levels, heights, colors, names, and addresses.
+    """
+    generator = numpy.random.default_rng(0)
+    shaper = aecShaper()
+    makers = [shaper.makeBox, shaper.makeCross, shaper.makeL, shaper.makeU]
+    spaces = []
+    for index in range(count):
+        origin = aecPoint(*generator.uniform(-100, 100, 2))
+        space = aecSpace()
+        space.boundary = makers[index % len(makers)](origin, *generator.uniform(5, 20, 2))
+        space.level = float(generator.integers(0, 10) * 3)
+        space.height = float(generator.uniform(2, 5))
+        space.color = tuple(int(value) for value in generator.integers(0, 256, 3))
+        space.color.alpha = int(generator.integers(0, 256))
+        space.name = 'space {}'.format(index % 7)
+        space.address = (index, index % 3, 0)
+        spaces.append(space)
+    return spaces
+
+def assertSame(spaces: list, copies: list):
+    """
+    Asserts that the copies match the spaces in every stored property.
+    """
+    assert len(copies) == len(spaces)
+    for space, copy in zip(spaces, copies):
+        assert numpy.array_equal(copy.points_floor.xy_array, space.points_floor.xy_array)
+        assert copy.boundary.equals(space.boundary)
+        assert copy.convex == space.convex
+        assert copy.level == space.level
+        assert copy.height == space.height
+        assert tuple(copy.color.color) == tuple(space.color.color)
+        assert copy.color.alpha == space.color.alpha
+        assert copy.name == space.name
+        assert tuple(copy.address) == tuple(space.address)
+
+def test_round_trip_dumps():
+    spaces = makeSpaces()
+    assertSame(spaces, aecSpaceStore.loads(aecSpaceStore(spaces).dumps()).getSpaces())
+    assertSame(spaces[:1], [aecSpace.loads(spaces[0].dumps())])
+
+def test_round_trip_save(tmp_path):
+    spaces = makeSpaces()
+    path = str(tmp_path / 'spaces.aec')
+    assert aecSpaceStore(spaces).save(path)
+    assertSame(spaces, aecSpaceStore.load(path).getSpaces())
+    group = aecSpaceGroup()
+    group.add(spaces)
+    assert group.save(path)
+    assertSame(spaces, aecSpaceGroup.load(path).spaces)
+    assertSame(spaces, aecSpaceGroup.loads(group.dumps()).spaces)
+
+def test_archive(tmp_path):
+    spaces = makeSpaces()
+    path = str(tmp_path / 'spaces.aec')
+    assert aecSpaceStore(spaces).save(path)
+    with aecSpaceArchive(path) as archive:
+        assert len(archive) == len(spaces)
+        assertSame(spaces, archive.getSpaces(range(len(spaces))))
+        assertSame(spaces[3:4], [archive.getSpace(3)])
+        found = archive.query(level = 6, elevation = 12)
+        assert found.tolist() == [index for index, space in enumerate(spaces) 
+                                  if space.level + space.height >= 6 and space.level <= 12]
+        found = archive.query(name = 'space 2', bounds = (-50, -50, 50, 50))
+        assert found.tolist() == [index for index, space in enumerate(spaces) 
+                                  if space.name == 'space 2' and 
+                                  space.boundary.intersects(shapely.box(-50, -50, 50, 50))]
+        assert archive.query(name = 'missing').tolist() == []
+
+def test_totals():
+    spaces = makeSpaces()
+    store = aecSpaceStore(spaces)
+    assert store.count == len(spaces)
+    assert store.area == pytest.approx(sum(space.area for space in spaces))
+    assert store.volume == pytest.approx(sum(space.volume for space in spaces))
+    assert store.areas == pytest.approx([space.area for space in spaces])
+    assert store.levels.tolist() == [space.level for space in spaces]
@@ -0,0 +1,89 @@
+import itertools
+import numpy
+import pytest
+
+from aecSpace.aecPoint import aecPoint
+from aecSpace.aecShaper import aecShaper
+from aecSpace.aecSpace import aecSpace
+from aecSpace.aecSpacer import aecSpacer
+
+shaper = aecShaper()
+spacer = aecSpacer()
+
+def makeSpace(points) -> aecSpace:
+    """
+    Returns a space with the delivered boundary points.
+    """
+    space = aecSpace()
+    space.boundary = points
+    return space
+
+exact = \
+[
+    (shaper.makeBox(xSize = 10, ySize = 10), shaper.makeBox(aecPoint(50, 50), xSize = 10, ySize = 4)),
+    (shaper.makeBox(xSize = 10, ySize = 10), shaper.makeBox(aecPoint(50, 50), xSize = 10, ySize = 10)),
+    (shaper.makeCylinder(radius = 5), shaper.makeCylinder(aecPoint(30, 30), radius = 5)),
+    ([aecPoint(0, 0), aecPoint(7, 0), aecPoint(3, 5)], [aecPoint(20, 0), aecPoint(27, 0), aecPoint(23, 5)]),
+]
+
+@pytest.mark.parametrize('border, shape', exact)
+def test_placeWithin_exact_fit(border, shape):
+    border = makeSpace(border)
+    shape = makeSpace(shape)
+    assert spacer.placeWithin(shape, border, generator = 1)
+    assert shape.boundary.difference(border.boundary).area < 1e-6
+
+@pytest.mark.parametrize('compact', [True, False])
+@pytest.mark.parametrize('border, shape', exact)
+def test_pack_exact_fit(border, shape, compact):
+    border = makeSpace(border)
+    shape = makeSpace(shape)
+    assert spacer.pack(border, [shape], compact = compact, generator = 1).placed == [True]
+    assert shape.boundary.difference(border.boundary).area < 1e-6
+
+def test_placeWithin_too_wide():
+    border = makeSpace(shaper.makeBox(xSize = 10, ySize = 10))
+    shape = makeSpace(shaper.makeBox(aecPoint(50, 50), xSize = 10.001, ySize = 4))
+    assert not spacer.placeWithin(shape, border, generator = 1)
+    assert shape.boundary.bounds[0] == pytest.approx(50)
+
+@pytest.mark.parametrize('compact', [True, False])
+def test_pack(compact):
+    generator = numpy.random.default_rng(3)
+    border = makeSpace(shaper.makeCross(aecPoint(0, 0), 120, 120))
+    makers = [shaper.makeBox, shaper.makeL]
+    shapes = [makeSpace(makers[index % 2](aecPoint(500, 500), *generator.uniform(8, 20, 2))) 
+              for index in range(40)]
+    result = spacer.pack(border, shapes, compact = compact, generator = 4)
+    placed = [shape for shape, success in zip(shapes, result.placed) if success]
+    assert len(placed) > 20
+    assert result.fill == pytest.approx(sum(shape.area for shape in placed) / border.area)
+    for shape in placed: assert border.boundary.buffer(1e-6).contains(shape.boundary)
+    for shape1, shape2 in itertools.combinations(placed, 2):
+        assert shape1.boundary.intersection(shape2.boundary).area < 1e-6
+    for shape, success in zip(shapes, result.placed):
+        if not success: assert shape.boundary.bounds[0] > 400
+
+def test_pack_priorities():
+    border = makeSpace(shaper.makeBox(xSize = 10, ySize = 10))
+    shapes = [makeSpace(shaper.makeBox(aecPoint(50, 50), xSize = 8, ySize = 8)) for index in range(3)]
+    assert spacer.pack(border, shapes, priorities = [0, 2, 1]).placed == [False, True, False]
+
+@pytest.mark.parametrize('elevations', [False, True])
+def test_stackToArea_taper(elevations):
+    space = makeSpace(shaper.makeBox(xSize = 10, ySize = 10))
+    space.height = 3
+    taper = [(12, 0.5), (6, 0.8)] if elevations else [(2, 0.8), (4, 0.5)]
+    floors = spacer.stackToArea(space, 1000, taper = taper, elevations = elevations)
+    factors = [1.0] + [1.0] + [0.8] * 2 + [0.4] * (len(floors) - 3)
+    areas = [space.area] + [floor.area for floor in floors]
+    assert areas == pytest.approx([100 * factor * factor for factor in factors])
+    assert [floor.level for floor in floors] == pytest.approx([3 * index for index in range(1, len(floors) + 1)])
+    assert sum(areas) >= 1000 > sum(areas[:-1])
+    centroid = space.centroid_floor
+    for floor in floors: assert floor.centroid_floor.xy == pytest.approx(centroid.xy)
+
+def test_stackToArea_exact():
+    space = makeSpace(shaper.makeBox(xSize = 10, ySize = 10))
+    assert len(spacer.stackToArea(space, 500)) == 4
+    assert spacer.stackToArea(space, 50) == []